@@ -0,0 +1,77 @@
+"""
+Instahyre fetch+apply throughput against the local Instahyre stand-in.
+
+Needs no network or account. The ledger and session vaults go to a
+temporary directory, so real run history is left alone. Each mode gets its
+own vault, so every mode pays for its own login.
+
+    python -m benchmarks.instahyre_throughput --jobs 90 --latency 0.2 --rpm 600
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp(prefix="instahyre_bench_")
+os.environ["LEDGER_DB"] = os.path.join(_tmp, "ledger.sqlite3")
+os.environ["SESSION_VAULT_FILE"] = os.path.join(_tmp, "session_vault.bin")
+os.environ["SESSION_VAULT_KEY_FILE"] = os.path.join(_tmp, "session_vault.key")
+
+from src.Instahyre.instahyre import InstahyreApplicationBot  # noqa: E402
+from src.Instahyre.instahyre_stub import InstahyreStubServer, make_jobs  # noqa: E402
+from src.meta.session_vault import session_vault  # noqa: E402
+
+
+def run_mode(jobs, latency, fetch_workers, apply_workers, rpm, vault_path):
+    # A session saved by the previous mode would spare this one its login
+    session_vault.path = vault_path
+    with InstahyreStubServer(jobs=jobs, latency=latency) as server:
+        # BASE_URL and the pool sizes are class attributes read at import
+        bot_class = type("BenchmarkBot", (InstahyreApplicationBot,), {
+            "BASE_URL": server.url,
+            "APPLY_URL": f"{server.url}/candidate_opportunity/apply",
+            "OPPORTUNITY_URL": f"{server.url}/candidate_opportunity",
+            "FETCH_WORKERS": fetch_workers,
+            "APPLY_WORKERS": apply_workers,
+            "APPLY_RPM": rpm,
+            "MAX_APPLIES": len(jobs),
+        })
+        start = time.perf_counter()
+        bot_class("bench@example.com", "password").run()
+        elapsed = time.perf_counter() - start
+        return {"seconds": elapsed, "applied": len(server.applied),
+                "per_s": len(server.applied) / elapsed, "requests": dict(server.requests)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=90)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--fetch-workers", type=int, default=4)
+    parser.add_argument("--apply-workers", type=int, default=4)
+    parser.add_argument("--rpm", type=int, default=600)
+    args = parser.parse_args()
+
+    # per-job log lines would drown the table
+    logging.getLogger("instahyre").setLevel(logging.WARNING)
+
+    modes = [
+        ("serial", 1, 1),
+        (f"{args.fetch_workers} fetch / {args.apply_workers} apply workers",
+         args.fetch_workers, args.apply_workers),
+    ]
+    print(f"{args.jobs} opportunities, stand-in latency {args.latency}s, "
+          f"{args.rpm} applies/min allowed\n")
+    print(f"{'mode':<30}{'total s':>9}{'applied':>9}{'applies/s':>11}  requests")
+    for index, (name, fetch_workers, apply_workers) in enumerate(modes):
+        # Fresh ids per mode, so the ledger does not skip the second run's jobs
+        jobs = [dict(job, id=job["id"] + index * 1000000) for job in make_jobs(args.jobs, seed=7)]
+        result = run_mode(jobs, args.latency, fetch_workers, apply_workers, args.rpm,
+                          os.path.join(_tmp, f"session_vault_{index}.bin"))
+        print(f"{name:<30}{result['seconds']:>9.2f}{result['applied']:>9}"
+              f"{result['per_s']:>11.2f}  {result['requests']}")
+
+
+if __name__ == "__main__":
+    main()
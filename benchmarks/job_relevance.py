@@ -0,0 +1,77 @@
+"""
+Naukri job relevance scoring over recorded search results.
+
+Record a run's jobs with NAUKRI_RECORD_JOBS=jobs.json, then:
+
+    python -m benchmarks.job_relevance --jobs-file jobs.json --thresholds 0.2,0.3,0.4,0.5
+
+Without --jobs-file, jobs are generated by the Naukri stub. Skills and
+experience come from the configured resume unless --skills/--years are given.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from src.Naukri.naukri_stub import make_jobs
+from src.Naukri.relevance import JobScorer
+
+
+def load_scorer(args):
+    if args.skills:
+        facts = {"skills": [skill.strip() for skill in args.skills.split(",")],
+                 "total_years": args.years}
+        return JobScorer.from_env(facts)
+    from src.meta.get_resume_text import get_resume
+    resume = get_resume()
+    scorer = JobScorer.from_env(resume["facts"], resume["text"])
+    if args.years is not None:
+        scorer.years = args.years
+    return scorer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs-file", help="JSON list of Naukri jobDetails entries")
+    parser.add_argument("--count", type=int, default=1000, help="generated jobs without --jobs-file")
+    parser.add_argument("--skills", help="comma separated skills instead of the resume's")
+    parser.add_argument("--years", type=float, default=None)
+    parser.add_argument("--thresholds", default="0.2,0.3,0.4,0.5,0.6,0.7")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.jobs_file:
+        with open(args.jobs_file, encoding="utf-8") as file:
+            jobs = json.load(file)
+    else:
+        jobs = make_jobs(args.count, seed=7)
+    scorer = load_scorer(args)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        scores = scorer.scores(jobs)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print(f"{len(jobs)} jobs scored in {best * 1000:.1f} ms "
+          f"({best / max(1, len(jobs)) * 1e6:.1f} µs/job, best of {args.repeat})")
+
+    totals = scores[:, 0]
+    print(f"score mean {totals.mean():.2f}, p50 {np.median(totals):.2f}, max {totals.max():.2f}")
+    print(f"\n{'threshold':>9}  {'kept':>6}  {'share':>6}")
+    for threshold in (float(value) for value in args.thresholds.split(",")):
+        kept = int((totals >= threshold).sum())
+        print(f"{threshold:>9.2f}  {kept:>6}  {kept / max(1, len(jobs)):>6.0%}")
+
+    print(f"\nTop {args.top}: total / skills / title / experience")
+    for index in np.argsort(-totals, kind="stable")[:args.top]:
+        job = jobs[index]
+        total, skills, title, experience = scores[index]
+        print(f"{total:.2f} / {skills:.2f} / {title:.0f} / {experience:.2f}  "
+              f"{job.get('title')} @ {job.get('companyName')} [{job.get('tagsAndSkills')}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+End-to-end Naukri questionnaire throughput against the local LLM stand-in.
+
+Needs no network and no API key. The usual profile settings from .env are
+still read when src.meta.askAI is imported; the resume is UPLOAD_RESUME if
+it points at a file, otherwise a built-in sample resume.
+
+    python -m benchmarks.questionnaire_throughput --jobs 20 --questions 6 --latency 0.5
+"""
+import argparse
+import logging
+import os
+import statistics
+import time
+
+os.environ.setdefault("GENDER", "Male")
+os.environ.setdefault("NOTICE_PERIOD", "30 days")
+os.environ.setdefault("CURRENT_CTC", "1000000")
+os.environ.setdefault("EXPECTED_CTC", "1500000")
+
+from src.meta.askAI import AI_Agent  # noqa: E402
+from src.meta.llm_backends import StandInBackend  # noqa: E402
+from src.meta.llm_standin import StandInLLMServer  # noqa: E402
+from src.meta.profile_rules import ProfileRuleEngine, profile_rules  # noqa: E402
+from src.meta.rate_limiter import RateLimiter  # noqa: E402
+from src.meta.resume_facts import build_fact_sheet  # noqa: E402
+
+SKILLS = ["Python", "Django", "AWS", "SQL", "Kafka", "React", "Docker", "Kubernetes"]
+
+
+# Only some of SKILLS, so the other skill questions still go to the LLM
+SAMPLE_RESUME = """Alex Doe
+Backend engineer building Python services.
+
+Skills
+Python, Django, AWS
+
+Experience
+Acme Technologies | Jan 2019 - Present
+- Built Django services on AWS
+Beta Labs | Jun 2017 - Dec 2018
+- Wrote Python APIs
+
+Education
+B.Tech, Computer Science
+"""
+
+
+def load_resume():
+    """The configured resume PDF if there is one, else SAMPLE_RESUME."""
+    path = os.getenv("UPLOAD_RESUME")
+    if path and os.path.isfile(path):
+        return None  # AI_Agent reads UPLOAD_RESUME itself
+    return {"text": SAMPLE_RESUME, "facts": build_fact_sheet(SAMPLE_RESUME)}
+
+
+def make_questionnaires(jobs, questions):
+    """Naukri-shaped questionnaires mixing free-text and option questions."""
+    result = []
+    for job in range(jobs):
+        questionnaire = []
+        for index in range(questions):
+            question_id = f"{job}_{index}"
+            skill = SKILLS[(job + index) % len(SKILLS)]
+            if index % 3 == 2:
+                questionnaire.append({
+                    "questionId": question_id,
+                    "questionName": f"Are you comfortable working with {skill}?",
+                    "answerOption": {"1": "Yes", "2": "No"},
+                })
+            else:
+                questionnaire.append({
+                    "questionId": question_id,
+                    "questionName": f"How many years of experience do you have in {skill}?",
+                })
+        result.append(questionnaire)
+    return result
+
+
+def run_mode(server, questionnaires, batched, concurrency, rpm, logger, resume=None):
+    # The profile rules read skill years from the same resume as the prompts
+    rules = ProfileRuleEngine(profile_rules.profile, facts=resume["facts"]) if resume else profile_rules
+    agent = AI_Agent(backend=StandInBackend(api_url=server.url),
+                     limiter=RateLimiter(rpm), max_concurrency=concurrency, cache=None,
+                     rules=rules, resume=resume)
+    requests_before = server.requests
+    latencies = []
+    answered = 0
+
+    start = time.perf_counter()
+    for questionnaire in questionnaires:
+        job_start = time.perf_counter()
+        response = agent.create_questionnaires_response(questionnaire, logger, batched=batched)
+        latencies.append(time.perf_counter() - job_start)
+        answered += len(response)
+    elapsed = time.perf_counter() - start
+    agent.close()
+
+    latencies.sort()
+    return {
+        "seconds": elapsed,
+        "questionnaires_per_s": len(questionnaires) / elapsed,
+        "llm_requests": server.requests - requests_before,
+        "answered": answered,
+        "p50": statistics.median(latencies),
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rpm", type=int, default=6000)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    # per-call latency lines would drown the table
+    logging.getLogger("askAI").setLevel(logging.WARNING)
+
+    questionnaires = make_questionnaires(args.jobs, args.questions)
+    resume = load_resume()
+    modes = [
+        ("per-question, serial", False, 1),
+        (f"per-question, concurrency {args.concurrency}", False, args.concurrency),
+        ("batched", True, args.concurrency),
+    ]
+
+    with StandInLLMServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          throttle_rate=args.throttle_rate, retry_after=1, seed=7) as server:
+        print(f"{args.jobs} questionnaires x {args.questions} questions, "
+              f"stand-in latency {args.latency}s (+{args.jitter}s jitter)\n")
+        print(f"{'mode':<28}{'total s':>9}{'q/s':>8}{'LLM calls':>11}{'answered':>10}{'p50 s':>8}{'p95 s':>8}")
+        for name, batched, concurrency in modes:
+            result = run_mode(server, questionnaires, batched, concurrency, args.rpm, logger,
+                              resume)
+            print(f"{name:<28}{result['seconds']:>9.2f}{result['questionnaires_per_s']:>8.2f}"
+                  f"{result['llm_requests']:>11}{result['answered']:>10}"
+                  f"{result['p50']:>8.2f}{result['p95']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
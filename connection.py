@@ -1,3 +1,11 @@
-from connections.connect import main as LinkedInConnectionBot
+from src.meta.logger import get_logger
+from src.meta.startup import StartupTimer
+
+startup = StartupTimer("connection")
+
+with startup.phase("import connection bot"):
+    from connections.connect import main as LinkedInConnectionBot
+
+startup.report(get_logger("connection"))
 
 LinkedInConnectionBot()
\ No newline at end of file
@@ -19,7 +19,8 @@ from selenium import webdriver
 import webdriver_manager.chrome as ChromeDriverManager
 
 from src.meta.logger import get_logger
-from src.meta.askAI import ai_agent
+from src.meta.askAI import get_ai_agent
+from src.meta.telemetry import telemetry
 from connections.connection_check import connection_monitor
 
 ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
@@ -80,7 +81,6 @@ class LinkedinConnectionBot:
         self.job_title = job_title
         self.location = location
         self.linkedin = None
-        self.ai_agent = ai_agent
         self.options = self.browser_options()
         self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
         self.browser_initialized = False
@@ -176,7 +176,8 @@ class LinkedinConnectionBot:
                 add_note_button = self.browser.find_element(*self.locator["add_note_button"])
                 add_note_button.click()
                 time.sleep(2)
-                message = self.ai_agent.create_message(self.user_first_name, person_info, log)
+                with telemetry.context(portal="linkedin_connect", job_id=self.user_first_name):
+                    message = get_ai_agent().create_message(self.user_first_name, person_info, log)
                 message = message[:self.MAX_CHARACTER_COUNT]
                 self.browser.find_element(*self.locator["add_message"]).send_keys(message)
                 time.sleep(20)
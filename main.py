@@ -1,12 +1,15 @@
+import atexit
 import os
 from dotenv import load_dotenv
 from pathlib import Path
-from src.Instahyre.instahyre import InstahyreApplicationBot
-from src.Naukri.naukri import NaukriApplicationBot
-from src.Linkedin.linkedin import LinkedinApplicationBot
+from src.meta.startup import StartupTimer
 from src.meta.logger import get_logger
+from src.meta.telemetry import telemetry
 # from connections.connect import main as LinkedInConnectionBot
 
+# Bots are imported right before they run, so each one only pays for its own dependencies
+startup = StartupTimer("main")
+
 # Load environment variables
 load_dotenv(override=True)
 
@@ -52,21 +55,40 @@ blacklist_companies = get_list("BLACKLIST_COMPANIES")
 blacklist_titles = get_list("BLACKLIST_TITLES")
 experience_level = [int(x) for x in get_list("EXPERIENCE_LEVEL") if x.isdigit()]
 
+
+def write_telemetry():
+    """Saves the run's LLM call log and cost summary, also when the run is interrupted."""
+    paths = telemetry.write()
+    if paths:
+        summary = telemetry.summary()
+        log.info(f"📈 LLM telemetry: {summary['llm_calls']} call(s), "
+                 f"{summary['prompt_tokens'] + summary['response_tokens']} tokens, "
+                 f"${summary['cost_usd']:.4f}, answered by {summary['answered_by']} "
+                 f"-> {paths[0]}")
+
+
 if __name__ == "__main__":
-    instahyre_bot = InstahyreApplicationBot(
-        email=required_env_vars["INSTAHYRE_EMAIL"],
-        password=required_env_vars["INSTAHYRE_PASSWORD"],
-        limit=30
-    )
-    naukri_bot = NaukriApplicationBot(
-        email=required_env_vars["NAUKRI_EMAIL"],
-        password=required_env_vars["NAUKRI_PASSWORD"]
-    )
+    atexit.register(write_telemetry)
+    # Both portal bots log in before either run, so bad credentials fail at startup
+    with startup.phase("instahyre"):
+        from src.Instahyre.instahyre import InstahyreApplicationBot
+        instahyre_bot = InstahyreApplicationBot(
+            email=required_env_vars["INSTAHYRE_EMAIL"],
+            password=required_env_vars["INSTAHYRE_PASSWORD"],
+            limit=30
+        )
+    with startup.phase("naukri"):
+        from src.Naukri.naukri import NaukriApplicationBot
+        naukri_bot = NaukriApplicationBot(
+            email=required_env_vars["NAUKRI_EMAIL"],
+            password=required_env_vars["NAUKRI_PASSWORD"]
+        )
+    with startup.phase("linkedin"):
+        from src.Linkedin.linkedin import LinkedinApplicationBot
+    startup.report(log)
 
     instahyre_bot.run()
     naukri_bot.run()
-    
-    
 
     bot = LinkedinApplicationBot(
         username=required_env_vars["LINKEDIN_EMAIL"],
@@ -1,30 +1,55 @@
 """Module imports"""
+import heapq
+import os
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dotenv import load_dotenv
+from src.meta.ledger import ledger, APPLIED, FAILED
 from src.meta.logger import get_logger
+from src.meta.portal_client import build_portal_session
+from src.meta.rate_limiter import RateLimiter, parse_retry_after
+from src.meta.session_vault import session_vault
+
+load_dotenv(override=True)
 
 logger = get_logger("instahyre")
 
 
+class LoginError(Exception):
+    """Instahyre refused the credentials or returned no session cookies."""
+
+
 class InstahyreApplicationBot:
     """JobApplicationBot to apply for instahyre jobs automatically"""
 
-    BASE_URL = "https://www.instahyre.com/api/v1"
+    BASE_URL = os.getenv("INSTAHYRE_BASE_URL", "https://www.instahyre.com/api/v1")
     APPLY_URL = f"{BASE_URL}/candidate_opportunity/apply"
     OPPORTUNITY_URL = f"{BASE_URL}/candidate_opportunity"
     REFERRER_URL = "https://www.instahyre.com/candidate/opportunities/?matching=true"
 
+    # Offset pages fetched at once, applies in flight, and applies allowed per minute
+    FETCH_WORKERS = int(os.getenv("INSTAHYRE_FETCH_WORKERS", 4))
+    APPLY_WORKERS = int(os.getenv("INSTAHYRE_APPLY_WORKERS", 2))
+    APPLY_RPM = int(os.getenv("INSTAHYRE_APPLY_RPM", 30))
+    # Most applications sent per run, best scored first
+    MAX_APPLIES = int(os.getenv("INSTAHYRE_MAX_APPLIES", 50))
+
     def __init__(self, email, password, limit=30):
         self.email = email
         self.password = password
         self.limit = limit
         self.session = self._get_session()
-        self.csrftoken, self.sessionid = self._login()
+        self._login_lock = threading.Lock()
+        self.limiter = RateLimiter(self.APPLY_RPM, burst=max(1, self.APPLY_WORKERS))
+        self.csrftoken, self.sessionid = self._restore_login() or self._login()
         self.headers, self.cookies = self._set_headers_cookies()
 
     def _get_session(self):
         if not hasattr(self, "_session"):
-            self._session = requests.Session()
+            self._session = build_portal_session(
+                "instahyre", pool_size=max(self.FETCH_WORKERS, self.APPLY_WORKERS))
         return self._session
 
     def _login(self):
@@ -36,7 +61,7 @@ class InstahyreApplicationBot:
         response = self.session.post(login_url, json=payload)
         if response.status_code != 201:
             logger.error("❌ Login failed: %s", response.text)
-            raise Exception("Login failed")
+            raise LoginError("Login failed")
 
         logger.info("✅ Login successful!")
         cookies = self.session.cookies.get_dict()
@@ -45,10 +70,40 @@ class InstahyreApplicationBot:
 
         if not csrftoken or not sessionid:
             logger.error("❌ Error: Missing CSRF token or Session ID.")
-            raise Exception("CSRF token or Session ID missing")
+            raise LoginError("CSRF token or Session ID missing")
 
+        session_vault.save("instahyre", self.email,
+                           {"csrftoken": csrftoken, "sessionid": sessionid})
         return csrftoken, sessionid
 
+    def _restore_login(self):
+        """Cookies saved by an earlier run, or None; validity is checked by the first request."""
+        saved = session_vault.load("instahyre", self.email)
+        if not saved or not saved.get("sessionid"):
+            return None
+        logger.info("🔑 Reusing saved Instahyre session")
+        return saved["csrftoken"], saved["sessionid"]
+
+    def _authorized(self, send):
+        """
+        Calls `send()` (which reads the current headers/cookies) and, if the
+        session was rejected with 401/403, logs in again and retries once.
+        """
+        sessionid = self.sessionid
+        response = send()
+        if response.status_code not in (401, 403):
+            return response
+
+        with self._login_lock:
+            # Another worker may have logged in again already
+            if self.sessionid == sessionid:
+                logger.info("🔄 Instahyre session expired, logging in again")
+                session_vault.forget("instahyre", self.email)
+                self.session.cookies.clear()
+                self.csrftoken, self.sessionid = self._login()
+                self.headers, self.cookies = self._set_headers_cookies()
+        return send()
+
     def _set_headers_cookies(self):
         cookies = {
             "csrftoken": self.csrftoken,
@@ -63,36 +118,33 @@ class InstahyreApplicationBot:
 
         return headers, cookies
 
-    def fetch_jobs(self, offset=0, retries=3):
-        for attempt in range(retries):
-            logger.info("🔍 Fetching jobs (offset: %d, limit: %d)... Attempt %d",
-                        offset, self.limit, attempt + 1)
-
-            url = f"{self.OPPORTUNITY_URL}?limit={self.limit}&offset={offset}"
-            response = self.session.get(
-                url, headers=self.headers, cookies=self.cookies)
+    def fetch_jobs(self, offset=0):
+        """Fetches one page of opportunities; transient failures are retried by the session."""
+        logger.info("🔍 Fetching jobs (offset: %d, limit: %d)...", offset, self.limit)
 
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get("objects", [])
-                total_jobs = data.get("meta", {}).get("total_count", 0)
+        url = f"{self.OPPORTUNITY_URL}?limit={self.limit}&offset={offset}"
+        try:
+            response = self._authorized(lambda: self.session.get(
+                url, headers=self.headers, cookies=self.cookies))
+        except (requests.RequestException, LoginError) as e:
+            logger.error("❌ Failed to fetch jobs at offset %d: %s", offset, e)
+            return [], 0
 
-                if jobs:
-                    logger.info(
-                        "✅ Fetched %d jobs (Total jobs available: %d)", len(jobs), total_jobs)
-                    return jobs, total_jobs
-                else:
-                    logger.warning(
-                        "⚠️ Received empty job list despite valid response.")
+        if response.status_code != 200:
+            logger.error("❌ Failed to fetch jobs: %s", response.text)
+            return [], 0
 
-            else:
-                logger.error("❌ Failed to fetch jobs: %s", response.text)
+        data = response.json()
+        jobs = data.get("objects", [])
+        total_jobs = data.get("meta", {}).get("total_count", 0)
 
-            logger.info("🔄 Retrying in 5 seconds...")
-            time.sleep(5)
-
-        logger.error("🚨 Maximum retries reached. No jobs fetched.")
-        return [], 0
+        if jobs:
+            logger.info(
+                "✅ Fetched %d jobs (Total jobs available: %d)", len(jobs), total_jobs)
+        else:
+            logger.warning(
+                "⚠️ Received empty job list despite valid response.")
+        return jobs, total_jobs
 
     def apply_to_job(self, job):
         score = float(job.get("score", 0))
@@ -112,38 +164,94 @@ class InstahyreApplicationBot:
 
         payload = {"id": job_id, "is_interested": True,
                    "is_activity_page_job": True}
-        response = self.session.post(
-            self.APPLY_URL, json=payload, headers=self.headers, cookies=self.cookies)
 
-        if response.status_code == 200:
-            logger.info("✅ Successfully applied for %s", company_name)
-        else:
-            logger.error("❌ Failed to apply for %s: %s",
-                         company_name, response.text)
-
-    def run(self):
-        offset = 0
-        total_jobs = None
-
-        while total_jobs is None or offset < total_jobs:
-            logger.info("🚀 Fetching jobs from offset: %d", offset)
-            jobs, total_jobs = self.fetch_jobs(offset)
-
-            if not jobs:
-                logger.info("✅ No more jobs to apply for. Stopping.")
-                break
+        def send():
+            self.limiter.acquire()
+            return self.session.post(
+                self.APPLY_URL, json=payload, headers=self.headers, cookies=self.cookies)
 
-            for job in jobs:
-                self.apply_to_job(job)
-                time.sleep(2)
+        try:
+            response = self._authorized(send)
+        except (requests.RequestException, LoginError) as e:
+            # Not the job's fault (transport error, or the session could not be
+            # renewed); it stays out of the ledger and is tried next run
+            logger.error("❌ Failed to apply for %s: %s", company_name, e)
+            return False
 
-            offset += len(jobs)
+        if response.status_code == 429:
+            # Still throttled after the session's retries: slow every worker down
+            self.limiter.on_throttle(parse_retry_after(response.headers.get("Retry-After")))
 
-            logger.info(
-                "🔄 Moving to next batch (Offset: %d / Total: %d)", offset, total_jobs)
-
-            if offset >= total_jobs:
-                logger.info("✅ All jobs processed.")
-                break
+        if response.status_code == 200:
+            self.limiter.on_success()
+            logger.info("✅ Successfully applied for %s", company_name)
+            ledger.record("instahyre", job_id, APPLIED)
+            return True
+
+        logger.error("❌ Failed to apply for %s: %s",
+                     company_name, response.text)
+        # Auth failures, throttling and 5xx are not a verdict on the job
+        if response.status_code < 500 and response.status_code not in (401, 403, 429):
+            ledger.record("instahyre", job_id, FAILED, response.text[:200])
+        return False
+
+    def _push_candidates(self, queue, jobs, queued, offset):
+        """
+        Pushes jobs not handled before (in this or an earlier run) onto the
+        heap, ordered by score (highest first), then by position in the
+        opportunity list whatever order the pages arrived in.
+
+        :param offset: offset of the page `jobs` came from
+        :return: number of jobs skipped because the ledger already has them
+        """
+        skipped = 0
+        for index, job in enumerate(jobs):
+            if job["id"] in queued:
+                continue
+            queued.add(job["id"])
+            if ledger.seen("instahyre", job["id"]):
+                skipped += 1
+                continue
+            heapq.heappush(queue, (-float(job.get("score") or 0), offset, index, job))
+        return skipped
 
+    def run(self):
+        """
+        Reads the first page to learn total_count and prefetches the other
+        offsets concurrently, gathering new opportunities into a heap by
+        score. The best MAX_APPLIES are then applied to, highest score first,
+        by a bounded worker pool sending at most APPLY_RPM applies a minute.
+        """
+        logger.info("🚀 Fetching jobs from offset: 0")
+        jobs, total_jobs = self.fetch_jobs(0)
+
+        if not jobs:
+            logger.info("✅ No more jobs to apply for. Stopping.")
+            return "Done"
+
+        queue, queued = [], set()
+        start = time.perf_counter()
+        skipped = self._push_candidates(queue, jobs, queued, 0)
+        with ThreadPoolExecutor(max_workers=max(1, self.FETCH_WORKERS)) as fetch_pool:
+            pages = {fetch_pool.submit(self.fetch_jobs, offset): offset
+                     for offset in range(self.limit, total_jobs, self.limit)}
+            for page in as_completed(pages):
+                skipped += self._push_candidates(queue, page.result()[0], queued, pages[page])
+
+        if skipped:
+            logger.info("⏭️ Skipping %d job(s) already in the ledger", skipped)
+        count = min(len(queue), self.MAX_APPLIES)
+        logger.info("📋 %d new opportunities, applying to the best %d", len(queue), count)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.APPLY_WORKERS)) as apply_pool:
+            # The pool starts jobs in submission order, so the best go out first
+            applies = [apply_pool.submit(self.apply_to_job, heapq.heappop(queue)[-1])
+                       for _ in range(count)]
+            results = [future.result() for future in applies]
+
+        logger.info(
+            "✅ All jobs processed: %d applied, %d failed, %d skipped, %d left for later "
+            "of %d in %.1fs", sum(results), len(results) - sum(results), skipped, len(queue),
+            total_jobs, time.perf_counter() - start)
+        logger.info("📊 Instahyre HTTP: %s", self.session.stats())
         return "Done"
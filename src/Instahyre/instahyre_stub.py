@@ -0,0 +1,167 @@
+"""
+Local stand-in for the Instahyre endpoints the bot uses: login, the
+paginated opportunity list and apply, with optional injected 503s and 429s.
+
+Point the bot at it with INSTAHYRE_BASE_URL:
+
+    python -m src.Instahyre.instahyre_stub --port 8767 --jobs 200 --latency 0.1
+    export INSTAHYRE_BASE_URL=http://127.0.0.1:8767/api/v1
+"""
+import argparse
+import random
+import threading
+import time
+import urllib.parse
+from http.cookies import SimpleCookie
+
+from src.meta.stub_server import JSONHandler, StubServer
+
+TITLES = ["Backend Engineer", "Software Engineer", "Python Developer", "Full Stack Developer",
+          "Data Engineer", "SDE II", "Senior Software Engineer", "Java Developer"]
+
+
+def make_jobs(count, seed=None):
+    """Deterministic fake opportunities in the shape of Instahyre's objects."""
+    rng = random.Random(seed)
+    return [{
+        "id": 5000000 + index,
+        "score": round(rng.uniform(0, 10), 2),
+        "employer": {"company_name": f"Company {index}"},
+        "job": {"title": rng.choice(TITLES),
+                "opportunity_url": f"/job-{5000000 + index}-company-{index}/"},
+    } for index in range(count)]
+
+
+class InstahyreStubServer(StubServer):
+    """Threaded HTTP server speaking the subset of Instahyre's API the bot calls."""
+
+    def __init__(self, host="127.0.0.1", port=0, jobs=100, latency=0.0, error_rate=0.0,
+                 throttle_rate=0.0, retry_after=1, seed=None):
+        """
+        :param port: 0 picks a free port (see `url`)
+        :param jobs: number of jobs, or a list of job dicts, the opportunity list returns
+        :param latency: seconds every response is delayed by
+        :param error_rate: share of requests answered with 503
+        :param throttle_rate: share of requests answered with 429 and Retry-After
+        """
+        self.jobs = jobs if isinstance(jobs, list) else make_jobs(jobs, seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self.applied = []
+        self.session_version = 0
+        self.requests = {"login": 0, "opportunities": 0, "apply": 0, "failed": 0}
+        self._lock = threading.Lock()
+        super().__init__(host, port)
+
+    @property
+    def url(self):
+        """Base URL for INSTAHYRE_BASE_URL."""
+        return f"{self.base_url}/api/v1"
+
+    def session_id(self):
+        return f"stub-session-{self.session_version}"
+
+    def expire_sessions(self):
+        """Invalidates issued sessions; requests using them get 403 until the next login."""
+        with self._lock:
+            self.session_version += 1
+
+    def _count(self, name):
+        with self._lock:
+            self.requests[name] += 1
+
+    def _failure(self):
+        """:return: (status, headers) of an injected failure, or None"""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.error_rate:
+            return 503, {}
+        if roll < self.error_rate + self.throttle_rate:
+            return 429, {"Retry-After": str(self.retry_after)}
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(JSONHandler):
+            def _inject_failure(self):
+                failure = server._failure()
+                if failure is None:
+                    return False
+                server._count("failed")
+                self._send(failure[0], {"detail": "Injected failure"}, headers=failure[1])
+                return True
+
+            def _signed_in(self):
+                cookies = SimpleCookie(self.headers.get("Cookie", ""))
+                return "sessionid" in cookies and cookies["sessionid"].value == server.session_id()
+
+            def do_GET(self):
+                time.sleep(server.latency)
+                parsed = urllib.parse.urlparse(self.path)
+                query = urllib.parse.parse_qs(parsed.query)
+                self._body()
+
+                if self._inject_failure():
+                    return
+                if parsed.path.rstrip("/") != "/api/v1/candidate_opportunity":
+                    return self._send(404, {"detail": "Not found"})
+                server._count("opportunities")
+                if not self._signed_in():
+                    return self._send(403, {"detail": "Authentication credentials were not provided."})
+                limit = int(query.get("limit", ["30"])[0])
+                offset = int(query.get("offset", ["0"])[0])
+                return self._send(200, {"meta": {"total_count": len(server.jobs)},
+                                        "objects": server.jobs[offset:offset + limit]})
+
+            def do_POST(self):
+                time.sleep(server.latency)
+                path = urllib.parse.urlparse(self.path).path.rstrip("/")
+                body = self._body()
+
+                if self._inject_failure():
+                    return
+                if path == "/api/v1/user_login":
+                    server._count("login")
+                    if not body.get("email") or not body.get("password"):
+                        return self._send(400, {"detail": "Invalid credentials"})
+                    return self._send(201, {"success": True}, cookies={
+                        "csrftoken": "stub-csrf", "sessionid": server.session_id()})
+                if path == "/api/v1/candidate_opportunity/apply":
+                    server._count("apply")
+                    if not self._signed_in():
+                        return self._send(403, {"detail": "Authentication credentials were not provided."})
+                    with server._lock:
+                        server.applied.append(body.get("id"))
+                    return self._send(200, {"success": True})
+                self._send(404, {"detail": "Not found"})
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Instahyre API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = InstahyreStubServer(args.host, args.port, args.jobs, args.latency, args.error_rate,
+                                 args.throttle_rate, args.retry_after, seed=args.seed)
+    print(f"Instahyre stub listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Module imports"""
+import json
+
+# Runs in the page (execute_async_script): scrolls the results list until no
+# new cards appear and it is at the bottom, then returns every card as JSON.
+HARVEST_JOB_CARDS_JS = """
+const [listSelector, stepPx, settleMs, done] = arguments;
+const list = document.querySelector(listSelector);
+const cards = () => document.querySelectorAll("div[data-job-id]");
+const text = (card, selectors) => {
+    for (const selector of selectors) {
+        const element = card.querySelector(selector);
+        if (element && element.innerText.trim()) return element.innerText.trim().split("\\n")[0];
+    }
+    return "";
+};
+const harvest = () => JSON.stringify(Array.from(cards(), card => ({
+    id: card.getAttribute("data-job-id"),
+    title: text(card, [".job-card-list__title", ".job-card-container__link", "a[href*='/jobs/view/']"]),
+    company: text(card, [".job-card-container__primary-description", ".artdeco-entity-lockup__subtitle",
+                         ".job-card-container__company-name"]),
+    applied: /\\bApplied\\b/.test(card.innerText),
+})));
+
+let position = 0, lastCount = -1, stable = 0;
+const scroll = () => {
+    if (!list) return done(harvest());
+    position += stepPx;
+    list.scrollTo(0, position);
+    setTimeout(() => {
+        const count = cards().length;
+        const atBottom = list.scrollTop + list.clientHeight >= list.scrollHeight - 1;
+        stable = count === lastCount && atBottom ? stable + 1 : 0;
+        lastCount = count;
+        if (stable >= 2 || position > 50000) done(harvest());
+        else scroll();
+    }, settleMs);
+};
+scroll();
+"""
+
+
+def harvest_job_cards(driver, list_selector=".jobs-search-results-list", step=300, settle_ms=150):
+    """
+    Scrolls the search results list until it is fully loaded and reads every
+    job card, in one WebDriver round-trip.
+
+    :param list_selector: CSS selector of the scrollable results list
+    :param step: pixels scrolled per step
+    :param settle_ms: how long each step waits for newly loaded cards
+    :return: [{"id", "title", "company", "applied"}] in page order
+    """
+    return json.loads(driver.execute_async_script(
+        HARVEST_JOB_CARDS_JS, list_selector, step, settle_ms) or "[]")
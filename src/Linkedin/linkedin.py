@@ -30,7 +30,12 @@ import webdriver_manager.chrome as ChromeDriverManager
 from selenium.webdriver.common.action_chains import ActionChains
 
 from src.meta.logger import get_logger
-from src.meta.askAI import ai_agent
+from src.meta.askAI import get_ai_agent
+from src.meta.telemetry import telemetry
+from src.meta.answer_cache import answer_cache
+from src.meta.profile_rules import profile_rules
+from src.Linkedin.job_cards import harvest_job_cards
+from src.Linkedin.waits import WaitEngine, height_settled, logged_in
 ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
 
 
@@ -40,6 +45,8 @@ load_dotenv(override=True)
 
 class LinkedinApplicationBot:
     MAX_SEARCH_TIME = 60 * 60
+    # fields filled from the profile in process_questions, never sent to the AI
+    PROFILE_FIELDS = ("email", "country code", "location", "mobile phone number")
 
     def __init__(self,
                  username,
@@ -86,6 +93,10 @@ class LinkedinApplicationBot:
         self.browser = webdriver.Chrome(service=ChromeService(
             ChromeDriverManager().install()), options=self.options)
         self.wait = WebDriverWait(self.browser, 30)
+        self.waits = WaitEngine(self.browser)
+        # parsed lazily by the job_page property, and only when something reads it
+        self._page_soup = None
+        self.parse_stats = {"pages": 0, "bytes": 0, "seconds": 0.0}
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
         self.start_linkedin(username, password)
@@ -111,6 +122,10 @@ class LinkedinApplicationBot:
             "text_input_label": (By.CLASS_NAME, "artdeco-text-input--label"),
             "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
             "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]'),
+            # the top card's apply area has rendered, with or without an apply button
+            "job_page_ready": (By.XPATH, '//div[contains(@class, "jobs-s-apply")]'
+                                         ' | //*[contains(@class, "jobs-details-top-card__apply-error")]'
+                                         ' | //*[contains(text(), "You applied on")]'),
             "fb-dash-form-element": (By.CLASS_NAME, 'fb-dash-form-element'),
             "multi_select_2": (By.ID, 'text-entity-list-form-component'),
             "form_fields": "fb-dash-form-element"
@@ -133,6 +148,11 @@ class LinkedinApplicationBot:
             df = pd.DataFrame(columns=["Question", "Answer"])
             df.to_csv(self.qa_file, index=False, encoding='utf-8')
 
+        # carry answers from the old LinkedIn-only qa.csv into the shared cache
+        imported = answer_cache.import_csv(self.qa_file_path, portal="linkedin")
+        if imported:
+            log.info(f"Imported {imported} answers from {self.qa_file_path}")
+
     def get_appliedIDs(self, filename) -> list | None:
         try:
             df = pd.read_csv(filename,
@@ -181,11 +201,13 @@ class LinkedinApplicationBot:
                                                      '//*[@id="organic-div"]/form/div[4]/button')
             user_field.send_keys(username)
             user_field.send_keys(Keys.TAB)
-            time.sleep(2)
+            self.waits.pause("typing")
             pw_field.send_keys(password)
-            time.sleep(2)
+            self.waits.pause("typing")
             login_button.click()
-            time.sleep(15)
+            # done once LinkedIn reaches the feed; a /checkpoint (2FA or captcha)
+            # page keeps waiting so a person can complete it
+            self.waits.until("login", logged_in)
         except TimeoutException:
             log.info(
                 "TimeoutException! Username/password field or login button not found")
@@ -238,46 +260,28 @@ class LinkedinApplicationBot:
                 randoTime: float = random.uniform(1.5, 2.9)
                 log.debug(f"Sleeping for {round(randoTime, 1)}")
                 # time.sleep(randoTime)
-                self.load_page(sleep=0.5)
-
-                # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
-
-                # scroll to bottom
-
-                if self.is_present(self.locator["search"]):
-                    scrollresults = self.get_elements("search")
-                    #     self.browser.find_element(By.CLASS_NAME,
-                    #     "jobs-search-results-list"
-                    # )
-                    # Selenium only detects visible elements; if we scroll to the bottom too fast, only 8-9 results will be loaded into IDs list
-                    for i in range(300, 3000, 100):
-                        self.browser.execute_script(
-                            "arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
-                    scrollresults = self.get_elements("search")
-                    # time.sleep(1)
-
-                # get job links, (the following are actually the job card objects)
-                if self.is_present(self.locator["links"]):
-                    links = self.get_elements("links")
-                # links = self.browser.find_elements("xpath",
-                #     '//div[@data-job-id]'
-                # )
+                self.load_page(back_to_top=True)
 
+                # LinkedIn displays the search results in a scrollable <div> on the left side;
+                # one injected script scrolls it to the bottom and reads every job card
+                cards = harvest_job_cards(self.browser, "." + self.locator["search"][1])
+                if cards:
                     jobIDs = {}  # {Job id: processed_status}
-
-                    # children selector is the container of the job cards on the left
-                    for link in links:
-                        if 'Applied' not in link.text:  # checking if applied already
-                            if link.text not in self.blacklist:  # checking if blacklisted
-                                jobID = link.get_attribute("data-job-id")
-                                if jobID == "search":
-                                    log.debug(
-                                        "Job ID not found, search keyword found instead? {}".format(link.text))
-                                    continue
-                                else:
-                                    jobIDs[jobID] = "To be processed"
+                    for card in cards:
+                        if card["applied"]:  # checking if applied already
+                            continue
+                        if card["company"] in self.blacklist:  # checking if blacklisted
+                            continue
+                        if card["id"] == "search":
+                            log.debug(
+                                "Job ID not found, search keyword found instead? {}".format(card["title"]))
+                            continue
+                        jobIDs[card["id"]] = "To be processed"
+                    log.info(f"Found {len(cards)} job cards, {len(jobIDs)} to be processed")
                     if len(jobIDs) > 0:
                         self.apply_loop(jobIDs)
+                        log.info(f"⏱️ Waits so far: {self.waits.stats()}")
+                        log.info(f"📄 HTML parsed so far: {self.parse_stats}")
                     self.browser, jobs_per_page = self.next_jobs_page(position,
                                                                       location,
                                                                       jobs_per_page,
@@ -294,7 +298,8 @@ class LinkedinApplicationBot:
     def apply_loop(self, jobIDs):
         for jobID in jobIDs:
             if jobIDs[jobID] == "To be processed":
-                applied = self.apply_to_job(jobID)
+                with telemetry.context(portal="linkedin", job_id=jobID):
+                    applied = self.apply_to_job(jobID)
                 if applied:
                     log.info(f"Applied to {jobID}")
                 else:
@@ -307,8 +312,11 @@ class LinkedinApplicationBot:
         # get job page
         self.get_job_page(jobID)
 
-        # let page load
-        time.sleep(1)
+        # let the apply button render; jobs already applied to or closed never get
+        # one, so stop as soon as the top card shows either state
+        self.waits.until("job_page", EC.any_of(
+            EC.presence_of_element_located(self.locator["easy_apply_button"]),
+            EC.presence_of_element_located(self.locator["job_page_ready"])))
 
         # get easy apply button
         button = self.get_easy_apply_button()
@@ -325,7 +333,7 @@ class LinkedinApplicationBot:
                 log.info("Clicking the EASY apply button")
                 button.click()
                 clicked = True
-                time.sleep(1)
+                self.wait_for_form_step("modal")
                 self.fill_out_fields()
                 result: bool = self.send_resume()
                 if result:
@@ -370,8 +378,7 @@ class LinkedinApplicationBot:
         job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
         self.browser.get(job)
         # self.browser.get("https://www.linkedin.com/jobs/view/4183475661/")
-        self.job_page = self.load_page(sleep=0.5)
-        return self.job_page
+        self.load_page(back_to_top=True)
 
     def get_easy_apply_button(self):
         EasyApplyButton = False
@@ -450,7 +457,7 @@ class LinkedinApplicationBot:
             submitted = False
             loop = 0
             while loop < 3:
-                time.sleep(1)
+                self.wait_for_form_step()
                 # Upload resume
                 if is_present(upload_resume_locator):
                     # upload_locator = self.browser.find_element(By.NAME, "file")
@@ -481,7 +488,6 @@ class LinkedinApplicationBot:
                 if len(self.get_elements("submit")) > 0:
                     if self.get_elements(self.locator["form_fields"]):
                         self.process_questions()
-                        time.sleep(8)
                     elements = self.get_elements("submit")
                     for element in elements:
                         button = self.wait.until(
@@ -494,7 +500,6 @@ class LinkedinApplicationBot:
                 elif len(self.get_elements("error")) > 0:
                     if self.get_elements(self.locator["form_fields"]):
                         self.process_questions()
-                        time.sleep(8)
                     elements = self.get_elements("error")
                     if "application was sent" in self.browser.page_source:
                         log.info("Application Submitted")
@@ -503,13 +508,13 @@ class LinkedinApplicationBot:
                     elif len(elements) > 0:
                         while len(elements) > 0:
                             log.info(
-                                "Please answer the questions, waiting 5 seconds...")
-                            time.sleep(5)
+                                "Please answer the questions, waiting up to 5 seconds...")
+                            self.waits.until_not("manual_answer",
+                                                 lambda driver: self.is_present(self.locator["error"]))
                             elements = self.get_elements("error")
 
                             for element in elements:
                                 self.process_questions()
-                                time.sleep(8)
 
                             if "application was sent" in self.browser.page_source:
                                 log.info("Application Submitted")
@@ -550,7 +555,6 @@ class LinkedinApplicationBot:
                 elif len(self.get_elements("next")) > 0:
                     if self.get_elements(self.locator["form_fields"]):
                         self.process_questions()
-                        time.sleep(8)
                     elements = self.get_elements("next")
                     for element in elements:
                         button = self.wait.until(
@@ -560,7 +564,6 @@ class LinkedinApplicationBot:
                 elif len(self.get_elements("review")) > 0:
                     if self.get_elements(self.locator["form_fields"]):
                         self.process_questions()
-                        time.sleep(8)
                     elements = self.get_elements("review")
                     for element in elements:
                         button = self.wait.until(
@@ -582,14 +585,26 @@ class LinkedinApplicationBot:
 
         return submitted
 
+    def wait_for_form_step(self, step="form_step"):
+        """Waits until the Easy Apply modal shows a next/review/submit button or an error."""
+        return self.waits.until(step, EC.any_of(
+            *(EC.presence_of_element_located(self.locator[name])
+              for name in ("next", "review", "submit", "error"))))
+
     def process_questions(self):
-        time.sleep(1)
+        self.waits.until("form_step", EC.presence_of_element_located(
+            self.locator["fb-dash-form-element"]))
         form = self.get_elements("fb-dash-form-element")
+        questions = [field.text.strip() for field in form]
 
-        for field in form:
-            time.sleep(1)
-            question = field.text.strip()
-            answer = self.ans_question(question)
+        # answer every AI field of this step concurrently before filling any of them
+        answers = self.ans_questions(
+            [question for question in questions
+             if not any(key in question.lower() for key in self.PROFILE_FIELDS)])
+
+        for field, question in zip(form, questions):
+            self.waits.pause("field")
+            answer = answers.get(question, "")
             field_updated = False
             
 
@@ -642,12 +657,12 @@ class LinkedinApplicationBot:
                 try:
                     dropdown = field.find_element(*self.locator["multi_select"])  # Ensure it's specific to this field
                     self.browser.execute_script("arguments[0].scrollIntoView(true);", dropdown)  # Ensure visibility
-                    time.sleep(0.5)
+                    self.waits.until("field", EC.element_to_be_clickable(dropdown))
                     dropdown.click()
 
                     actions = ActionChains(self.browser)
                     actions.move_to_element(dropdown).perform()
-                    time.sleep(0.5)
+                    self.waits.until("field", lambda driver: field.find_elements(By.TAG_NAME, "option"))
 
                     # **Select the Correct Answer**
                     options = field.find_elements(By.TAG_NAME, "option")  # Find all options inside this dropdown
@@ -663,44 +678,59 @@ class LinkedinApplicationBot:
             if not field_updated:
                 log.info(f"Skipped field: {question}")
 
-    def ans_question(self, question, options=None):
-        qa_data = {}
-
-        # Read existing data from qa.csv
-        if os.path.exists(self.qa_file_path):
-            with open(self.qa_file_path, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                qa_data = {rows[0]: rows[1]
-                           for rows in reader if len(rows) == 2}
-
-        # If question exists, return the stored answer
-        if question in qa_data:
-            return qa_data[question]
-
-        # Otherwise, generate answer using AI
-        answer = ai_agent.answer_questions(question, log, options)
-
-        # Store the new question and answer in qa.csv
-        with open(self.qa_file_path, mode="a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow([question, answer])
-
-        return answer
-
-    def load_page(self, sleep=1):
+    def ans_questions(self, questions):
+        answers = {}
+        missing = []
+        for question in dict.fromkeys(questions):
+            source = "rule"
+            answer = profile_rules.answer(question)
+            if answer is None:
+                source = "cache"
+                answer = answer_cache.get(question)
+            if answer is None:
+                missing.append(question)
+            else:
+                telemetry.record_hit(source, label=question)
+                answers[question] = answer
+
+        if missing:
+            for question, answer in zip(missing, get_ai_agent().answer_many(missing, log)):
+                answer_cache.put(question, answer, portal="linkedin")
+                answers[question] = answer
+
+        return answers
+
+    def load_page(self, back_to_top=False):
+        """
+        Scrolls the page down in 500 px steps so lazy content loads, stopping
+        at the bottom of the page. The HTML is not parsed here; see job_page.
+        """
+        self.waits.page_loaded()
+        self._page_soup = None
         scroll_page = 0
         while scroll_page < 4000:
-            self.browser.execute_script(
-                "window.scrollTo(0," + str(scroll_page) + " );")
+            height = self.browser.execute_script(
+                "window.scrollTo(0, arguments[0]); return document.body.scrollHeight;", scroll_page)
+            # lazy content below the fold loads on scroll; wait until it stops growing
+            self.waits.until("scroll", height_settled(), floor=False)
             scroll_page += 500
-            time.sleep(sleep)
+            if height is not None and scroll_page >= height:
+                break
 
-        if sleep != 1:
+        if back_to_top:
             self.browser.execute_script("window.scrollTo(0,0);")
-            time.sleep(sleep)
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+    @property
+    def job_page(self):
+        """The current page parsed with BeautifulSoup, built on first access after each load."""
+        if self._page_soup is None:
+            start = time.perf_counter()
+            source = self.browser.page_source
+            self._page_soup = BeautifulSoup(source, "lxml")
+            self.parse_stats["pages"] += 1
+            self.parse_stats["bytes"] += len(source.encode("utf-8"))
+            self.parse_stats["seconds"] += time.perf_counter() - start
+        return self._page_soup
 
     def avoid_lock(self) -> None:
         x, _ = pyautogui.position()
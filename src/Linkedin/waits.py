@@ -0,0 +1,134 @@
+"""Module imports"""
+import os
+import random
+import threading
+import time
+
+from dotenv import load_dotenv
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+load_dotenv(override=True)
+
+# Seconds each step may wait for the page before giving up
+DEFAULT_TIMEOUTS = {
+    "login": 30,
+    "page": 15,
+    "job_page": 8,
+    "modal": 8,
+    "form_step": 6,
+    "manual_answer": 5,
+    "field": 3,
+    "scroll": 2,
+}
+
+
+def _parse_timeouts(value):
+    """"page=20,field=5" -> {"page": 20.0, "field": 5.0}"""
+    return {step.strip(): float(seconds) for step, _, seconds in
+            (item.partition("=") for item in (value or "").split(",")) if seconds}
+
+
+def page_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def logged_in(driver):
+    """Past the login form: on the feed, or anywhere but /login and /checkpoint."""
+    url = driver.current_url
+    return "/feed" in url or not any(part in url for part in ("/login", "/checkpoint"))
+
+
+def height_settled():
+    """Condition that holds once the document height is unchanged between two polls."""
+    last = []
+
+    def condition(driver):
+        height = driver.execute_script("return document.body.scrollHeight")
+        settled = last == [height]
+        last[:] = [height]
+        return settled
+    return condition
+
+
+class WaitEngine:
+    """
+    Waits on page state (WebDriverWait + expected conditions) instead of
+    fixed sleeps. Every wait belongs to a named step with its own timeout
+    (LINKEDIN_WAIT_TIMEOUTS, e.g. "page=20,field=5") and is recorded, so the
+    run can report how long each step really took.
+
+    LINKEDIN_WAIT_JITTER ("min,max" seconds, default "0.2,0.6"; "0" turns it
+    off) is a human-like floor: a wait that is satisfied sooner is padded to
+    a random duration in that range.
+    """
+
+    def __init__(self, driver, timeouts=None, jitter=None, poll=0.1):
+        self.driver = driver
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timeouts.update(timeouts if timeouts is not None else
+                             _parse_timeouts(os.getenv("LINKEDIN_WAIT_TIMEOUTS")))
+        if jitter is None:
+            jitter = [float(value) for value in os.getenv("LINKEDIN_WAIT_JITTER", "0.2,0.6").split(",")]
+        self.jitter = (jitter[0], jitter[-1]) if jitter and max(jitter) > 0 else None
+        self.poll = poll
+        self._durations = {}
+        self._timeouts_hit = {}
+        self._lock = threading.Lock()
+
+    def _floor(self, start):
+        if self.jitter:
+            remaining = random.uniform(*self.jitter) - (time.perf_counter() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _record(self, step, start, timed_out=False):
+        with self._lock:
+            self._durations.setdefault(step, []).append(time.perf_counter() - start)
+            if timed_out:
+                self._timeouts_hit[step] = self._timeouts_hit.get(step, 0) + 1
+
+    def until(self, step, condition, timeout=None, floor=True):
+        """
+        Waits until `condition(driver)` is truthy.
+
+        :param step: name used for the timeout and the recorded duration
+        :param condition: an expected condition or any callable taking the driver
+        :param floor: pad to the jitter floor (off for waits no user would make, e.g. scrolling)
+        :return: the condition's value, or None if the step timed out
+        """
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout if timeout is not None else self.timeouts.get(step, 10),
+                poll_frequency=self.poll).until(condition)
+        except TimeoutException:
+            self._record(step, start, timed_out=True)
+            return None
+        if floor:
+            self._floor(start)
+        self._record(step, start)
+        return result
+
+    def until_not(self, step, condition, timeout=None):
+        """Waits until `condition(driver)` is falsy; :return: True unless the step timed out."""
+        return self.until(step, lambda driver: not condition(driver), timeout) is not None
+
+    def page_loaded(self, step="page"):
+        return self.until(step, page_ready) is not None
+
+    def pause(self, step):
+        """Only the jitter floor, for pacing between actions that have nothing to wait on."""
+        start = time.perf_counter()
+        self._floor(start)
+        self._record(step, start)
+
+    def stats(self):
+        """{step: {count, total, mean, max, timeouts}} in seconds."""
+        with self._lock:
+            return {step: {"count": len(durations),
+                           "total": round(sum(durations), 2),
+                           "mean": round(sum(durations) / len(durations), 3),
+                           "max": round(max(durations), 2),
+                           "timeouts": self._timeouts_hit.get(step, 0)}
+                    for step, durations in self._durations.items()}
@@ -1,12 +1,21 @@
 """Module imports"""
 from dotenv import load_dotenv
 import os
-import urllib.parse
+import json
+import math
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-import requests
+from src.meta.portal_client import build_portal_session
 from src.meta.logger import get_logger
+from src.meta.session_vault import session_vault
 
-from src.meta.askAI import ai_agent
+from src.meta.askAI import existing_ai_agent, get_ai_agent
+from src.meta.get_resume_text import get_resume
+from src.Naukri.relevance import JobScorer
+from src.Naukri.search_planner import SearchPlanner
+from src.meta.ledger import ledger, APPLIED, FAILED
+from src.meta.telemetry import telemetry
 
 logger = get_logger("naukri")
 
@@ -15,29 +24,20 @@ load_dotenv(override=True)
 
 class NaukriApplicationBot:
 
-    BASE_URL = "https://www.naukri.com"
+    BASE_URL = os.getenv("NAUKRI_BASE_URL", "https://www.naukri.com")
     LOGIN_SUBDIRECTORY = "/central-login-services/v1/login"
-    SEARCH = "/jobapi/v3/search"
-    
-    if os.getenv('NAUKRI_DESIGNATION_COMPANY') and len(os.getenv('NAUKRI_DESIGNATION_COMPANY')) > 0:
-        keyword = {
-            "keyword": os.getenv('NAUKRI_DESIGNATION_COMPANY'),
-            "pageNo": 1,
-            "noOfResults": 20,
-            "k": os.getenv('NAUKRI_DESIGNATION_COMPANY'),
-            "searchType": "adv"
-        }
-        
-        if os.getenv('NAUKRI_LOCATION') and len(os.getenv('NAUKRI_LOCATION')) > 0:
-            keyword["location"] = os.getenv('NAUKRI_LOCATION')
-            keyword["l"] = os.getenv('NAUKRI_LOCATION')
-            keyword["seoKey"] = f"{'-'.join([item.strip().replace(' ', '-').lower() for item in os.getenv('NAUKRI_DESIGNATION_COMPANY').split(',')])}-jobs-in-{os.getenv('NAUKRI_LOCATION').split(',')[0].replace(' ', '-').lower()}"
-        else:
-            keyword["seoKey"] = f"{'-'.join([item.strip().replace(' ', '-').lower() for item in os.getenv('NAUKRI_DESIGNATION_COMPANY').split(',')])}-jobs"
-        RECOMMENDED_JOBS = f'{SEARCH}/?{urllib.parse.urlencode(keyword)}'
-    else:
-        RECOMMENDED_JOBS = "/jobapi/v2/search/recom-jobs"
-    
+
+    PAGE_SIZE = 20
+    # Search pages fetched at once, and the most pages read per run
+    FETCH_WORKERS = int(os.getenv("NAUKRI_FETCH_WORKERS", 4))
+    MAX_PAGES = int(os.getenv("NAUKRI_MAX_PAGES", 10))
+
+    # Jobs sent in one apply request (strJobsarr); 1 applies job by job
+    APPLY_BATCH_SIZE = max(1, int(os.getenv("NAUKRI_APPLY_BATCH", 5)))
+    # Questionnaires answered (and re-submitted) in the background while applying goes on
+    ANSWER_WORKERS = int(os.getenv("NAUKRI_ANSWER_WORKERS", 2))
+    MAX_APPLICATIONS = 20
+
     APPLY = "/cloudgateway-workflow/workflow-services/apply-workflow/v1/apply"
     RESPONSE = "/cloudgateway-chatbot/chatbot-services/botapi/v5/respond"
 
@@ -45,15 +45,21 @@ class NaukriApplicationBot:
         self.email = email
         self.password = password
         self.session = self._get_session()
-        self.bearer_token, self.nkparam = self._login()
+        self._login_lock = threading.Lock()
+        self.bearer_token, self.nkparam = self._restore_login() or self._login()
         self.count = 0
-        self.pageNo = 1
         self.number_of_jobs = 0
+        self.planner = SearchPlanner.from_env(self.PAGE_SIZE)
         self.applied_jobs_count = 0
+        self._count_lock = threading.Lock()
+        # Set while run() pipelines questionnaires; None answers them inline
+        self._answer_pool = None
+        self._answering = set()
 
     def _get_session(self):
         if not hasattr(self, "_session"):
-            self._session = requests.Session()
+            self._session = build_portal_session(
+                "naukri", pool_size=max(self.FETCH_WORKERS, self.ANSWER_WORKERS + 1))
         return self._session
 
     def _login(self):
@@ -89,170 +95,334 @@ class NaukriApplicationBot:
         # Extract nkparam (NKWAP value)
         nkparam = next((cookie['value'] for cookie in cookies if cookie['name'] == 'NKWAP'), None)
 
+        session_vault.save("naukri", self.email, {"nauk_at": bearer_token, "NKWAP": nkparam})
         return bearer_token, nkparam
 
-    def recommended_jobs(self):
-        logger.info("🔍 Fetching jobs")
-        formatted_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        payload = {
-            "clusterSplitDate": {
-                "apply": formatted_datetime,
-                "preference": "1980-01-01 05:30:00",
-                "profile": "1980-01-01 05:30:00",
-                "similar_jobs": "1980-01-01 05:30:00"
-            },
-            "searches": None
-        }
-        url = self.BASE_URL + self.RECOMMENDED_JOBS
-
-        headers = {
-            "appid": "109",
-            "systemid": "Naukri",
-            "nkparam": self.nkparam
-        }
+    def _restore_login(self):
+        """Tokens saved by an earlier run, or None; validity is checked by the first request."""
+        saved = session_vault.load("naukri", self.email)
+        if not saved or not saved.get("nauk_at"):
+            return None
+        logger.info("🔑 Reusing saved Naukri session")
+        return saved["nauk_at"], saved.get("NKWAP")
+
+    def _authorized(self, send):
+        """
+        Calls `send()` (which reads the current tokens) and, if the session was
+        rejected with 401/403, logs in again and retries once.
+        """
+        bearer_token = self.bearer_token
+        response = send()
+        if response.status_code not in (401, 403):
+            return response
+
+        with self._login_lock:
+            # Concurrent requests share one re-login
+            if self.bearer_token == bearer_token:
+                logger.info("🔄 Naukri session expired, logging in again")
+                session_vault.forget("naukri", self.email)
+                self.bearer_token, self.nkparam = self._login()
+        return send()
+
+    def recommended_jobs(self, page_no=1, query=None):
+        """
+        Fetches one page of a planned search (recommended jobs have a single page).
+
+        :param query: one of `self.planner.queries`; defaults to the first
+        :return: (jobs on the page, total number of jobs for the search)
+        """
+        query = query or self.planner.queries[0]
+        logger.info(f"🔍 Fetching {self.planner.describe(query)} (page {page_no})")
+        url = self.BASE_URL + self.planner.url(query, page_no)
+
+        def headers():
+            return {
+                "appid": "109",
+                "systemid": "Naukri",
+                "nkparam": self.nkparam
+            }
 
-        if "/jobapi/v2/search/recom-jobs" in url:
-            response = self.session.get(url=url, headers=headers, json=payload)
+        if not self.planner.paginated(query):
+            formatted_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            payload = {
+                "clusterSplitDate": {
+                    "apply": formatted_datetime,
+                    "preference": "1980-01-01 05:30:00",
+                    "profile": "1980-01-01 05:30:00",
+                    "similar_jobs": "1980-01-01 05:30:00"
+                },
+                "searches": None
+            }
+            response = self._authorized(
+                lambda: self.session.get(url=url, headers=headers(), json=payload))
         else:
-            # find pageNo and update the url using the keyword
-            if self.keyword.get("pageNo") is not None:
-                self.keyword["pageNo"] = self.pageNo
-                self.keyword["noOfResults"] = 20
-                self.keyword["k"] = os.getenv('NAUKRI_DESIGNATION_COMPANY')
-                self.keyword["l"] = os.getenv('NAUKRI_LOCATION')
-                self.keyword["seoKey"] = f"{'-'.join([item.strip().replace(' ', '-').lower() for item in os.getenv('NAUKRI_DESIGNATION_COMPANY').split(',')])}-jobs-in-{os.getenv('NAUKRI_LOCATION').split(',')[0].replace(' ', '-').lower()}"
-            else:
-                logger.error("❌ Page number not found in keyword")
-                return []
-            url = self.BASE_URL + self.SEARCH + "/?" + urllib.parse.urlencode(self.keyword)
-            # payload = {
-            #     "clusterSplitDate": {
-            #         "apply": formatted_datetime,
-            #         "preference": "1980-01-01 05:30:00",
-            #         "profile": "1980-01-01 05:30:00",
-            #         "similar_jobs": "1980-01-01 05:30:00"
-            #     },
-            #     "searches": None
-            # }
-            # headers = {
-            #     "appid": "109",
-            #     "systemid": "Naukri",
-            #     "nkparam": self.nkparam,
-            #     "Content-Type": "application/json"
-            # }
-            response = self.session.get(url=url, headers=headers)
+            response = self._authorized(lambda: self.session.get(url=url, headers=headers()))
 
         if response.status_code != 200:
             logger.error("❌ Failed to fetch jobs: %s", response.text)
+            return [], 0
 
         data = response.json()
-
-        if self.number_of_jobs == 0:
-            self.number_of_jobs = data["noOfJobs"]
-        jobs = data["jobDetails"]
+        jobs = data.get("jobDetails") or []
 
         if not jobs:
             logger.warning(
                 "⚠️ Received empty job list despite valid response.")
-        else:
-            logger.info(
-                "✅ Total jobs available: %d", self.number_of_jobs)
-
-        return jobs
 
-    def apply_to_job(self, job):
-        job_id = job["jobId"]
-        job_title = job["title"]
-        company_name = job["companyName"]
-        skills = job["tagsAndSkills"]
-        job_url = self.BASE_URL + job["jdURL"]
-
-        logger_data = {
-            "company_name": company_name,
-            "title": job_title,
-            "job_url": job_url,
-            "skills": skills
-        }
+        return jobs, data.get("noOfJobs", len(jobs))
+
+    def fetch_jobs(self, max_pages=None):
+        """
+        Runs every planned search: first pages of all queries at once (they
+        tell how many pages each has), then the remaining pages (up to
+        `max_pages` per query) through the same worker pool.
+
+        :return: jobs from all queries and pages in plan order, without duplicate jobIds
+        """
+        max_pages = max_pages or self.MAX_PAGES
+        queries = self.planner.queries
+
+        def fetch(task):
+            query, page_no = task
+            try:
+                return self.recommended_jobs(page_no, query)
+            except Exception as e:
+                logger.error(f"❌ Failed to fetch {self.planner.describe(query)} page {page_no}: {e}")
+                return [], 0
+
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as pool:
+            firsts = list(pool.map(fetch, [(query, 1) for query in queries]))
+            rest = [(query, page_no) for query, (jobs, total) in zip(queries, firsts)
+                    if jobs and self.planner.paginated(query)
+                    for page_no in range(2, min(max_pages, math.ceil(total / self.PAGE_SIZE)) + 1)]
+            pages = [jobs for jobs, _ in firsts] + [jobs for jobs, _ in pool.map(fetch, rest)]
+
+        # Queries overlap (the same job matches several designations or locations)
+        unique = {}
+        for page in pages:
+            for job in page:
+                unique.setdefault(job["jobId"], job)
+
+        self.number_of_jobs = sum(total for _, total in firsts)
         logger.info(
-            f"✅ Applying for {company_name} and data is: {logger_data}")
+            f"✅ Total jobs available: {self.number_of_jobs} across {len(queries)} search(es), "
+            f"fetched {len(unique)} unique job(s) from {len(pages)} page(s)")
+
+        # Recorded job JSON feeds benchmarks/job_relevance.py
+        if os.getenv("NAUKRI_RECORD_JOBS"):
+            with open(os.getenv("NAUKRI_RECORD_JOBS"), "w", encoding="utf-8") as file:
+                json.dump(list(unique.values()), file, ensure_ascii=False)
+        return list(unique.values())
+
+    def rank_jobs(self, jobs):
+        """
+        Orders jobs by relevance to the resume and drops those under
+        NAUKRI_MIN_SCORE, so the run's applications go to the best matches.
+        Without a readable resume the portal's order is kept.
+        """
         try:
-            url = self.BASE_URL + self.APPLY
-            payload = {
-                "strJobsarr": [job_id],
-                "applyTypeId": "107",
-                "applySrc": "----F-0-1---"
-            }
+            resume = get_resume()
+        except Exception as e:
+            logger.warning(f"⚠️ Resume unavailable, jobs are not ranked: {e}")
+            return jobs
+        if not resume["facts"].get("skills"):
+            return jobs
+
+        scorer = JobScorer.from_env(resume["facts"], resume["text"])
+        ranked = scorer.rank(jobs)
+        logger.info(
+            f"🎯 {len(ranked)}/{len(jobs)} job(s) scored at least {scorer.min_score}"
+            + (f", best {ranked[0][0]:.2f} ({ranked[0][1]['title']})" if ranked else ""))
+        return [job for _, job in ranked]
+
+    def _apply_request(self, job_ids, apply_data=None):
+        payload = {
+            "strJobsarr": list(job_ids),
+            "applyTypeId": "107",
+            "applySrc": "----F-0-1---"
+        }
+        if apply_data:
+            payload["applyData"] = apply_data
+        def send():
             headers = {
                 "appid": "121",
                 "authorization": f"ACCESSTOKEN = {self.bearer_token}",
                 "clientid": "d3skt0p",
                 "systemid": "jobseeker"
             }
+            return self.session.post(
+                url=self.BASE_URL + self.APPLY, headers=headers, json=payload)
+
+        return self._authorized(send)
 
-            response = self.session.post(
-                url=url, headers=headers, json=payload)
+    def apply_to_job(self, job):
+        return self.apply_to_jobs([job]).get(job["jobId"], False)
+
+    def apply_to_jobs(self, jobs):
+        """
+        Applies to several jobs with one strJobsarr request and reads the
+        per-job results from data["jobs"]. Jobs answering with a questionnaire
+        are completed one by one through the questionnaire path, in the
+        background when run() has started the answer pool.
+
+        Only the portal's own verdict on a job goes into the ledger; jobs left
+        out of the response or lost to a transport error are tried again next run.
+
+        :return: {jobId: applied}; None for jobs whose questionnaire is still
+                 being answered (their ledger entry is written when it is done)
+        """
+        results = {job["jobId"]: False for job in jobs}
+        by_id = {str(job["jobId"]): job for job in jobs}
+
+        for job in jobs:
+            logger_data = {
+                "company_name": job["companyName"],
+                "title": job["title"],
+                "job_url": self.BASE_URL + job["jdURL"],
+                "skills": job["tagsAndSkills"]
+            }
+            logger.info(
+                f"✅ Applying for {job['companyName']} and data is: {logger_data}")
+
+        companies = ", ".join(job["companyName"] for job in jobs)
+        try:
+            response = self._apply_request([job["jobId"] for job in jobs])
+            if response.status_code != 200:
+                logger.error(f"❌ Failed to apply for {companies}: {response.status_code} {response.text}")
+                return results
             data = response.json()
+        except Exception as e:
+            logger.error(f"❌ Failed to apply for {companies} with error: {e}")
+            return results
 
-            # Handle missing or empty "jobs" key
-            if not data.get("jobs"):
-                logger.warning(
-                    f"⚠️ No jobs found in response for {company_name}: {data}")
-                return False
+        # Handle missing or empty "jobs" key
+        if not data.get("jobs"):
+            logger.warning(
+                f"⚠️ No jobs found in response for {companies}: {data}")
+            return results
+
+        for position, job_response in enumerate(data["jobs"]):
+            # Results carry their jobId; without one they follow the request order
+            if "jobId" in job_response:
+                job = by_id.get(str(job_response["jobId"]))
+            else:
+                job = jobs[position] if position < len(jobs) else None
+            if job is not None:
+                results[job["jobId"]] = self._handle_apply_response(job, job_response)
+        return results
 
-            job_response = data["jobs"][0]  # Safe to access after checking
+    def _count_applied(self):
+        with self._count_lock:
+            self.count += 1
 
-            if job_response.get("message") == "You have successfully applied to this job.":
-                logger.info(f"✅ Applied to {company_name}")
-                self.count += 1
-                return True
-            elif "questionnaire" in job_response:
-                questionnaires = job_response["questionnaire"]
-                questionnaires_response = ai_agent.create_questionnaires_response(
-                    questionnaires, logger)
+    def _handle_apply_response(self, job, job_response):
+        company_name = job["companyName"]
 
-                if questionnaires_response == {}:
-                    return False
+        if job_response.get("message") == "You have successfully applied to this job.":
+            logger.info(f"✅ Applied to {company_name}")
+            self._count_applied()
+            ledger.record("naukri", job["jobId"], APPLIED)
+            return True
+        elif "questionnaire" in job_response:
+            if self._answer_pool is None:
+                return self._apply_with_questionnaire(job, job_response["questionnaire"])
+            self._queue_questionnaire(job, job_response["questionnaire"])
+            return None
+
+        logger.error(f"❌ Failed to apply at {company_name}. Response: {job_response}")
+        ledger.record("naukri", job["jobId"], FAILED)
+        return False
+
+    def _queue_questionnaire(self, job, questionnaires):
+        """
+        Hands the questionnaire to the answer pool; the job is re-submitted once
+        answered and _apply_with_questionnaire writes its ledger entry.
+        """
+        logger.info(f"📝 Queued questionnaire for {job['companyName']}")
+        future = self._answer_pool.submit(self._apply_with_questionnaire, job, questionnaires)
+        with self._count_lock:
+            self._answering.add(future)
+        future.add_done_callback(self._answered)
+
+    def _answered(self, future):
+        with self._count_lock:
+            self._answering.discard(future)
+
+    def _in_flight(self):
+        with self._count_lock:
+            return set(self._answering)
+
+    def _apply_with_questionnaire(self, job, questionnaires):
+        """
+        Answers the questionnaire and re-submits the job. A failed LLM call or
+        request is left out of the ledger so the job is retried next run; only
+        the portal rejecting the answers (a 4xx other than auth or 429) marks it FAILED.
+        """
+        job_id = job["jobId"]
+        company_name = job["companyName"]
+        try:
+            with telemetry.context(portal="naukri", job_id=job_id):
+                questionnaires_response = get_ai_agent().create_questionnaires_response(
+                    questionnaires, logger)
 
-                payload["applyData"] = {
-                    str(job_id): {"answers": questionnaires_response}}
+            if questionnaires_response == {}:
+                return False
 
-                response = self.session.post(
-                    url=url, headers=headers, json=payload)
+            response = self._apply_request(
+                [job_id], {str(job_id): {"answers": questionnaires_response}})
 
-                if response.status_code >= 200 and response.status_code < 300:
-                    self.count += 1
-                    logger.info(
-                        f"✅ Applied to {company_name} after filling questionnaire")
-                    return True
-                else:
-                    logger.error(
-                        f"❌ Failed to apply at {company_name}. Response: {response.text}"
-                    )
-                    return False
+            if response.status_code >= 200 and response.status_code < 300:
+                self._count_applied()
+                logger.info(
+                    f"✅ Applied to {company_name} after filling questionnaire")
+                ledger.record("naukri", job_id, APPLIED)
+                return True
+            else:
+                logger.error(
+                    f"❌ Failed to apply at {company_name}. Response: {response.text}"
+                )
+                if 400 <= response.status_code < 500 and response.status_code not in (401, 403, 429):
+                    ledger.record("naukri", job_id, FAILED)
+                return False
 
         except Exception as e:
             logger.error(
-                f"❌ Failed to apply for {company_name} with data: {logger_data} and error: {e}")
-        
+                f"❌ Failed to apply for {company_name} with error: {e}")
+            return False
+
     def run(self):
         try:
-            self.recommended_jobs()
-            
-            while self.number_of_jobs > 0 and self.count < 20:
-                jobs = self.recommended_jobs()
-                self.pageNo += 1
-                logger.info(f"🔄 Page number: {self.pageNo}"
-                            f" and total jobs available: {self.number_of_jobs}")
-
-                if jobs and len(jobs) > 0:
-                    for job in jobs:
-                        if self.apply_to_job(job):
-                            self.number_of_jobs -= len(jobs)
-                else:
-                    logger.warning("⚠️ No New jobs found at the moment")
-                    break
+            jobs = self.fetch_jobs()
+            # Jobs handled in earlier runs cost no apply request or LLM call
+            new_jobs = ledger.unseen("naukri", jobs, key=lambda job: job["jobId"])
+            if len(new_jobs) < len(jobs):
+                logger.info(f"⏭️ Skipping {len(jobs) - len(new_jobs)} job(s) already in the ledger")
+            jobs = self.rank_jobs(new_jobs)
+            if not jobs:
+                logger.warning("⚠️ No New jobs found at the moment")
+
+            # Questionnaires are answered while the next batches are applied to.
+            # Jobs still being answered hold a slot, so the cap is never overshot.
+            pending = list(jobs)
+            with ThreadPoolExecutor(max_workers=max(1, self.ANSWER_WORKERS)) as pool:
+                self._answer_pool = pool if self.ANSWER_WORKERS > 0 else None
+                while pending and self.count < self.MAX_APPLICATIONS:
+                    answering = self._in_flight()
+                    room = self.MAX_APPLICATIONS - self.count - len(answering)
+                    if room <= 0:
+                        wait(answering, return_when=FIRST_COMPLETED)
+                        continue
+                    size = min(self.APPLY_BATCH_SIZE, room)
+                    batch, pending = pending[:size], pending[size:]
+                    self.apply_to_jobs(batch)
+                wait(self._in_flight())
+            self._answer_pool = None
 
             logger.info(f"🥳 Applied application count: {self.count}")
+            ai_agent = existing_ai_agent()
+            if ai_agent is not None:
+                logger.info(f"📊 AI answer sources: {ai_agent.stats()}")
+            logger.info(f"📊 Naukri HTTP: {self.session.stats()}")
 
             return "Done"
         except Exception as e:
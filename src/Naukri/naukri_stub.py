@@ -0,0 +1,196 @@
+"""
+Local stand-in for the Naukri endpoints the bot uses: login, job search
+(paginated and recommended) and the apply workflow, including batched
+strJobsarr requests and questionnaires.
+
+Point the bot at it with NAUKRI_BASE_URL:
+
+    python -m src.Naukri.naukri_stub --port 8766 --jobs 200 --questionnaire-rate 0.3
+    export NAUKRI_BASE_URL=http://127.0.0.1:8766
+"""
+import argparse
+import random
+import threading
+import time
+import urllib.parse
+
+from src.meta.stub_server import JSONHandler, StubServer
+
+APPLIED_MESSAGE = "You have successfully applied to this job."
+
+SKILLS = ["Python", "Django", "AWS", "Kafka", "React", "Node.js", "Java", "Spring Boot",
+          "Kubernetes", "SQL", "Go", "Machine Learning"]
+TITLES = ["Backend Engineer", "Software Engineer", "Python Developer", "Full Stack Developer",
+          "Data Engineer", "SDE II", "Senior Software Engineer", "Java Developer"]
+
+QUESTIONNAIRE = [
+    {"questionId": "exp", "questionName": "How many years of experience do you have in {skill}?",
+     "answerOption": {}},
+    {"questionId": "relocate", "questionName": "Are you willing to relocate to {location}?",
+     "answerOption": {"1": "Yes", "2": "No"}},
+    {"questionId": "notice", "questionName": "What is your notice period?",
+     "answerOption": {"1": "Immediate", "2": "15 days", "3": "30 days", "4": "More than 30 days"}},
+]
+
+
+def make_jobs(count, seed=None):
+    """Deterministic fake search results in the shape of Naukri's jobDetails."""
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(count):
+        minimum = rng.randint(0, 8)
+        jobs.append({
+            "jobId": f"{100000000000 + index}",
+            "title": rng.choice(TITLES),
+            "companyName": f"Company {index}",
+            "tagsAndSkills": ",".join(rng.sample(SKILLS, 4)),
+            "jdURL": f"/job-listings-{index}",
+            "experienceText": f"{minimum}-{minimum + rng.randint(2, 5)} Yrs",
+            "placeholders": [{"type": "location", "label": rng.choice(["Bengaluru", "Pune", "Remote"])}],
+        })
+    return jobs
+
+
+class NaukriStubServer(StubServer):
+    """Threaded HTTP server speaking the subset of Naukri's API the bot calls."""
+
+    def __init__(self, host="127.0.0.1", port=0, jobs=100, questionnaire_rate=0.3,
+                 latency=0.0, page_size=20, seed=None):
+        """
+        :param port: 0 picks a free port (see `url`)
+        :param jobs: number of jobs, or a list of job dicts, the searches return
+        :param questionnaire_rate: share of jobs that answer an apply with a questionnaire
+        :param latency: seconds every response is delayed by
+        """
+        self.jobs = jobs if isinstance(jobs, list) else make_jobs(jobs, seed)
+        self.latency = latency
+        self.page_size = page_size
+        rng = random.Random(seed)
+        self.needs_questionnaire = {job["jobId"] for job in self.jobs
+                                    if rng.random() < questionnaire_rate}
+        self.applied = set()
+        # strJobsarr of every apply request without answers, and jobs applied with answers
+        self.batches = []
+        self.answered = set()
+        self.session_version = 0
+        self.requests = {"login": 0, "search": 0, "apply": 0}
+        self._lock = threading.Lock()
+        super().__init__(host, port)
+
+    @property
+    def url(self):
+        """Base URL for NAUKRI_BASE_URL."""
+        return self.base_url
+
+    def tokens(self):
+        """The (nauk_at, NKWAP) pair the current login issues."""
+        return f"stub-access-token-{self.session_version}", f"stub-nkparam-{self.session_version}"
+
+    def expire_sessions(self):
+        """Invalidates issued tokens; requests using them get 401 until the next login."""
+        with self._lock:
+            self.session_version += 1
+
+    def _count(self, name):
+        with self._lock:
+            self.requests[name] += 1
+
+    def _questionnaire(self, job):
+        location = job["placeholders"][0]["label"]
+        skill = job["tagsAndSkills"].split(",")[0]
+        return [dict(question, questionId=f"{job['jobId']}_{question['questionId']}",
+                     questionName=question["questionName"].format(skill=skill, location=location))
+                for question in QUESTIONNAIRE]
+
+    def apply(self, job_ids, apply_data=None):
+        """The apply workflow: one result per requested job, in request order."""
+        apply_data = apply_data or {}
+        by_id = {job["jobId"]: job for job in self.jobs}
+        results = []
+        if not apply_data:
+            with self._lock:
+                self.batches.append([str(job_id) for job_id in job_ids])
+        for job_id in job_ids:
+            job = by_id.get(str(job_id))
+            if job is None:
+                results.append({"jobId": job_id, "message": "Job not found"})
+            elif job["jobId"] in self.needs_questionnaire and str(job_id) not in apply_data:
+                results.append({"jobId": job_id, "questionnaire": self._questionnaire(job)})
+            else:
+                with self._lock:
+                    self.applied.add(job["jobId"])
+                    if str(job_id) in apply_data:
+                        self.answered.add(job["jobId"])
+                results.append({"jobId": job_id, "message": APPLIED_MESSAGE})
+        return {"jobs": results}
+
+    def _handler(self):
+        server = self
+
+        class Handler(JSONHandler):
+            def do_GET(self):
+                time.sleep(server.latency)
+                parsed = urllib.parse.urlparse(self.path)
+                query = urllib.parse.parse_qs(parsed.query)
+                self._body()
+
+                if self.headers.get("nkparam") != server.tokens()[1]:
+                    return self._send(401, {"message": "Unauthorized"})
+                if parsed.path.startswith("/jobapi/v2/search/recom-jobs"):
+                    server._count("search")
+                    jobs = server.jobs[:server.page_size]
+                    return self._send(200, {"noOfJobs": len(jobs), "jobDetails": jobs})
+                if parsed.path.rstrip("/") == "/jobapi/v3/search":
+                    server._count("search")
+                    page_no = int(query.get("pageNo", ["1"])[0])
+                    size = int(query.get("noOfResults", [server.page_size])[0])
+                    jobs = server.jobs[(page_no - 1) * size:page_no * size]
+                    return self._send(200, {"noOfJobs": len(server.jobs), "jobDetails": jobs})
+                self._send(404, {"message": "Not found"})
+
+            def do_POST(self):
+                time.sleep(server.latency)
+                path = urllib.parse.urlparse(self.path).path
+                body = self._body()
+
+                if path == "/central-login-services/v1/login":
+                    server._count("login")
+                    if not body.get("username") or not body.get("password"):
+                        return self._send(401, {"message": "Invalid credentials"})
+                    access_token, nkparam = server.tokens()
+                    return self._send(200, {"cookies": [
+                        {"name": "nauk_at", "value": access_token},
+                        {"name": "NKWAP", "value": nkparam},
+                    ]})
+                if path.endswith("/apply-workflow/v1/apply"):
+                    server._count("apply")
+                    if self.headers.get("authorization") != f"ACCESSTOKEN = {server.tokens()[0]}":
+                        return self._send(401, {"message": "Unauthorized"})
+                    return self._send(200, server.apply(
+                        body.get("strJobsarr", []), body.get("applyData")))
+                self._send(404, {"message": "Not found"})
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Naukri API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--questionnaire-rate", type=float, default=0.3)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = NaukriStubServer(args.host, args.port, args.jobs, args.questionnaire_rate,
+                              args.latency, seed=args.seed)
+    print(f"Naukri stub listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
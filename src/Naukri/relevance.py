@@ -0,0 +1,154 @@
+"""Module imports"""
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+from dotenv import load_dotenv
+
+from src.meta.answer_cache import normalize_question
+from src.meta.resume_facts import canonical_skill, find_skills
+
+load_dotenv(override=True)
+
+_RANGE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-|to)\s*(\d+(?:\.\d+)?)")
+_TITLE_NOISE = {"senior", "sr", "junior", "jr", "lead", "ii", "iii", "i", "iv", "level",
+                "staff", "principal", "associate", "hiring", "urgent", "opening", "job"}
+
+
+# Tags and titles repeat across jobs, so their skill lookups are memoized
+@lru_cache(maxsize=8192)
+def _tag_skills(tag):
+    return tuple(find_skills(tag, strict=False) or [canonical_skill(tag)])
+
+
+@lru_cache(maxsize=8192)
+def _title_skills(title):
+    return tuple(find_skills(title))
+
+
+def job_skills(job):
+    """
+    Skills of a Naukri job: its comma separated tagsAndSkills (as canonical
+    skill names where the tag names a known skill) plus skills named in the title.
+    """
+    skills = []
+    for tag in str(job.get("tagsAndSkills") or "").split(","):
+        skills += _tag_skills(tag.strip().lower())
+    skills += _title_skills(str(job.get("title", "")))
+    return list(dict.fromkeys(skill for skill in skills if skill))
+
+
+def job_experience(job):
+    """:return: (min years, max years) asked for by the job, or None"""
+    if job.get("minimumExperience") is not None and job.get("maximumExperience") is not None:
+        return float(job["minimumExperience"]), float(job["maximumExperience"])
+    match = _RANGE.search(str(job.get("experienceText") or job.get("experience") or ""))
+    return (float(match.group(1)), float(match.group(2))) if match else None
+
+
+def title_tokens(text):
+    return {token for token in normalize_question(text) if token not in _TITLE_NOISE}
+
+
+class JobScorer:
+    """
+    Scores a page of jobs at once against the resume:
+
+    - skills: share of the job's skills (IDF weighted over the page, so skills
+      every job lists count less) that are on the resume
+    - title: whether the title shares a word with the searched designations
+      or a resume skill
+    - experience: 1 inside the job's range, falling off below it (and more
+      slowly above it)
+
+    The score is the weighted sum; jobs under `min_score` are dropped.
+    """
+
+    def __init__(self, resume_skills, years=None, designations=(), weights=(0.6, 0.2, 0.2),
+                 min_score=0.3, resume_text=""):
+        """
+        :param resume_skills: the candidate's skills (canonical names, see resume_facts)
+        :param years: the candidate's total experience, or None to ignore ranges
+        :param designations: searched titles, e.g. ["python developer"]
+        :param weights: (skills, title, experience) weights
+        :param resume_text: job skills outside the known skill list count as held
+                            when the resume mentions them
+        """
+        self.resume_skills = {canonical_skill(skill) for skill in resume_skills}
+        self.resume_text = " ".join(resume_text.lower().split())
+        self.years = years
+        self.title_terms = set().union(*(title_tokens(designation) for designation in designations)) \
+            | {token for skill in self.resume_skills for token in normalize_question(skill)}
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.min_score = min_score
+
+    @classmethod
+    def from_env(cls, facts, resume_text=""):
+        weights = [float(weight) for weight in
+                   os.getenv("NAUKRI_SCORE_WEIGHTS", "0.6,0.2,0.2").split(",")]
+        years = os.getenv("YEARS_OF_EXPERIENCE") or facts.get("total_years")
+        return cls(
+            resume_skills=facts.get("skills", []),
+            years=float(years) if years else None,
+            designations=[item.strip() for item in
+                          os.getenv("NAUKRI_DESIGNATION_COMPANY", "").split(",") if item.strip()],
+            weights=weights,
+            min_score=float(os.getenv("NAUKRI_MIN_SCORE", 0.3)),
+            resume_text=resume_text,
+        )
+
+    def _has(self, skill):
+        if skill in self.resume_skills:
+            return True
+        return bool(self.resume_text) and re.search(
+            r"(?<![a-z0-9])" + re.escape(skill) + r"(?![a-z0-9])", self.resume_text) is not None
+
+    def _skill_scores(self, skills_per_job):
+        vocabulary = {skill: index for index, skill in enumerate(
+            sorted({skill for skills in skills_per_job for skill in skills}))}
+        if not vocabulary:
+            return np.zeros(len(skills_per_job), dtype=np.float32)
+
+        matrix = np.zeros((len(skills_per_job), len(vocabulary)), dtype=np.float32)
+        for row, skills in enumerate(skills_per_job):
+            matrix[row, [vocabulary[skill] for skill in skills]] = 1.0
+
+        idf = np.log((1 + len(skills_per_job)) / (1 + matrix.sum(axis=0))) + 1
+        have = np.array([self._has(skill) for skill in vocabulary], dtype=np.float32)
+        weighted = matrix * idf
+        total = weighted.sum(axis=1)
+        return np.divide(weighted @ have, total, out=np.zeros_like(total), where=total > 0)
+
+    def _experience_scores(self, ranges):
+        if self.years is None:
+            return np.ones(len(ranges), dtype=np.float32)
+        known = np.array([bounds is not None for bounds in ranges])
+        low = np.array([bounds[0] if bounds else 0.0 for bounds in ranges], dtype=np.float32)
+        high = np.array([bounds[1] if bounds else 0.0 for bounds in ranges], dtype=np.float32)
+        under = np.clip(1 - (low - self.years) / 2, 0, 1)
+        over = np.clip(1 - (self.years - high) / 4, 0, 1)
+        scores = np.where(self.years < low, under, np.where(self.years > high, over, 1.0))
+        return np.where(known, scores, 1.0).astype(np.float32)
+
+    def scores(self, jobs):
+        """:return: (n, 4) array of [total, skills, title, experience] per job"""
+        if not jobs:
+            return np.zeros((0, 4), dtype=np.float32)
+        parts = np.column_stack([
+            self._skill_scores([job_skills(job) for job in jobs]),
+            np.array([bool(title_tokens(job.get("title", "")) & self.title_terms) for job in jobs],
+                     dtype=np.float32),
+            self._experience_scores([job_experience(job) for job in jobs]),
+        ])
+        return np.column_stack([parts @ self.weights, parts])
+
+    def rank(self, jobs):
+        """
+        :return: [(score, job)] for jobs scoring at least `min_score`, best first
+                 (ties keep the portal's order)
+        """
+        totals = self.scores(jobs)[:, 0] if jobs else []
+        order = np.argsort(-np.asarray(totals), kind="stable")
+        return [(float(totals[index]), jobs[index]) for index in order
+                if totals[index] >= self.min_score]
@@ -0,0 +1,85 @@
+"""Module imports"""
+import os
+import threading
+import urllib.parse
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+SEARCH = "/jobapi/v3/search"
+RECOMMENDED_JOBS = "/jobapi/v2/search/recom-jobs"
+
+
+def _slug(text):
+    return "-".join(text.strip().lower().split())
+
+
+def _split(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+class SearchPlanner:
+    """
+    Expands the configured designations and locations into one Naukri
+    search per (designation, location) pair, each with its own seoKey.
+    Without designations the plan is the single recommended-jobs feed.
+    Query URLs are built once per (query, page) and memoized.
+    """
+
+    def __init__(self, designations, locations=(), page_size=20):
+        self.page_size = page_size
+        self.queries = []
+        for designation in designations:
+            for location in locations or [None]:
+                self.queries.append({"designation": designation, "location": location})
+        if not self.queries:
+            self.queries.append({"designation": None, "location": None})
+        self._urls = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, page_size=20):
+        return cls(_split(os.getenv("NAUKRI_DESIGNATION_COMPANY")),
+                   _split(os.getenv("NAUKRI_LOCATION")), page_size)
+
+    @staticmethod
+    def paginated(query):
+        """The recommended-jobs feed has a single page."""
+        return query["designation"] is not None
+
+    @staticmethod
+    def describe(query):
+        if query["designation"] is None:
+            return "recommended jobs"
+        if query["location"] is None:
+            return f"'{query['designation']}'"
+        return f"'{query['designation']}' in {query['location']}"
+
+    def _build(self, query, page_no):
+        designation, location = query["designation"], query["location"]
+        if designation is None:
+            return RECOMMENDED_JOBS
+
+        keyword = {
+            "keyword": designation,
+            "pageNo": page_no,
+            "noOfResults": self.page_size,
+            "k": designation,
+            "searchType": "adv"
+        }
+        if location:
+            keyword["location"] = location
+            keyword["l"] = location
+            keyword["seoKey"] = f"{_slug(designation)}-jobs-in-{_slug(location)}"
+        else:
+            keyword["seoKey"] = f"{_slug(designation)}-jobs"
+        return f"{SEARCH}/?{urllib.parse.urlencode(keyword)}"
+
+    def url(self, query, page_no=1):
+        """:return: the path (with query string) for `page_no` of `query`"""
+        key = (query["designation"], query["location"], page_no)
+        with self._lock:
+            if key not in self._urls:
+                self._urls[key] = self._build(query, page_no)
+            return self._urls[key]
@@ -0,0 +1,209 @@
+"""Module imports"""
+import csv
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+STOPWORDS = {
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "with", "by", "and", "or",
+    "do", "does", "did", "you", "your", "have", "has", "had", "are", "is", "was", "be",
+    "how", "many", "much", "what", "which", "please", "kindly", "mention", "enter",
+    "provide", "total", "number", "any", "if", "so", "can", "will", "would", "i", "me",
+    "work", "relevant", "overall", "professional",
+}
+
+# Short forms recruiters use for the same concept
+SYNONYMS = {
+    "yrs": "year", "yr": "year", "exp": "experience", "experienced": "experience",
+    "ctc": "salary", "compensation": "salary", "np": "notice",
+}
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_NON_WORD = re.compile(r"[^a-z#+ ]+")
+_YES_NO = re.compile(
+    r"^\W*(?:do|does|did|have|has|had|are|is|was|were|am|can|could|will|would|should|shall)\b")
+
+
+def _stem(token):
+    if len(token) > 3 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def normalize_question(question):
+    """
+    Reduces a question to its content tokens: lower case, numbers folded to '#',
+    punctuation and filler words removed, plurals and short forms unified.
+    """
+    text = _NUMBER.sub(" # ", str(question).lower())
+    text = _NON_WORD.sub(" ", text)
+    tokens = []
+    for token in text.split():
+        token = SYNONYMS.get(token, token)
+        if token in STOPWORDS:
+            continue
+        tokens.append(_stem(token))
+    return tokens
+
+
+def question_signature(question):
+    """
+    What normalize_question folds away but an answer depends on: the numbers
+    in the question ("2+ years" vs "10+ years") and whether it is a yes/no
+    question ("Do you have ..." vs "How many years ...").
+    """
+    text = str(question).lower()
+    numbers = tuple(f"{float(number):g}" for number in _NUMBER.findall(text))
+    return numbers, "yes_no" if _YES_NO.match(text) else "open"
+
+
+def normalize_options(options):
+    """Order-insensitive key for an option set, given as a list or {id: label} dict."""
+    if not options:
+        return ""
+    values = options.values() if isinstance(options, dict) else options
+    return "|".join(sorted(" ".join(str(value).lower().split()) for value in values))
+
+
+class AnswerCache:
+    """
+    Answer store shared by every portal. Questions are looked up by exact
+    normalized text first, then through a TF-IDF index over the normalized
+    tokens so that reworded variants of a question reuse the same answer.
+    Answers for option questions are only reused for the same option set,
+    and answers are never reused across different numbers or between yes/no
+    and open questions (see question_signature).
+    """
+
+    FIELDS = ["Question", "Options", "Answer", "Portal"]
+
+    def __init__(self, file_path, threshold=0.8):
+        self.file_path = file_path
+        self.threshold = threshold
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = []  # [(tokens, options_key, signature, answer)]
+        self._exact = {}  # (normalized text, options_key, signature) -> entry index
+        self._postings = defaultdict(set)  # token -> entry indexes
+        self._doc_freq = Counter()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, mode="r", newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                options = json.loads(row["Options"]) if row.get("Options") else None
+                self._index(row["Question"], options, row["Answer"])
+
+    def _index(self, question, options, answer):
+        tokens = normalize_question(question)
+        key = (" ".join(tokens), normalize_options(options), question_signature(question))
+        if key in self._exact:
+            self._entries[self._exact[key]] = (tokens, key[1], key[2], answer)
+            return False
+
+        entry_id = len(self._entries)
+        self._entries.append((tokens, key[1], key[2], answer))
+        self._exact[key] = entry_id
+        for token in set(tokens):
+            self._postings[token].add(entry_id)
+            self._doc_freq[token] += 1
+        return True
+
+    def _vector(self, tokens):
+        total = len(self._entries) + 1
+        weights = {token: count * (math.log(total / (1 + self._doc_freq[token])) + 1)
+                   for token, count in Counter(tokens).items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        return {token: weight / norm for token, weight in weights.items()}
+
+    def _lookup(self, tokens, options_key, signature):
+        entry_id = self._exact.get((" ".join(tokens), options_key, signature))
+        if entry_id is not None:
+            return self._entries[entry_id][3], False
+
+        candidates = set()
+        for token in set(tokens):
+            candidates |= self._postings.get(token, set())
+
+        query = self._vector(tokens)
+        best_score, best_answer = 0.0, None
+        for candidate in candidates:
+            candidate_tokens, candidate_options, candidate_signature, answer = self._entries[candidate]
+            if candidate_options != options_key or candidate_signature != signature:
+                continue
+            vector = self._vector(candidate_tokens)
+            score = sum(weight * vector.get(token, 0.0)
+                        for token, weight in query.items())
+            if score > best_score:
+                best_score, best_answer = score, answer
+
+        if best_score >= self.threshold:
+            return best_answer, True
+        return None, False
+
+    def get(self, question, options=None):
+        """Returns the stored answer for `question` (or a near duplicate), else None."""
+        tokens = normalize_question(question)
+
+        with self._lock:
+            answer, fuzzy = self._lookup(
+                tokens, normalize_options(options), question_signature(question))
+            if answer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.fuzzy_hits += int(fuzzy)
+            return answer
+
+    def put(self, question, answer, options=None, portal=""):
+        if answer is None or isinstance(answer, (dict, list)) or not str(answer).strip():
+            return
+
+        with self._lock:
+            self._index(question, options, str(answer))
+            new_file = not os.path.exists(self.file_path)
+            with open(self.file_path, mode="a", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                if new_file:
+                    writer.writerow(self.FIELDS)
+                writer.writerow([question, json.dumps(options) if options else "",
+                                 str(answer), portal])
+
+    def import_csv(self, file_path, portal=""):
+        """Imports a legacy two-column Question,Answer file (e.g. LinkedIn's qa.csv)."""
+        if not os.path.exists(file_path):
+            return 0
+        with open(file_path, mode="r", newline="", encoding="utf-8") as file:
+            rows = [row for row in csv.reader(file)
+                    if len(row) == 2 and row != ["Question", "Answer"]]
+
+        imported = 0
+        for question, answer in rows:
+            if self._lookup(normalize_question(question), "",
+                            question_signature(question))[0] is None:
+                self.put(question, answer, portal=portal)
+                imported += 1
+        return imported
+
+    def stats(self):
+        return {"entries": len(self._entries), "hits": self.hits,
+                "fuzzy_hits": self.fuzzy_hits, "misses": self.misses}
+
+
+answer_cache = AnswerCache(
+    os.getenv("ANSWER_CACHE_FILE", "src/meta/answers.csv"),
+    threshold=float(os.getenv("ANSWER_CACHE_THRESHOLD", 0.8)),
+)
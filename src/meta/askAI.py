@@ -1,222 +1,559 @@
 import os
 from dotenv import load_dotenv
 # from src.meta.resume import resume_text
-from src.meta.get_resume_text import get_resume_text
-
-import time
-import requests
+from src.meta.get_resume_text import get_resume
+from src.meta.resume_facts import format_fact_sheet
+from src.meta.resume_index import ResumeIndex, chunk_resume
+from src.meta.answer_cache import answer_cache
+from src.meta.profile_rules import profile_rules
+from src.meta.llm_backends import LLMResponse, create_backend
+from src.meta.logger import get_logger
+from src.meta.rate_limiter import RateLimiter, RetryableError, NonRetryableError, backoff_delay
+from src.meta.singleflight import SingleFlight, prompt_key
+from src.meta.telemetry import telemetry
+
+import asyncio
+import contextvars
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv(override=True)
 
-resume_text = get_resume_text()
+log = get_logger("askAI")
 
-required_env_vars = {
-    "GEMINI_KEY": os.getenv("GEMINI_API_KEY")
-}
+# One bucket for every caller so throughput follows the real Gemini quota
+gemini_limiter = RateLimiter(int(os.getenv("GEMINI_RPM", 15)))
 
-missing_vars = [var for var, value in required_env_vars.items() if not value]
 
-if missing_vars:
-    raise ValueError(
-        f"Missing required environment variables: {', '.join(missing_vars)}")
-
-url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key=" + \
-    required_env_vars["GEMINI_KEY"]
+def _run_sync(coro):
+    """Runs `coro` to completion from synchronous code, even inside a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # keep the caller's telemetry context (portal, job id) in the worker thread
+        return pool.submit(contextvars.copy_context().run, asyncio.run, coro).result()
 
 
 class AI_Agent:
-    required_env_vars = {
-        "GENDER": os.getenv("GENDER"),
-        "NOTICE_PERIOD": os.getenv("NOTICE_PERIOD"),
-        "CURRENT_CTC": os.getenv("CURRENT_CTC"),
-        "EXPECTED_CTC": os.getenv("EXPECTED_CTC")
-    }
-
-    missing_vars = [var for var,
-                    value in required_env_vars.items() if not value]
-
-    if missing_vars:
-        raise ValueError(
-            f"Missing required environment variables: {', '.join(missing_vars)}")
-
-    if not resume_text:
-        raise AttributeError("Resume text not replaced")
-
-    GENDER = required_env_vars["GENDER"]
-    NOTICE_PERIOD = required_env_vars["NOTICE_PERIOD"]
-    CURRENT_CTC = required_env_vars["CURRENT_CTC"]
-    EXPECTED_CTC = required_env_vars["EXPECTED_CTC"]
-
-    def askAI(self, msg):
-        payload = json.dumps({
-            "contents": [
-                {
-                    "parts": [
-                        {
-                            "text": msg
-                        }
-                    ]
-                }
-            ]
-        })
-        headers = {
-            'Content-Type': 'application/json'
+    # Ask every question of a questionnaire in one structured prompt
+    BATCH_QUESTIONNAIRES = os.getenv(
+        "BATCH_QUESTIONNAIRES", "true").strip().lower() in ("1", "true", "yes")
+    # "retrieval": fact sheet plus the resume sections relevant to the question,
+    # "facts": the compact fact sheet only, "full": the whole resume text
+    RESUME_PROMPT_MODE = os.getenv("RESUME_PROMPT_MODE", "retrieval").strip().lower()
+    RESUME_TOP_K = int(os.getenv("RESUME_TOP_K", 3))
+    RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_TOKEN_BUDGET", 600))
+    RESUME_CHUNK_TOKENS = int(os.getenv("RESUME_CHUNK_TOKENS", 120))
+
+    def __init__(self, backend=None, limiter=None, max_retries=None, max_concurrency=None,
+                 cache=answer_cache, rules=profile_rules, resume=None):
+        """
+        :param backend: LLMBackend to send prompts to; built from LLM_BACKEND on first use
+        :param limiter: RateLimiter shared with other agents (defaults to gemini_limiter)
+        :param max_retries: attempts per prompt for retryable errors
+        :param max_concurrency: prompts in flight at once, across all threads and event loops
+        :param cache: AnswerCache consulted before asking, or None to always ask
+        :param rules: ProfileRuleEngine tried before the cache, or None to skip it
+        :param resume: {"text", "facts"} to use instead of the UPLOAD_RESUME PDF
+        """
+        required_env_vars = {
+            "GENDER": os.getenv("GENDER"),
+            "NOTICE_PERIOD": os.getenv("NOTICE_PERIOD"),
+            "CURRENT_CTC": os.getenv("CURRENT_CTC"),
+            "EXPECTED_CTC": os.getenv("EXPECTED_CTC")
         }
 
-        response = requests.request("POST", url, headers=headers, data=payload)
-        response = json.loads(response.text)
-
-        return response["candidates"][0]["content"]["parts"][0]["text"]
-
-    def create_questionnaires_response(self, questionnaires, logger):
-        response = {}
-        max_retries = 5
-        retry_delay = 30
-
-        for attempt in range(max_retries):
+        missing_vars = [var for var,
+                        value in required_env_vars.items() if not value]
+
+        if missing_vars:
+            raise ValueError(
+                f"Missing required environment variables: {', '.join(missing_vars)}")
+
+        self.GENDER = required_env_vars["GENDER"]
+        self.NOTICE_PERIOD = required_env_vars["NOTICE_PERIOD"]
+        self.CURRENT_CTC = required_env_vars["CURRENT_CTC"]
+        self.EXPECTED_CTC = required_env_vars["EXPECTED_CTC"]
+
+        self._resume = resume
+        self._resume_index = None
+        self._resume_lock = threading.Lock()
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+        self.cache = cache
+        self.rules = rules
+        self.limiter = limiter or gemini_limiter
+        self.max_retries = max_retries or int(os.getenv("GEMINI_MAX_RETRIES", 5))
+        self.backoff_base = float(os.getenv("GEMINI_BACKOFF_BASE", 2))
+        self.backoff_cap = float(os.getenv("GEMINI_BACKOFF_CAP", 60))
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("GEMINI_MAX_CONCURRENCY", 4))
+        # A thread semaphore, not an asyncio one: every sync call runs its own
+        # event loop, so only this holds the limit across the answer-pool threads
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        # identical prompts asked at the same time share one request
+        self.singleflight = SingleFlight()
+
+    def _get_backend(self):
+        # The API key is only needed once a prompt is actually sent
+        with self._backend_lock:
+            if self._backend is None:
+                self._backend = create_backend()
+        return self._backend
+
+    def _get_resume(self):
+        # Reading the resume is the slowest part of startup; only pay for it once a prompt needs it
+        with self._resume_lock:
+            if self._resume is None:
+                start = time.perf_counter()
+                resume = get_resume()
+                if not resume["text"]:
+                    raise AttributeError("Resume text not replaced")
+                self._resume = resume
+                log.info("📄 Resume loaded in %.2fs", time.perf_counter() - start)
+        return self._resume
+
+    @property
+    def resume_text(self):
+        return self._get_resume()["text"]
+
+    @property
+    def resume_facts(self):
+        return self._get_resume()["facts"]
+
+    @property
+    def resume_index(self):
+        resume = self._get_resume()
+        with self._resume_lock:
+            if self._resume_index is None:
+                self._resume_index = ResumeIndex(
+                    chunk_resume(resume["text"], self.RESUME_CHUNK_TOKENS))
+        return self._resume_index
+
+    def resume_context(self, *questions):
+        """
+        What a prompt is given of the resume (see RESUME_PROMPT_MODE). Falls
+        back to the full text when the fact sheet came out empty.
+        """
+        facts = format_fact_sheet(self.resume_facts)
+        if self.RESUME_PROMPT_MODE == "full" or not facts:
+            return self.resume_text
+        if self.RESUME_PROMPT_MODE == "facts" or not questions:
+            return facts
+        return self.resume_index.context(
+            questions, header=facts, k=self.RESUME_TOP_K, token_budget=self.RESUME_TOKEN_BUDGET)
+
+    @property
+    def last_latency(self):
+        return self._get_backend().last_latency
+
+    def close(self):
+        if self._backend is not None:
+            self._backend.close()
+
+    def _send(self, msg, json_mode=False):
+        """Waits for a free slot and a rate-limit token, then posts the prompt."""
+        with self._slots:
+            self.limiter.acquire()
+            return self._post(msg, json_mode)
+
+    def askAI(self, msg, json_mode=False):
+        led = []
+
+        def call():
+            led.append(True)
+            return self._send(msg, json_mode)
+
+        start = time.perf_counter()
+        response = self.singleflight.do(prompt_key(msg, json_mode), call)
+        self._record("prompt", "", msg, response, start, coalesced=not led)
+        return response
+
+    async def aaskAI(self, msg, json_mode=False):
+        """:return: the LLMResponse; `coalesced` tells whether another caller's request was shared"""
+        led = []
+
+        async def call():
+            led.append(True)
+            return await asyncio.to_thread(self._send, msg, json_mode)
+
+        response = await self.singleflight.ado(prompt_key(msg, json_mode), call)
+        if not led:
+            response = LLMResponse(response, getattr(response, "usage", None),
+                                   getattr(response, "latency", None))
+            response.coalesced = True
+        return response
+
+    def _post(self, msg, json_mode=False):
+        try:
+            text = self._get_backend().generate(msg, json_mode)
+        except RetryableError as e:
+            if e.status_code == 429:
+                self.limiter.on_throttle(e.retry_after)
+            raise
+        self.limiter.on_success()
+        return text
+
+    @staticmethod
+    def _record(kind, label, prompt, response, start, retries=0, coalesced=False, ok=True):
+        usage = getattr(response, "usage", {}) or {}
+        telemetry.record(
+            kind, label=label,
+            prompt_chars=len(prompt),
+            response_chars=len(response or ""),
+            prompt_tokens=usage.get("prompt"),
+            response_tokens=usage.get("response"),
+            latency=time.perf_counter() - start,
+            connect=(getattr(response, "latency", {}) or {}).get("connect", 0.0),
+            retries=retries,
+            coalesced=coalesced or getattr(response, "coalesced", False),
+            ok=ok,
+        )
+
+    async def _with_retries(self, prompt, logger, kind, label="", json_mode=False):
+        """
+        Sends `prompt`, retrying RetryableErrors with jittered exponential backoff.
+        Waits requested through Retry-After are served by the shared limiter.
+        The call (all attempts) is recorded in telemetry under `kind`.
+        """
+        start = time.perf_counter()
+        for attempt in range(self.max_retries):
             try:
-                for questionnaire in questionnaires:
-                    question_id = questionnaire["questionId"]
-                    question_name = questionnaire["questionName"]
-                    response_options = questionnaire.get("answerOption", {})
-
-                    command = f"""
-                    - answer in minimum possible words as I am pasting the same for text box.
-                    - based upon my resume, answer the question very precisely.
-                    - if there are values in answerOptions, return me the exact value to the correct answer associated.
-                    - NOTE: Prepare each question's answer exactly as per my resume. The experience values can be more but NEVER less as per my resume.
-                    - question is: '{question_name}'
-                    - answerOptions is: {response_options}
-                    - if required my gender is {self.GENDER}
-                    - My current salary is: {self.CURRENT_CTC}
-                    - My Salary expectation is: {self.EXPECTED_CTC}
-                    - My Notice period is: {self.NOTICE_PERIOD}
-                    - resume is: {resume_text}
-                    """
-
-                    questionnaire_response = self.askAI(
-                        command).replace("\n", "")
-
-                    if response_options:
-                        response[question_id] = [questionnaire_response]
-                    else:
-                        response[question_id] = questionnaire_response
-
-                    time.sleep(2)
-
-                return response  # Return response if successful
-
-            except Exception as e:
+                response = await self.aaskAI(prompt, json_mode)
+            except NonRetryableError:
+                self._record(kind, label, prompt, None, start, attempt, ok=False)
+                raise
+            except RetryableError as e:
                 logger.error(
-                    f"❌ Error in processing questionnaires (Attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"🔄 Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(
-                        "❌ Max retries reached. Skipping questionnaire processing.")
-                    return {}  # Return empty response after max retries
-
-    def answer_questions(self, question, logger, options=None):
+                    f"❌ Gemini call failed (Attempt {attempt + 1}/{self.max_retries}): {e}")
+                if attempt == self.max_retries - 1:
+                    self._record(kind, label, prompt, None, start, attempt, ok=False)
+                    raise
+                delay = 0 if e.retry_after is not None else backoff_delay(
+                    attempt, self.backoff_base, self.backoff_cap)
+                logger.info(f"🔄 Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+            else:
+                self._record(kind, label, prompt, response, start, attempt)
+                return response
+
+    @staticmethod
+    def _option_values(options):
+        """Naukri sends answerOption either as a list or as an {id: label} dict."""
+        if isinstance(options, dict):
+            return [str(value) for value in options.values()]
+        return [str(value) for value in options or []]
+
+    @staticmethod
+    def _parse_json_answer(text):
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            text = text[text.find("\n") + 1:] if "\n" in text else text
+        return json.loads(text)
+
+    async def _ask_questionnaire_batch(self, questionnaires, logger):
+        """
+        Asks all questions in a single JSON-mode prompt.
+
+        :return: {questionId (str): answer (str)} for every answer that parsed
+        """
+        questions = [
+            {
+                "questionId": str(questionnaire["questionId"]),
+                "question": questionnaire["questionName"],
+                "answerOptions": self._option_values(questionnaire.get("answerOption"))
+            }
+            for questionnaire in questionnaires
+        ]
+
+        command = f"""
+        - You are filling a job application questionnaire on my behalf.
+        - Answer every question below in minimum possible words as I am pasting the answers into text boxes.
+        - based upon my resume, answer each question very precisely.
+        - if a question has answerOptions, the answer MUST be the exact text of one of those options.
+        - NOTE: Prepare each question's answer exactly as per my resume. The experience values can be more but NEVER less as per my resume.
+        - if required my gender is {self.GENDER}
+        - My current salary is: {self.CURRENT_CTC}
+        - My Salary expectation is: {self.EXPECTED_CTC}
+        - My Notice period is: {self.NOTICE_PERIOD}
+        - Respond ONLY with a JSON object mapping each questionId to its answer string.
+        - questions are: {json.dumps(questions, ensure_ascii=False)}
+        - resume is: {self.resume_context(*(question["question"] for question in questions))}
+        """
+
+        parsed = self._parse_json_answer(await self._with_retries(
+            command, logger, "questionnaire_batch",
+            label=" | ".join(question["question"] for question in questions), json_mode=True))
+
+        # Tolerate a list of {"questionId": ..., "answer": ...} as well
+        if isinstance(parsed, list):
+            parsed = {str(item.get("questionId")): item.get("answer")
+                      for item in parsed if isinstance(item, dict)}
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Unexpected batch answer format: {parsed!r}")
+
+        return {str(question_id): str(answer).replace("\n", "").strip()
+                for question_id, answer in parsed.items()
+                if answer is not None and str(answer).strip()}
+
+    async def _create_questionnaires_response_batched(self, questionnaires, logger):
         response = {}
-        max_retries = 5
-        retry_delay = 30
+        pending = list(questionnaires)
+        max_retries = self.max_retries
 
         for attempt in range(max_retries):
             try:
-                command = f"""
-                    You are generating precise and concise answers for LinkedIn job application questionnaires. Follow the instructions strictly:
-
-                    1. **Experience Questions:**
-                    - NEVER return 0 years or less than 3 years of experience.
-                    - If applicable, use the actual experience from the resume, but NEVER below 3 years.
-                    - You may round up, but do not exaggerate unrealistically.
-
-                    2. **Answer Format:**
-                    - Provide the shortest possible answer suitable for direct input into a text/ numerical box.
-                    - Do NOT include any explanation, greetings, yes/ no (if not required) or additional context—just the answer.
-                    - If asked for number, do not provide any text, just the number.
-
-                    3. **AnswerOptions Handling:**
-                    - If `answerOptions` are provided, return ONLY the exact matching value from the list that best fits the answer.
-                    - Do NOT modify or approximate the options—select the most accurate one from the list.
-                    - And, I am ready to move to the location of the job, so always return yes
-
-                    4. **Answer Precision:**
-                    - Base your answer **strictly** on the content of the provided resume.
-                    - If the resume supports a higher value than asked, use it. Never return less than what’s on the resume.
-
-                    5. **Additional Information:**
-                    - Gender: {self.GENDER}
-                    - Current CTC: {self.CURRENT_CTC}
-                    - Expected CTC: {self.EXPECTED_CTC}
-                    - Notice Period: {self.NOTICE_PERIOD}
-
-                    6. **Response Rules:**
-                    - Do NOT return anything except the answer.
-                    - Do NOT rephrase or restate the question.
-                    - revisit the answer and check if there are no additional words or phrases or characters (including yes or no) that are not required.
-
-                    Now answer the following:
-
-                    - **Question:** '{question}'  
-                    {f'- **Answer Options**: {options}' if options else ''}  
-                    - **Resume**: {resume_text}
-                    """
-
-                questionnaire_response = self.askAI(
-                    command).replace("\n", "")
-
-                time.sleep(2)
-
-                return questionnaire_response  # Return response if successful
-
-            except Exception as e:
+                answers = await self._ask_questionnaire_batch(pending, logger)
+            except ValueError as e:
+                # The model answered but not in the JSON shape we asked for
                 logger.error(
-                    f"❌ Error in processing questionnaires (Attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"🔄 Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(
-                        "❌ Max retries reached. Skipping questionnaire processing.")
-                    return {}  # Return empty response after max retries
-                
-    def create_message(self,user_name, profile, logger):
-        response = {}
-        max_retries = 5
-        retry_delay = 30
-
-        for attempt in range(max_retries):
-            try:
-                command = f"""
-                        - I am sending a connection request to a user on LinkedIn.
-                        - Generate a message for the connection request in less than 200 characters.
-                        - The message should be polite and professional, inclined to how I am interested in connecting with the user.
-                        - My name is: {os.getenv('NAME')}
-                        - The person I am messaging is: {user_name}, if this name is missing, just address with Hi!
-                        {f'- I am attaching the person(s) information whom I am messaging.:{profile}.' if profile else ''}
-                        - NOTE: not to leave any replaceable items as I am going to copy and paste exactly as it is.
-                        """
-
-                questionnaire_response = self.askAI(
-                    command).replace("\n", "")
-
-                time.sleep(2)
-
-                return questionnaire_response  # Return response if successful
-
-            except Exception as e:
+                    f"❌ Could not parse questionnaire answers (Attempt {attempt + 1}/{max_retries}): {e}")
+                answers = {}
+            except (RetryableError, NonRetryableError) as e:
                 logger.error(
-                    f"❌ Error in processing questionnaires (Attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"🔄 Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    f"❌ Error in processing questionnaires: {e}. Skipping questionnaire processing.")
+                return {}
+
+            for questionnaire in pending:
+                question_id = questionnaire["questionId"]
+                answer = answers.get(str(question_id))
+                if answer is None:
+                    continue
+
+                option_values = self._option_values(
+                    questionnaire.get("answerOption"))
+                if option_values:
+                    # Snap case/whitespace differences back to the exact option text
+                    match = next((value for value in option_values
+                                  if value.strip().lower() == answer.lower()), None)
+                    if match is None:
+                        continue
+                    response[question_id] = [match]
                 else:
-                    logger.error(
-                        "❌ Max retries reached. Skipping questionnaire processing.")
-                    return {}  # Return empty response after max retries
+                    response[question_id] = answer
+
+            pending = [questionnaire for questionnaire in pending
+                       if questionnaire["questionId"] not in response]
+            if not pending:
+                return response
+
+            if attempt < max_retries - 1:
+                logger.info(
+                    f"🔄 {len(pending)} question(s) unanswered, retrying only those...")
+
+        logger.error(
+            "❌ Max retries reached. Skipping questionnaire processing.")
+        return {}  # Return empty response after max retries
+
+    def create_questionnaires_response(self, questionnaires, logger, batched=None):
+        return _run_sync(self.acreate_questionnaires_response(questionnaires, logger, batched))
+
+    def stats(self):
+        return {
+            "rules": self.rules.stats() if self.rules else {},
+            "cache": self.cache.stats() if self.cache else {},
+            "limiter": self.limiter.stats(),
+            "singleflight": self.singleflight.stats(),
+        }
 
+    async def acreate_questionnaires_response(self, questionnaires, logger, batched=None):
+        response = {}
+        remaining = []
+        ruled = 0
+        for questionnaire in questionnaires:
+            options = questionnaire.get("answerOption")
+            # Profile questions are answered locally, then known questions from the cache
+            known = self.rules.answer(
+                questionnaire["questionName"], options) if self.rules else None
+            if known is not None:
+                ruled += 1
+                telemetry.record_hit("rule", label=questionnaire["questionName"])
+            elif self.cache:
+                known = self.cache.get(questionnaire["questionName"], options)
+                if known is not None:
+                    telemetry.record_hit("cache", label=questionnaire["questionName"])
+
+            if known is None:
+                remaining.append(questionnaire)
+            else:
+                response[questionnaire["questionId"]] = [known] if options else known
+
+        if response:
+            logger.info(
+                f"💾 {len(response)}/{len(questionnaires)} question(s) answered locally "
+                f"({ruled} by profile rules, {len(response) - ruled} from cache)")
+        if not remaining:
+            return response
+
+        if batched is None:
+            batched = self.BATCH_QUESTIONNAIRES
+        if batched:
+            answers = await self._create_questionnaires_response_batched(remaining, logger)
+        else:
+            answers = await self._create_questionnaires_response_serial(remaining, logger)
+
+        if not answers:
+            return {}
+
+        for questionnaire in remaining if self.cache else []:
+            answer = answers.get(questionnaire["questionId"])
+            if isinstance(answer, list):
+                answer = answer[0] if answer else None
+            self.cache.put(questionnaire["questionName"], answer,
+                           questionnaire.get("answerOption"), portal="naukri")
+
+        response.update(answers)
+        return response
+
+    async def _ask_questionnaire(self, questionnaire, logger):
+        question_name = questionnaire["questionName"]
+        response_options = questionnaire.get("answerOption", {})
+
+        command = f"""
+        - answer in minimum possible words as I am pasting the same for text box.
+        - based upon my resume, answer the question very precisely.
+        - if there are values in answerOptions, return me the exact value to the correct answer associated.
+        - NOTE: Prepare each question's answer exactly as per my resume. The experience values can be more but NEVER less as per my resume.
+        - question is: '{question_name}'
+        - answerOptions is: {response_options}
+        - if required my gender is {self.GENDER}
+        - My current salary is: {self.CURRENT_CTC}
+        - My Salary expectation is: {self.EXPECTED_CTC}
+        - My Notice period is: {self.NOTICE_PERIOD}
+        - resume is: {self.resume_context(question_name)}
+        """
+
+        # Only the failing question is retried, not the whole questionnaire
+        questionnaire_response = (await self._with_retries(
+            command, logger, "question", label=question_name)).replace("\n", "")
+
+        if response_options:
+            return [questionnaire_response]
+        return questionnaire_response
+
+    async def _create_questionnaires_response_serial(self, questionnaires, logger):
+        """One prompt per question; the questions are asked concurrently."""
+        try:
+            answers = await asyncio.gather(
+                *(self._ask_questionnaire(questionnaire, logger) for questionnaire in questionnaires))
+        except (RetryableError, NonRetryableError) as e:
+            logger.error(
+                f"❌ Error in processing questionnaires: {e}. Skipping questionnaire processing.")
+            return {}  # Return empty response after max retries
+
+        return {questionnaire["questionId"]: answer
+                for questionnaire, answer in zip(questionnaires, answers)}
 
-ai_agent = AI_Agent()
+    def answer_questions(self, question, logger, options=None):
+        return _run_sync(self.aanswer_questions(question, logger, options))
+
+    def answer_many(self, questions, logger, options=None):
+        """
+        Answers several independent questions concurrently.
+
+        :param options: optional list of answer options, aligned with `questions`
+        :return: list of answers in the same order as `questions`
+        """
+        return _run_sync(self.aanswer_many(questions, logger, options))
+
+    async def aanswer_many(self, questions, logger, options=None):
+        options = options or [None] * len(questions)
+        return list(await asyncio.gather(
+            *(self.aanswer_questions(question, logger, question_options)
+              for question, question_options in zip(questions, options))))
+
+    async def aanswer_questions(self, question, logger, options=None):
+        command = f"""
+            You are generating precise and concise answers for LinkedIn job application questionnaires. Follow the instructions strictly:
+
+            1. **Experience Questions:**
+            - NEVER return 0 years or less than 3 years of experience.
+            - If applicable, use the actual experience from the resume, but NEVER below 3 years.
+            - You may round up, but do not exaggerate unrealistically.
+
+            2. **Answer Format:**
+            - Provide the shortest possible answer suitable for direct input into a text/ numerical box.
+            - Do NOT include any explanation, greetings, yes/ no (if not required) or additional context—just the answer.
+            - If asked for number, do not provide any text, just the number.
+
+            3. **AnswerOptions Handling:**
+            - If `answerOptions` are provided, return ONLY the exact matching value from the list that best fits the answer.
+            - Do NOT modify or approximate the options—select the most accurate one from the list.
+            - And, I am ready to move to the location of the job, so always return yes
+
+            4. **Answer Precision:**
+            - Base your answer **strictly** on the content of the provided resume.
+            - If the resume supports a higher value than asked, use it. Never return less than what’s on the resume.
+
+            5. **Additional Information:**
+            - Gender: {self.GENDER}
+            - Current CTC: {self.CURRENT_CTC}
+            - Expected CTC: {self.EXPECTED_CTC}
+            - Notice Period: {self.NOTICE_PERIOD}
+
+            6. **Response Rules:**
+            - Do NOT return anything except the answer.
+            - Do NOT rephrase or restate the question.
+            - revisit the answer and check if there are no additional words or phrases or characters (including yes or no) that are not required.
+
+            Now answer the following:
+
+            - **Question:** '{question}'  
+            {f'- **Answer Options**: {options}' if options else ''}  
+            - **Resume**: {self.resume_context(question)}
+            """
+
+        try:
+            return (await self._with_retries(
+                command, logger, "question", label=question)).replace("\n", "")
+        except (RetryableError, NonRetryableError) as e:
+            logger.error(
+                f"❌ Error in processing questionnaires: {e}. Skipping questionnaire processing.")
+            return {}  # Return empty response after max retries
+                
+    def create_message(self,user_name, profile, logger):
+        return _run_sync(self.acreate_message(user_name, profile, logger))
+
+    async def acreate_message(self, user_name, profile, logger):
+        command = f"""
+                - I am sending a connection request to a user on LinkedIn.
+                - Generate a message for the connection request in less than 200 characters.
+                - The message should be polite and professional, inclined to how I am interested in connecting with the user.
+                - My name is: {os.getenv('NAME')}
+                - The person I am messaging is: {user_name}, if this name is missing, just address with Hi!
+                {f'- I am attaching the person(s) information whom I am messaging.:{profile}.' if profile else ''}
+                - NOTE: not to leave any replaceable items as I am going to copy and paste exactly as it is.
+                """
+
+        try:
+            return (await self._with_retries(
+                command, logger, "message", label=user_name)).replace("\n", "")
+        except (RetryableError, NonRetryableError) as e:
+            logger.error(
+                f"❌ Error in processing questionnaires: {e}. Skipping questionnaire processing.")
+            return {}  # Return empty response after max retries
+
+
+_ai_agent = None
+_ai_agent_lock = threading.Lock()
+
+
+def get_ai_agent():
+    """Returns the shared AI_Agent, creating it on first use."""
+    global _ai_agent
+    with _ai_agent_lock:
+        if _ai_agent is None:
+            start = time.perf_counter()
+            _ai_agent = AI_Agent()
+            log.info("🧠 AI agent ready in %.3fs", time.perf_counter() - start)
+    return _ai_agent
+
+
+def existing_ai_agent():
+    """Returns the shared AI_Agent if something has used it, else None (never creates it)."""
+    return _ai_agent
@@ -1,20 +1,91 @@
+import hashlib
+import json
 import os
-import fitz  # PyMuPDF
+import threading
 from dotenv import load_dotenv
 from pathlib import Path
 
+from src.meta.logger import get_logger
+from src.meta.resume_facts import FACTS_VERSION, as_of, build_fact_sheet
+
+log = get_logger("resume")
+
+_resume = None
+_resume_lock = threading.Lock()
+
+
 def extract_text_from_pdf(pdf_path):
-    text = ""
+    import fitz  # PyMuPDF, imported here as it is only needed once the resume is read
     with fitz.open(pdf_path) as doc:
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text += page.get_text()
-    return text
+        return "".join(page.get_text() for page in doc)
 
-def get_resume_text():
+
+def resume_path():
     load_dotenv(override=True)
     # PROJECT_ROOT = Path(__file__).resolve().parent
     PROJECT_ROOT = Path().resolve()
-    print("PROJECT_ROOT: ", PROJECT_ROOT)
-    pdf_path = str(PROJECT_ROOT / os.getenv("UPLOAD_RESUME", ""))
-    return extract_text_from_pdf(pdf_path)
\ No newline at end of file
+    return str(PROJECT_ROOT / os.getenv("UPLOAD_RESUME", ""))
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_resume(pdf_path=None, cache_file=None, today=None):
+    """
+    Returns {"hash", "text", "facts"} for the resume PDF.
+
+    The extracted text and fact sheet are cached on disk (RESUME_CACHE_FILE)
+    under the SHA-256 of the PDF, so the PDF is only parsed again when its
+    contents change. The fact sheet is also rebuilt (from the cached text)
+    once a month, as years of ongoing roles grow.
+    """
+    pdf_path = pdf_path or resume_path()
+    cache_file = cache_file or os.getenv("RESUME_CACHE_FILE", "src/meta/resume_cache.json")
+    content_hash = file_hash(pdf_path)
+
+    text = None
+    try:
+        with open(cache_file, encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached.get("hash") == content_hash:
+            facts = cached.get("facts", {})
+            if facts.get("version") == FACTS_VERSION and facts.get("as_of") == as_of(today):
+                return cached
+            text = cached.get("text")
+    except (OSError, ValueError):
+        pass
+
+    if text is None:
+        text = extract_text_from_pdf(pdf_path)
+    resume = {"hash": content_hash, "text": text, "facts": build_fact_sheet(text, today)}
+    try:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as file:
+            json.dump(resume, file, ensure_ascii=False)
+    except OSError as e:
+        log.warning(f"⚠️ Could not write resume cache {cache_file}: {e}")
+    log.info(f"📄 Resume parsed and cached ({len(text)} chars, "
+             f"{len(resume['facts']['skills'])} skills)")
+    return resume
+
+
+def get_resume():
+    """The current resume, loaded once per process."""
+    global _resume
+    with _resume_lock:
+        if _resume is None:
+            _resume = load_resume()
+    return _resume
+
+
+def get_resume_text():
+    return get_resume()["text"]
+
+
+def get_resume_facts():
+    return get_resume()["facts"]
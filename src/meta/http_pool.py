@@ -0,0 +1,84 @@
+"""Module imports"""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class _ConnectTimer(threading.local):
+    """Per-thread accumulator of time spent opening TCP/TLS connections."""
+    seconds = 0.0
+    opened = 0
+
+
+connect_timer = _ConnectTimer()
+
+
+def reset_connect_timer():
+    connect_timer.seconds = 0.0
+    connect_timer.opened = 0
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds += time.perf_counter() - start
+            connect_timer.opened += 1
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds += time.perf_counter() - start
+            connect_timer.opened += 1
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections record how long the TCP+TLS handshake took,
+    so callers can tell connect latency apart from server response latency.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def build_session(pool_size=10, headers=None, session=None):
+    """
+    Creates a keep-alive session backed by a connection pool of `pool_size`.
+
+    :param pool_size: Maximum number of connections kept open per host
+    :param headers: Default headers sent with every request
+    :param session: Session (e.g. a PortalSession) to mount the pool on; a new
+                    requests.Session by default
+    :return: requests.Session
+    """
+    session = session if session is not None else requests.Session()
+    adapter = PooledHTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, pool_block=False)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -0,0 +1,95 @@
+"""Module imports"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+APPLIED = "applied"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+class JobLedger:
+    """
+    On-disk record of every job a bot applied to, failed on or skipped,
+    keyed by (portal, job id). A portal's entries are read into memory on
+    first use, so checking a job before any apply or LLM work is a dict
+    lookup; every outcome is written through to SQLite right away.
+    """
+
+    def __init__(self, db_path, retry_failed=False):
+        """
+        :param db_path: SQLite file, created if missing
+        :param retry_failed: let jobs whose last attempt failed be tried again
+        """
+        self.db_path = db_path
+        self.retry_failed = retry_failed
+        self._lock = threading.Lock()
+        self._connection = None
+        self._known = {}  # portal -> {job id: outcome}
+
+    def _connect(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "portal TEXT NOT NULL, job_id TEXT NOT NULL, outcome TEXT NOT NULL, "
+                "detail TEXT, updated_at TEXT NOT NULL, PRIMARY KEY (portal, job_id))")
+            self._connection.commit()
+        return self._connection
+
+    def _portal(self, portal):
+        if portal not in self._known:
+            rows = self._connect().execute(
+                "SELECT job_id, outcome FROM jobs WHERE portal = ?", (portal,))
+            self._known[portal] = dict(rows.fetchall())
+        return self._known[portal]
+
+    def outcome(self, portal, job_id):
+        """:return: the last recorded outcome for the job, or None if never seen"""
+        with self._lock:
+            return self._portal(portal).get(str(job_id))
+
+    def seen(self, portal, job_id):
+        """True when the job should not be attempted again."""
+        outcome = self.outcome(portal, job_id)
+        if outcome is None:
+            return False
+        return not (self.retry_failed and outcome == FAILED)
+
+    def unseen(self, portal, jobs, key):
+        """:return: the jobs (in order) not yet in the ledger, `key(job)` giving the job id"""
+        return [job for job in jobs if not self.seen(portal, key(job))]
+
+    def record(self, portal, job_id, outcome, detail=""):
+        with self._lock:
+            self._portal(portal)[str(job_id)] = outcome
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO jobs (portal, job_id, outcome, detail, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (portal, str(job_id), outcome, detail,
+                 datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            connection.commit()
+
+    def stats(self, portal):
+        with self._lock:
+            outcomes = list(self._portal(portal).values())
+        return {outcome: outcomes.count(outcome) for outcome in set(outcomes)}
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+ledger = JobLedger(
+    os.getenv("LEDGER_DB", "src/meta/ledger.sqlite3"),
+    retry_failed=os.getenv("LEDGER_RETRY_FAILED", "false").strip().lower() in ("1", "true", "yes"),
+)
@@ -0,0 +1,183 @@
+"""Module imports"""
+import json
+import os
+import threading
+import time
+
+import requests
+from dotenv import load_dotenv
+
+from src.meta.http_pool import build_session, connect_timer, reset_connect_timer
+from src.meta.logger import get_logger
+from src.meta.rate_limiter import RetryableError, NonRetryableError, parse_retry_after
+
+load_dotenv(override=True)
+
+log = get_logger("askAI")
+
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
+STANDIN_API_URL = "http://127.0.0.1:8765/v1beta/models/standin:generateContent"
+
+
+class LLMResponse(str):
+    """
+    The model's text answer, carrying the call's token `usage`
+    ({"prompt": n, "response": n}, empty if the backend does not report it)
+    and `latency` so callers sharing a backend across threads get their own.
+    `coalesced` is set on copies handed to callers that shared another
+    caller's in-flight request.
+    """
+
+    def __new__(cls, text, usage=None, latency=None):
+        response = super().__new__(cls, text)
+        response.usage = usage or {}
+        response.latency = latency or {}
+        response.coalesced = False
+        return response
+
+
+class LLMBackend:
+    """
+    Turns a prompt into the model's text answer (an LLMResponse).
+
+    Implementations raise RetryableError for transient failures (network, 5xx,
+    429 with its Retry-After) and NonRetryableError for everything else, and
+    keep the latency of their last call in `last_latency`.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.last_latency = {}
+
+    def generate(self, prompt, json_mode=False):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini generateContent over a pooled keep-alive session."""
+
+    name = "gemini"
+
+    def __init__(self, api_url=None, api_key=None, pool_size=None, connect_timeout=None,
+                 read_timeout=None):
+        """
+        :param api_url: generateContent endpoint
+        :param api_key: Gemini API key, defaults to GEMINI_API_KEY
+        :param pool_size: keep-alive connections held open to the endpoint
+        :param connect_timeout: seconds allowed for the TCP+TLS handshake
+        :param read_timeout: seconds allowed for the model to answer
+        """
+        super().__init__()
+        api_key = api_key or os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("Missing required environment variables: GEMINI_API_KEY")
+
+        self.url = (api_url or os.getenv("GEMINI_API_URL", GEMINI_API_URL)) + "?key=" + api_key
+        self.pool_size = pool_size or int(os.getenv("GEMINI_POOL_SIZE", 10))
+        self.timeout = (
+            connect_timeout or float(os.getenv("GEMINI_CONNECT_TIMEOUT", 5)),
+            read_timeout or float(os.getenv("GEMINI_READ_TIMEOUT", 60)),
+        )
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self):
+        # generate() runs on several worker threads; only one may build the pool
+        with self._session_lock:
+            if self._session is None:
+                self._session = build_session(
+                    self.pool_size, headers={'Content-Type': 'application/json'})
+            return self._session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def generate(self, prompt, json_mode=False):
+        body = {
+            "contents": [
+                {
+                    "parts": [
+                        {
+                            "text": prompt
+                        }
+                    ]
+                }
+            ]
+        }
+        if json_mode:
+            body["generationConfig"] = {"responseMimeType": "application/json"}
+        payload = json.dumps(body)
+
+        reset_connect_timer()
+        start = time.perf_counter()
+        try:
+            response = self._get_session().post(
+                self.url, data=payload, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryableError(f"Network error: {e}") from e
+        total = time.perf_counter() - start
+
+        # A reused keep-alive connection reports 0s connect latency
+        self.last_latency = {
+            "connect": connect_timer.seconds,
+            "response": total - connect_timer.seconds,
+            "total": total,
+            "new_connection": connect_timer.opened > 0,
+        }
+        log.info("⏱️ %s call: connect %.3fs, response %.3fs (%s connection)",
+                 self.name, self.last_latency["connect"], self.last_latency["response"],
+                 "new" if self.last_latency["new_connection"] else "reused")
+
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            raise RetryableError("Rate limited (429)", 429, retry_after)
+        if response.status_code >= 500:
+            raise RetryableError(
+                f"Server error {response.status_code}: {response.text[:200]}", response.status_code)
+        if response.status_code >= 400:
+            raise NonRetryableError(
+                f"Request rejected {response.status_code}: {response.text[:200]}", response.status_code)
+
+        try:
+            response = json.loads(response.text)
+            text = response["candidates"][0]["content"]["parts"][0]["text"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise NonRetryableError(f"Malformed Gemini response: {e!r}") from e
+
+        usage = response.get("usageMetadata") or {}
+        return LLMResponse(text, {
+            "prompt": usage.get("promptTokenCount"),
+            "response": usage.get("candidatesTokenCount"),
+        } if usage else None, self.last_latency)
+
+
+class StandInBackend(GeminiBackend):
+    """Gemini wire protocol against the local stand-in server (src/meta/llm_standin.py); no API key."""
+
+    name = "standin"
+
+    def __init__(self, api_url=None, **kwargs):
+        super().__init__(api_url=api_url or os.getenv("LLM_STANDIN_URL", STANDIN_API_URL),
+                         api_key="standin", **kwargs)
+
+
+BACKENDS = {
+    GeminiBackend.name: GeminiBackend,
+    StandInBackend.name: StandInBackend,
+}
+
+
+def create_backend(name=None, **kwargs):
+    """Builds the backend selected by `name` or LLM_BACKEND (default: gemini)."""
+    name = (name or os.getenv("LLM_BACKEND", GeminiBackend.name)).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown LLM_BACKEND '{name}', expected one of: {', '.join(BACKENDS)}")
+    return BACKENDS[name](**kwargs)
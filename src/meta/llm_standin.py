@@ -0,0 +1,171 @@
+"""
+Local stand-in for the Gemini generateContent API.
+
+Speaks the same wire format as Gemini so AI_Agent can run with no network
+and no API key (LLM_BACKEND=standin). Answers are canned or rule-based, and
+latency, 5xx and 429 rates are configurable to exercise retries and the
+rate limiter.
+
+    python -m src.meta.llm_standin --port 8765 --latency 0.4 --error-rate 0.05
+"""
+import argparse
+import ast
+import json
+import random
+import re
+import threading
+import time
+
+from src.meta.stub_server import JSONHandler, StubServer
+
+_BATCH_QUESTIONS = re.compile(r"questions are: (\[.*\])")
+_QUESTION = re.compile(r"(?:question is:|\*\*Question:\*\*)\s*'(.*?)'[ \t]*$", re.S | re.M)
+_OPTIONS = re.compile(r"(?:answerOptions is:|\*\*Answer Options\*\*:)\s*(.+)")
+
+
+def _parse_options(text):
+    try:
+        options = ast.literal_eval(text.strip())
+    except (ValueError, SyntaxError):
+        return []
+    if isinstance(options, dict):
+        return [str(value) for value in options.values()]
+    if isinstance(options, (list, tuple)):
+        return [str(value) for value in options]
+    return []
+
+
+def rule_answer(question, options=None, canned=None):
+    """Deterministic answer for a single question, snapped to `options` if given."""
+    question_lower = question.lower()
+    for key, answer in (canned or {}).items():
+        if key.lower() in question_lower:
+            return answer
+
+    if any(word in question_lower for word in ("year", "experience")):
+        answer = "5"
+    elif any(word in question_lower for word in ("salary", "ctc", "compensation")):
+        answer = "1000000"
+    elif "notice" in question_lower:
+        answer = "30"
+    else:
+        answer = "Yes"
+
+    if options:
+        return next((option for option in options if option.lower() == answer.lower()), options[0])
+    return answer
+
+
+def answer_prompt(prompt, canned=None):
+    """Answers any prompt AI_Agent builds: batched JSON, single question or connection note."""
+    batch = _BATCH_QUESTIONS.search(prompt)
+    if batch:
+        questions = json.loads(batch.group(1))
+        return json.dumps({
+            question["questionId"]: rule_answer(
+                question["question"], question.get("answerOptions"), canned)
+            for question in questions
+        })
+
+    question = _QUESTION.search(prompt)
+    if question:
+        options = _OPTIONS.search(prompt)
+        return rule_answer(question.group(1),
+                           _parse_options(options.group(1)) if options else None, canned)
+
+    if "connection request" in prompt:
+        return "Hi! I came across your profile and would love to connect."
+    return "Yes"
+
+
+class StandInLLMServer(StubServer):
+    """Threaded HTTP server answering POST .../models/<model>:generateContent."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, throttle_rate=0.0, retry_after=1, canned=None, seed=None):
+        """
+        :param port: 0 picks a free port (see `url`)
+        :param latency: seconds every response is delayed by
+        :param jitter: extra uniform random delay in seconds
+        :param error_rate: share of requests answered with 500
+        :param throttle_rate: share of requests answered with 429 + Retry-After
+        :param canned: {question substring: answer} checked before the rules
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.canned = canned or {}
+        self.random = random.Random(seed)
+        self.requests = 0
+        self._lock = threading.Lock()
+        super().__init__(host, port)
+
+    @property
+    def url(self):
+        return f"{self.base_url}/v1beta/models/standin:generateContent"
+
+    def _handler(self):
+        server = self
+
+        class Handler(JSONHandler):
+            def do_POST(self):
+                body = self._body()
+                with server._lock:
+                    server.requests += 1
+                    roll = server.random.random()
+                    delay = server.latency + server.random.uniform(0, server.jitter)
+                time.sleep(delay)
+
+                if not self.path.split("?")[0].endswith(":generateContent"):
+                    return self._send(404, {"error": {"message": "Not found"}})
+                if roll < server.throttle_rate:
+                    return self._send(429, {"error": {"message": "Resource exhausted"}},
+                                      {"Retry-After": str(server.retry_after)})
+                if roll < server.throttle_rate + server.error_rate:
+                    return self._send(500, {"error": {"message": "Internal error"}})
+
+                prompt = "".join(part.get("text", "")
+                                 for content in body.get("contents", [])
+                                 for part in content.get("parts", []))
+                text = answer_prompt(prompt, server.canned)
+                self._send(200, {
+                    "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}}],
+                    "usageMetadata": {
+                        "promptTokenCount": len(prompt) // 4,
+                        "candidatesTokenCount": max(1, len(text) // 4),
+                        "totalTokenCount": len(prompt) // 4 + max(1, len(text) // 4),
+                    },
+                })
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Gemini API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--answers", help="JSON file of {question substring: answer}")
+    args = parser.parse_args()
+
+    canned = None
+    if args.answers:
+        with open(args.answers, encoding="utf-8") as file:
+            canned = json.load(file)
+
+    server = StandInLLMServer(args.host, args.port, args.latency, args.jitter,
+                              args.error_rate, args.throttle_rate, canned=canned)
+    print(f"Stand-in LLM listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
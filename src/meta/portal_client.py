@@ -0,0 +1,204 @@
+"""Module imports"""
+import os
+import threading
+import time
+import urllib.parse
+
+import requests
+from dotenv import load_dotenv
+
+from src.meta.http_pool import build_session
+from src.meta.logger import get_logger
+from src.meta.rate_limiter import backoff_delay, parse_retry_after
+
+load_dotenv(override=True)
+
+log = get_logger("portal_client")
+
+# Statuses that mean the portal (not the request) is in trouble
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# A POST may already have been acted on after a 500/502/504, so it is only
+# retried when the portal refused it outright
+POST_RETRY_STATUSES = {429, 503}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures (5xx, 429, network errors),
+    failing requests fast for `reset_timeout` seconds. Then one trial request
+    is let through: success closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, threshold=5, reset_timeout=60.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.opens = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self):
+        """:return: seconds until a request may be sent again; 0 if it may go now"""
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                return remaining
+            if self._trial:
+                # Another request is already probing the portal
+                return self.reset_timeout
+            self._trial = True
+            return 0.0
+
+    def on_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def release(self):
+        """Gives up a trial slot without a verdict (the request never reached the portal)."""
+        with self._lock:
+            self._trial = False
+
+    def on_failure(self):
+        """:return: True if this failure opened the breaker"""
+        with self._lock:
+            self.failures += 1
+            trial, self._trial = self._trial, False
+            if trial or (self.opened_at is None and self.failures >= self.threshold):
+                self.opened_at = time.monotonic()
+                self.opens += 1
+                return True
+            return False
+
+
+class PortalSession(requests.Session):
+    """
+    requests.Session shared by the portal bots. Every request gets the host's
+    timeout, transient failures (network errors, 5xx, 429) are retried with
+    exponential backoff and jitter (honouring Retry-After), and a per-host
+    circuit breaker stops sending to a portal that keeps failing.
+
+    Settings come from the environment:
+
+    - PORTAL_TIMEOUT: seconds, default 15; PORTAL_TIMEOUTS overrides per host,
+      e.g. "www.naukri.com=20,www.instahyre.com=10"
+    - PORTAL_MAX_RETRIES (3), PORTAL_BACKOFF_BASE (1), PORTAL_BACKOFF_CAP (20)
+    - PORTAL_BREAKER_THRESHOLD (5), PORTAL_BREAKER_RESET (60)
+    """
+
+    def __init__(self, portal, timeout=None, host_timeouts=None, max_retries=None,
+                 backoff_base=None, backoff_cap=None, breaker_threshold=None, breaker_reset=None):
+        super().__init__()
+        self.portal = portal
+        self.timeout = timeout or float(os.getenv("PORTAL_TIMEOUT", 15))
+        self.host_timeouts = host_timeouts if host_timeouts is not None else {
+            host.strip(): float(value) for host, _, value in
+            (item.partition("=") for item in os.getenv("PORTAL_TIMEOUTS", "").split(",")) if value}
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv("PORTAL_MAX_RETRIES", 3))
+        self.backoff_base = backoff_base or float(os.getenv("PORTAL_BACKOFF_BASE", 1))
+        self.backoff_cap = backoff_cap or float(os.getenv("PORTAL_BACKOFF_CAP", 20))
+        self.breaker_threshold = breaker_threshold or int(os.getenv("PORTAL_BREAKER_THRESHOLD", 5))
+        self.breaker_reset = breaker_reset or float(os.getenv("PORTAL_BREAKER_RESET", 60))
+        self._breakers = {}
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url):
+        return urllib.parse.urlsplit(url).netloc
+
+    def breaker(self, host):
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+                self._metrics[host] = {"requests": 0, "retries": 0, "failures": 0,
+                                       "short_circuited": 0, "backoff_seconds": 0.0}
+            return self._breakers[host]
+
+    def _count(self, host, name, value=1):
+        with self._lock:
+            self._metrics[host][name] += value
+
+    def request(self, method, url, **kwargs):
+        host = self._host(url)
+        breaker = self.breaker(host)
+        kwargs.setdefault("timeout", self.host_timeouts.get(host, self.timeout))
+        retry_statuses = POST_RETRY_STATUSES if method.upper() == "POST" else RETRY_STATUSES
+
+        for attempt in range(self.max_retries + 1):
+            retry_in = breaker.allow()
+            if retry_in:
+                self._count(host, "short_circuited")
+                raise CircuitOpenError(host, retry_in)
+
+            self._count(host, "requests")
+            retry_after = None
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                failure, response = e, None
+            except Exception:
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.on_success()
+                    return response
+                failure = f"HTTP {response.status_code}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            self._count(host, "failures")
+            if breaker.on_failure():
+                log.warning(f"🚧 {self.portal}: circuit opened for {host} after {failure}")
+            last_try = attempt == self.max_retries or (
+                response is not None and response.status_code not in retry_statuses)
+            if last_try or breaker.state == "open":
+                if response is not None:
+                    return response
+                raise failure
+
+            delay = min(self.backoff_cap, retry_after if retry_after is not None else
+                        backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+            log.info(f"🔁 {self.portal}: {method} {host} failed ({failure}), "
+                     f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            self._count(host, "retries")
+            self._count(host, "backoff_seconds", delay)
+            time.sleep(delay)
+
+    def stats(self):
+        """Per-host request, retry and breaker counters."""
+        with self._lock:
+            return {host: dict(metrics, backoff_seconds=round(metrics["backoff_seconds"], 2),
+                               breaker=self._breakers[host].state,
+                               breaker_opens=self._breakers[host].opens)
+                    for host, metrics in self._metrics.items()}
+
+
+def build_portal_session(portal, pool_size=10, headers=None, **options):
+    """
+    Creates a pooled PortalSession for `portal` (see PortalSession for `options`).
+
+    :return: PortalSession
+    """
+    return build_session(pool_size, headers, session=PortalSession(portal, **options))
@@ -0,0 +1,253 @@
+"""Module imports"""
+import math
+import os
+import re
+import threading
+from collections import Counter
+
+from dotenv import load_dotenv
+
+from src.meta.get_resume_text import get_resume_facts
+from src.meta.logger import get_logger
+from src.meta.resume_facts import find_skills
+
+load_dotenv(override=True)
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_INFINITY = float("inf")
+
+# A skill/tool after "in", "with", ... makes an experience question skill specific
+_SKILL_QUALIFIER = re.compile(
+    r"\b(?:in|with|on|using|as)\s+(?:a\s+|an\s+)?(?!(?:years?|yrs|months?|numbers?|total)\b)[a-z0-9#+.]")
+
+
+_PAY = r"\b(?:ctc|salary|compensation|package|pay)\b"
+_EXPECTATION = r"\bexpect(?:ed|ing|ations?)?\b"
+_CURRENT = r"\b(?:current|present|existing|last drawn|drawing)\b"
+_HIKE = r"\b(?:hike|increment|raise|percent(?:age)?)\b|%"
+
+
+def _days(text):
+    """'30 days' -> 30, '2 months' -> 60, 'immediate' -> 0; None if no duration."""
+    text = text.lower()
+    if "immediate" in text:
+        return 0.0
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    value = float(match.group())
+    if "month" in text:
+        return value * 30
+    if "week" in text:
+        return value * 7
+    return value
+
+
+def _lakhs(text):
+    """'15 LPA' -> 15, '1500000' -> 15, '1.2 Cr' -> 120; None if no amount."""
+    text = text.lower().replace(",", "")
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    value = float(match.group())
+    if "cr" in text:
+        return value * 100
+    if value >= 1000:
+        return value / 100000
+    return value
+
+
+def _plain(text):
+    match = _NUMBER.search(text.replace(",", ""))
+    return float(match.group()) if match else None
+
+
+def _option_range(option, scale):
+    """Reads '0-2 years', '5+', 'More than 10', 'Less than 1', '30 days' into (low, high)."""
+    text = option.lower().replace(",", "")
+    if "immediate" in text:
+        return 0.0, 0.0
+    numbers = [scale(number + " " + text) for number in _NUMBER.findall(text)]
+    numbers = [number for number in numbers if number is not None]
+    if not numbers:
+        return None
+    if len(numbers) >= 2:
+        return min(numbers[:2]), max(numbers[:2])
+    value = numbers[0]
+    if "+" in text or any(word in text for word in ("more than", "above", "over", "greater")):
+        return value, _INFINITY
+    if any(word in text for word in ("less than", "below", "under", "or less", "upto", "up to")):
+        return 0.0, value
+    return value, value
+
+
+def snap_to_options(value, options, scale=_plain):
+    """
+    Picks the option matching `value`: exact text first, then yes/no, then
+    the numeric range (in the units given by `scale`) containing the value.
+
+    :return: the option text, or None when nothing fits
+    """
+    values = list(options.values()) if isinstance(options, dict) else list(options or [])
+    values = [str(option) for option in values]
+    wanted = str(value).strip().lower()
+
+    for option in values:
+        if option.strip().lower() == wanted:
+            return option
+    if wanted in ("yes", "no"):
+        return next((option for option in values
+                     if option.strip().lower().startswith(wanted)), None)
+
+    number = scale(str(value))
+    if number is None:
+        return None
+    best = None
+    for option in values:
+        bounds = _option_range(option, scale)
+        if bounds and bounds[0] <= number <= bounds[1]:
+            # prefer the tightest range that contains the value
+            if best is None or bounds[1] - bounds[0] < best[1][1] - best[1][0]:
+                best = (option, bounds)
+    return best[0] if best else None
+
+
+class ProfileRuleEngine:
+    """
+    Answers profile questions (gender, notice period, CTC, relocation, phone,
+    email, total and per-skill experience) from known values and the resume
+    fact sheet without calling the LLM.
+    Rules are tried in order; the first one whose pattern matches and whose
+    value fits the answer options wins.
+    """
+
+    def __init__(self, profile, facts=None):
+        """
+        :param profile: dict with any of gender, notice_period, current_ctc,
+                        expected_ctc, relocate, phone, email, years_of_experience
+        :param facts: resume fact sheet (see resume_facts.build_fact_sheet), or a
+                      callable returning it on first use; supplies total years
+                      when not in `profile` and per-skill years
+        """
+        self.profile = {key: value for key, value in profile.items() if value}
+        self._facts = facts
+        self._facts_lock = threading.Lock()
+        self.rules = [
+            ("gender", re.compile(r"\bgender\b|\bsex\b"), "gender", None),
+            ("notice_period", re.compile(
+                r"notice period|\bnotice\b|how soon can you join|earliest .*join|joining time"),
+             "notice_period", _days),
+            # Only questions that clearly say which CTC they want; hikes and bare
+            # "CTC" questions go to the LLM
+            ("expected_ctc", re.compile(
+                rf"^(?!.*{_HIKE})(?=.*{_EXPECTATION})(?=.*{_PAY})"), "expected_ctc", _lakhs),
+            ("current_ctc", re.compile(
+                rf"^(?!.*{_HIKE})(?!.*{_EXPECTATION})(?=.*{_CURRENT})(?=.*{_PAY})"),
+             "current_ctc", _lakhs),
+            ("relocate", re.compile(
+                r"relocat|willing to (?:move|shift)|open to (?:moving|shift)|comfortable (?:moving|shifting)"),
+             "relocate", None),
+            ("phone", re.compile(r"(?:mobile|phone|contact)\s*(?:number|no\b)"), "phone", _plain),
+            ("email", re.compile(r"\be-?mail\b"), "email", None),
+            ("years_of_experience", re.compile(
+                r"(?:years|yrs)\s+of\s+(?:total\s+|overall\s+|work\s+|professional\s+|relevant\s+)?(?:work\s+)?experience"
+                r"|(?:total|overall)\s+(?:work\s+)?experience"),
+             "years_of_experience", _plain),
+        ]
+        self.hits = Counter()
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls({
+            "gender": os.getenv("GENDER"),
+            "notice_period": os.getenv("NOTICE_PERIOD"),
+            "current_ctc": os.getenv("CURRENT_CTC"),
+            "expected_ctc": os.getenv("EXPECTED_CTC"),
+            "relocate": os.getenv("WILLING_TO_RELOCATE", "Yes"),
+            "phone": os.getenv("PHONE_NUMBER"),
+            "email": os.getenv("PROFILE_EMAIL") or os.getenv("LINKEDIN_EMAIL"),
+            "years_of_experience": os.getenv("YEARS_OF_EXPERIENCE"),
+        }, facts=get_resume_facts)
+
+    @property
+    def facts(self):
+        with self._facts_lock:
+            if callable(self._facts):
+                try:
+                    self._facts = self._facts()
+                except Exception as e:
+                    get_logger("askAI").warning(f"⚠️ Resume fact sheet unavailable: {e}")
+                    self._facts = {}
+            return self._facts or {}
+
+    def _value(self, key):
+        if key in self.profile:
+            return self.profile[key]
+        if key == "years_of_experience" and self.facts.get("total_years"):
+            return str(self.facts["total_years"])
+        return None
+
+    def _skill_years(self, text):
+        """Years with the first skill named in `text`, rounded up; None if the resume has none."""
+        skill_years = self.facts.get("skill_years", {})
+        for skill in find_skills(text, strict=False)[:1]:
+            if skill_years.get(skill, 0) >= 1:
+                return str(math.ceil(skill_years[skill]))
+        return None
+
+    def _format(self, rule, value, question):
+        """Text boxes asking for a bare number get just the number."""
+        if rule == "notice_period" and re.search(r"\bin days\b|\(days\)|no\.? of days", question):
+            days = _days(value)
+            return str(int(days)) if days is not None else value
+        if rule in ("current_ctc", "expected_ctc") and re.search(r"lakh|\blpa\b", question):
+            lakhs = _lakhs(value)
+            return f"{lakhs:g}" if lakhs is not None else value
+        if rule in ("years_of_experience", "skill_years"):
+            years = _plain(value)
+            return f"{years:g}" if years is not None else value
+        return value
+
+    def answer(self, question, options=None):
+        """
+        :return: the answer text (an exact option when options are given), or None
+        """
+        question_lower = " ".join(str(question).lower().split())
+
+        for rule, pattern, key, scale in self.rules:
+            match = pattern.search(question_lower)
+            if not match:
+                continue
+            if rule == "years_of_experience" and _SKILL_QUALIFIER.search(
+                    question_lower[match.end():]):
+                # "years of experience in Kafka" comes from the resume, never the total
+                rule = "skill_years"
+                value = self._skill_years(question_lower[match.end():])
+            else:
+                value = self._value(key)
+            if value is None:
+                continue
+
+            if options:
+                value = snap_to_options(value, options, scale or _plain)
+                if value is None:
+                    continue
+            else:
+                value = self._format(rule, value, question_lower)
+
+            with self._lock:
+                self.hits[rule] += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def stats(self):
+        return {"hits": sum(self.hits.values()), "misses": self.misses,
+                "hits_by_rule": dict(self.hits)}
+
+
+profile_rules = ProfileRuleEngine.from_env()
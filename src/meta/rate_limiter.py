@@ -0,0 +1,147 @@
+"""Module imports"""
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+
+class RetryableError(Exception):
+    """A transient failure (network, 5xx, 429) that is worth retrying."""
+
+    def __init__(self, message, status_code=None, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class NonRetryableError(Exception):
+    """A failure that will not go away by asking again (bad request, malformed response)."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header given either in seconds or as an HTTP date.
+
+    :return: seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """Exponential backoff with full jitter for the given 0-based attempt."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket sized in requests per minute.
+
+    The rate is adaptive: a throttle (429) halves it, and each success
+    wins back a small step until the configured quota is reached again.
+    A Retry-After from the server pauses every caller sharing the limiter.
+    Requests already in flight when the rate is cut tend to be throttled
+    together, so further 429s within the same window (the Retry-After, or
+    one interval at the reduced rate) do not cut it again.
+    """
+
+    def __init__(self, requests_per_minute, burst=None, min_requests_per_minute=1):
+        self.max_rate = requests_per_minute / 60.0
+        self.min_rate = min(min_requests_per_minute, requests_per_minute) / 60.0
+        self.rate = self.max_rate
+        self.capacity = burst or max(1, requests_per_minute // 4)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self.waited_seconds = 0.0
+        self.throttled = 0
+        self._throttle_window_end = 0.0
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self):
+        """Takes a token and returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 1:
+                wait += (1 - self._tokens) / self.rate
+            self._tokens -= 1
+
+            self._recent.append(now + wait)
+            while self._recent and self._recent[0] < now - 60:
+                self._recent.popleft()
+            self.waited_seconds += wait
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_throttle(self, retry_after=None):
+        """
+        Halves the rate, once per throttle window, and if given holds every
+        caller for `retry_after` seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            if now < self._throttle_window_end:
+                return
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._throttle_window_end = now + max(retry_after or 0.0, 1 / self.rate)
+            if retry_after:
+                # Let exactly one request through once the pause is over
+                self._tokens = min(self._tokens, 1.0)
+                self._updated = max(self._updated, now + retry_after)
+
+    def requests_last_minute(self):
+        with self._lock:
+            cutoff = time.monotonic() - 60
+            return sum(1 for stamp in self._recent if stamp >= cutoff)
+
+    def stats(self):
+        return {
+            "requests_per_minute": round(self.rate * 60, 2),
+            "requests_last_minute": self.requests_last_minute(),
+            "throttled": self.throttled,
+            "waited_seconds": round(self.waited_seconds, 2),
+        }
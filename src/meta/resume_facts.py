@@ -0,0 +1,264 @@
+"""Module imports"""
+import re
+from datetime import date
+
+# Bump when the fact sheet format changes so cached sheets are rebuilt
+FACTS_VERSION = 2
+
+SKILLS = [
+    "python", "java", "javascript", "typescript", "go", "golang", "rust", "c++", "c#", "c",
+    "kotlin", "swift", "scala", "ruby", "php", "r", "sql", "bash", "shell scripting",
+    "node.js", "nodejs", "express", "nestjs", "react", "react native", "next.js", "angular",
+    "vue", "redux", "html", "css", "tailwind", "django", "flask", "fastapi", "spring",
+    "spring boot", "hibernate", ".net", "asp.net", "rails", "graphql", "rest", "grpc",
+    "microservices", "kafka", "rabbitmq", "redis", "memcached", "elasticsearch", "mysql",
+    "postgresql", "postgres", "mongodb", "cassandra", "dynamodb", "oracle", "sqlite",
+    "snowflake", "bigquery", "spark", "hadoop", "airflow", "pandas", "numpy",
+    "scikit-learn", "tensorflow", "pytorch", "machine learning", "deep learning", "nlp",
+    "llm", "computer vision", "data science", "data engineering", "aws", "azure", "gcp",
+    "docker", "kubernetes", "terraform", "ansible", "jenkins", "github actions", "ci/cd",
+    "linux", "git", "selenium", "cypress", "jest", "pytest", "junit", "agile", "scrum",
+    "jira", "system design", "distributed systems", "websockets", "webrtc", "socket.io",
+    "android", "ios", "flutter", "figma", "power bi", "tableau", "excel", "devops",
+]
+
+ALIASES = {
+    "golang": "go", "nodejs": "node.js", "node": "node.js", "postgres": "postgresql",
+    "reactjs": "react", "react.js": "react", "k8s": "kubernetes", "js": "javascript",
+    "ts": "typescript", "springboot": "spring boot", "ml": "machine learning",
+    "sklearn": "scikit-learn", "amazon web services": "aws", "google cloud": "gcp",
+}
+
+SECTION_HEADINGS = {
+    "experience": ("experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history"),
+    "education": ("education", "academics", "academic background", "qualifications",
+                  "educational qualification", "educational qualifications"),
+    "skills": ("skills", "technical skills", "key skills", "core skills", "tech stack",
+               "technologies", "core competencies", "skills & tools", "skills and tools"),
+    "projects": ("projects", "personal projects", "key projects", "academic projects"),
+    "summary": ("summary", "profile", "professional summary", "about me", "objective",
+                "career objective", "profile summary"),
+    "certifications": ("certifications", "certificates", "courses", "licenses & certifications"),
+    "achievements": ("achievements", "awards", "honors", "accomplishments"),
+}
+
+_MONTHS = {month: number for number, month in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+_DATE = (r"(?:(?P<{p}m>jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s*,?\s*"
+         r"|(?P<{p}n>\d{{1,2}})\s*[/.-]\s*)?(?P<{p}y>(?:19|20)\d\d)")
+_DATE_RANGE = re.compile(
+    _DATE.format(p="s") + r"\s*(?:-|–|—|to|till|until)\s*(?:"
+    + _DATE.format(p="e") + r"|(?P<present>present|current|now|date|ongoing))",
+    re.I)
+_DEGREE = re.compile(
+    r"\b(?:b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|m\.?\s?e\b|b\.?\s?sc|m\.?\s?sc|bca|mca|mba|"
+    r"b\.?\s?com|m\.?\s?com|bachelor|master|ph\.?\s?d|doctorate|diploma|"
+    r"high school|higher secondary|senior secondary|intermediate|hsc|ssc|cbse|icse)", re.I)
+_STATED_SKILL_YEARS = re.compile(
+    r"(\d+(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:hands[- ]on\s+)?"
+    r"(?:experience\s+)?(?:in|with|using|on)\s+([a-z0-9#+./ -]{1,40})", re.I)
+_STATED_TOTAL_YEARS = re.compile(
+    r"(\d+(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:total\s+|overall\s+|"
+    r"professional\s+|industry\s+|work\s+)*experience", re.I)
+
+
+def canonical_skill(name):
+    name = " ".join(str(name).lower().split()).strip(" .,;:")
+    return ALIASES.get(name, name)
+
+
+def _skill_pattern(skill):
+    # word boundaries do not work around "+", "#" or "."
+    return re.compile(r"(?<![a-z0-9])" + re.escape(skill) + r"(?![a-z0-9+#])", re.I)
+
+
+_SKILL_PATTERNS = [(canonical_skill(skill), _skill_pattern(skill))
+                   for skill in SKILLS + list(ALIASES)]
+# single letters are only trusted inside a skills list
+_AMBIGUOUS = {"c", "r", "go", "rest", "git", "js", "ts", "ml", "node"}
+
+
+def find_skills(text, strict=True, allow=()):
+    """
+    :param strict: skip short skill names that read like ordinary words ...
+    :param allow: ... unless they are in `allow`
+    :return: canonical skill names mentioned in `text`, in order of appearance
+    """
+    found = {}
+    for skill, pattern in _SKILL_PATTERNS:
+        match = pattern.search(text)
+        if match and not (strict and match.group().lower() in _AMBIGUOUS
+                          and skill not in allow):
+            found.setdefault(skill, match.start())
+    return sorted(found, key=found.get)
+
+
+def split_sections(text):
+    """
+    Splits resume text at known headings.
+
+    :return: list of (section, heading, body) in order; text before the
+             first heading is returned as section "header"
+    """
+    sections = []
+    current, heading, lines = "header", "", []
+    for line in text.splitlines():
+        key = line.strip().lower().rstrip(":").strip()
+        section = next((name for name, headings in SECTION_HEADINGS.items()
+                        if key in headings), None)
+        if section:
+            sections.append((current, heading, "\n".join(lines).strip()))
+            current, heading, lines = section, line.strip(), []
+        else:
+            lines.append(line)
+    sections.append((current, heading, "\n".join(lines).strip()))
+    return [section for section in sections if section[2]]
+
+
+def _month(match, prefix, default):
+    month = match.group(prefix + "m")
+    if month:
+        return _MONTHS[month[:3].lower()]
+    number = match.group(prefix + "n")
+    if number and 1 <= int(number) <= 12:
+        return int(number)
+    return default
+
+
+def _date_ranges(text, today=None):
+    """Yields (start months, end months, match) for each date range in `text`."""
+    today = today or date.today()
+    for match in _DATE_RANGE.finditer(text):
+        start = int(match.group("sy")) * 12 + _month(match, "s", 1) - 1
+        if match.group("present"):
+            end = today.year * 12 + today.month - 1
+        else:
+            end = int(match.group("ey")) * 12 + _month(match, "e", 12) - 1
+        if end >= start:
+            yield start, end + 1, match
+
+
+def _merged_months(ranges):
+    total, current_end = 0, None
+    for start, end in sorted(ranges):
+        if current_end is None or start > current_end:
+            total += end - start
+            current_end = end
+        elif end > current_end:
+            total += end - current_end
+            current_end = end
+    return total
+
+
+def _employer(lines, index, match):
+    """
+    The company name is usually on the date line or the line just above it.
+
+    :return: (employer or None, index of the line the entry starts on)
+    """
+    candidates = [(index, lines[index][:match.start()] + lines[index][match.end():])]
+    if index > 0:
+        candidates.append((index - 1, lines[index - 1]))
+    for header, candidate in candidates:
+        parts = [part.strip(" ()-–—|,•·") for part in re.split(r"\s[|•·–—-]\s|,|\|", candidate)]
+        parts = [part for part in parts if len(part) > 1 and not _DATE_RANGE.search(part)
+                 and not re.fullmatch(r"[\d\s/.-]+", part)]
+        if parts:
+            # "Title at Company" / "Company - Title": prefer the part naming a company
+            for part in parts:
+                at = re.search(r"\b(?:at|@)\s+(.+)", part)
+                if at:
+                    return at.group(1).strip(), header
+            company = next((part for part in parts if re.search(
+                r"\b(?:pvt|ltd|limited|inc|llc|llp|corp|technologies|solutions|labs|systems|"
+                r"software|services|consulting|group|bank|university)\b", part, re.I)), None)
+            return company or parts[0], header
+    return None, index
+
+
+def build_fact_sheet(text, today=None):
+    """
+    Pulls a compact, structured profile out of resume text: skills, total
+    and per-skill years of experience, employers and education. Years are
+    computed from the date ranges of the experience section; years stated
+    in the text ("5+ years of experience in Python") win when larger.
+
+    Ranges ending in "Present" run to `today`, so the sheet records the month
+    it was built for ("as_of") and is only valid during that month.
+    """
+    today = today or date.today()
+    sections = split_sections(text)
+    experience = "\n".join(body for section, _, body in sections if section == "experience")
+    education = "\n".join(body for section, _, body in sections if section == "education")
+    skills_text = "\n".join(body for section, _, body in sections if section == "skills")
+
+    listed = find_skills(skills_text, strict=False)
+    skills = list(dict.fromkeys(listed + find_skills(text)))
+
+    # Each dated entry in the experience section runs from its header line
+    # (the date line, or the company line above it) to the next entry's header
+    lines = (experience or text).splitlines()
+    entries = []
+    for index, line in enumerate(lines):
+        for start, end, match in _date_ranges(line, today):
+            employer, header = _employer(lines, index, match)
+            entries.append({"header": header, "start": start, "end": end, "employer": employer})
+            break
+    for position, entry in enumerate(entries):
+        stop = entries[position + 1]["header"] if position + 1 < len(entries) else len(lines)
+        entry["text"] = "\n".join(lines[entry["header"]:stop])
+
+    skill_months = {}
+    for entry in entries:
+        for skill in find_skills(entry["text"], allow=listed):
+            skill_months.setdefault(skill, []).append((entry["start"], entry["end"]))
+    skill_years = {skill: round(_merged_months(ranges) / 12, 1)
+                   for skill, ranges in skill_months.items()}
+
+    total_years = round(_merged_months([(entry["start"], entry["end"]) for entry in entries]) / 12, 1)
+    stated = [float(number) for number in _STATED_TOTAL_YEARS.findall(text)]
+    if stated:
+        total_years = max(total_years, max(stated))
+
+    for years, name in _STATED_SKILL_YEARS.findall(text):
+        for skill in find_skills(name, strict=False)[:1]:
+            skill_years[skill] = max(skill_years.get(skill, 0.0), float(years))
+
+    employers = list(dict.fromkeys(entry["employer"] for entry in entries if entry["employer"]))
+    degrees = [" ".join(line.split()) for line in (education or text).splitlines()
+               if _DEGREE.search(line)]
+
+    return {
+        "version": FACTS_VERSION,
+        "as_of": as_of(today),
+        "skills": skills,
+        "total_years": total_years,
+        "skill_years": dict(sorted(skill_years.items(), key=lambda item: -item[1])),
+        "employers": employers,
+        "education": list(dict.fromkeys(degrees)),
+    }
+
+
+def as_of(today=None):
+    """The month a fact sheet built on `today` stays valid for, e.g. "2026-10"."""
+    return (today or date.today()).strftime("%Y-%m")
+
+
+def format_fact_sheet(facts):
+    """Renders the fact sheet as a few compact lines for a prompt."""
+    if not facts:
+        return ""
+    lines = []
+    if facts.get("total_years"):
+        lines.append(f"Total experience: {facts['total_years']:g} years")
+    if facts.get("skill_years"):
+        lines.append("Experience by skill (years): " + ", ".join(
+            f"{skill} {years:g}" for skill, years in facts["skill_years"].items()))
+    if facts.get("skills"):
+        lines.append("Skills: " + ", ".join(facts["skills"]))
+    if facts.get("employers"):
+        lines.append("Employers: " + "; ".join(facts["employers"]))
+    if facts.get("education"):
+        lines.append("Education: " + "; ".join(facts["education"]))
+    return "\n".join(lines)
@@ -0,0 +1,108 @@
+"""Module imports"""
+import re
+
+import numpy as np
+
+from src.meta.answer_cache import normalize_question
+from src.meta.resume_facts import split_sections
+
+_BULLET = re.compile(r"^\s*(?:[-•·*▪●◦]|\d+[.)])\s+")
+
+
+def estimate_tokens(text):
+    """Rough LLM token count (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def chunk_resume(text, max_tokens=120):
+    """
+    Splits the resume into chunks that each stay inside one section:
+    blank lines and dated/heading lines start a new entry, and entries
+    longer than `max_tokens` are cut at line boundaries.
+
+    :return: list of {"section", "text"} in resume order
+    """
+    chunks = []
+    for section, heading, body in split_sections(text):
+        label = heading or section.title()
+        entry = []
+
+        def flush():
+            if entry:
+                chunks.append({"section": section, "text": f"{label}: " + "\n".join(entry)})
+                entry.clear()
+
+        for line in body.splitlines():
+            line = line.strip()
+            if not line:
+                flush()
+                continue
+            # a non-bullet line after bullets usually starts the next job/project
+            starts_entry = entry and not _BULLET.match(line) and _BULLET.match(entry[-1])
+            if starts_entry or estimate_tokens("\n".join(entry + [line])) > max_tokens:
+                flush()
+            entry.append(line)
+        flush()
+    return chunks
+
+
+class ResumeIndex:
+    """
+    BM25 index over resume chunks. Term frequencies are kept as a dense
+    chunks x vocabulary matrix, so scoring a query is one vectorized pass.
+    """
+
+    def __init__(self, chunks, k1=1.5, b=0.75):
+        self.chunks = chunks
+        documents = [normalize_question(chunk["text"]) for chunk in chunks]
+        self.vocabulary = {token: index for index, token in enumerate(
+            sorted({token for document in documents for token in document}))}
+
+        self.term_freq = np.zeros((len(chunks), len(self.vocabulary)), dtype=np.float32)
+        for row, document in enumerate(documents):
+            for token in document:
+                self.term_freq[row, self.vocabulary[token]] += 1
+
+        lengths = self.term_freq.sum(axis=1)
+        doc_freq = (self.term_freq > 0).sum(axis=0)
+        self.idf = np.log(1 + (len(chunks) - doc_freq + 0.5) / (doc_freq + 0.5))
+        # BM25 length normalization, precomputed per chunk
+        self.norm = k1 * (1 - b + b * lengths / (lengths.mean() if len(chunks) else 1.0))
+        self.k1 = k1
+
+    def scores(self, query):
+        columns = [self.vocabulary[token] for token in set(normalize_question(query))
+                   if token in self.vocabulary]
+        if not columns:
+            return np.zeros(len(self.chunks), dtype=np.float32)
+        freq = self.term_freq[:, columns]
+        return (self.idf[columns] * freq * (self.k1 + 1) / (freq + self.norm[:, None])).sum(axis=1)
+
+    def search(self, query, k=3):
+        """:return: [(score, chunk index)] of the best `k` chunks that match at all"""
+        scores = self.scores(query)
+        best = np.argsort(-scores, kind="stable")[:k]
+        return [(float(scores[index]), int(index)) for index in best if scores[index] > 0]
+
+    def context(self, questions, header="", k=3, token_budget=600):
+        """
+        Builds the resume context for a prompt: `header`, then the top `k`
+        chunks for each question, in resume order, as many as fit
+        `token_budget` (best-scoring chunks are kept first).
+        """
+        best = {}
+        for question in questions:
+            for score, index in self.search(question, k):
+                best[index] = max(best.get(index, 0.0), score)
+
+        budget = token_budget - estimate_tokens(header)
+        chosen = []
+        for index in sorted(best, key=best.get, reverse=True):
+            cost = estimate_tokens(self.chunks[index]["text"])
+            if cost <= budget:
+                chosen.append(index)
+                budget -= cost
+
+        parts = [header] if header else []
+        parts += [self.chunks[index]["text"] for index in sorted(chosen)]
+        return "\n\n".join(parts)
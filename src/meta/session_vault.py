@@ -0,0 +1,105 @@
+"""Module imports"""
+import json
+import os
+import threading
+import time
+
+from cryptography.fernet import Fernet, InvalidToken
+from dotenv import load_dotenv
+
+from src.meta.logger import get_logger
+
+load_dotenv(override=True)
+
+log = get_logger("session_vault")
+
+
+class SessionVault:
+    """
+    Encrypted (Fernet) store of portal login tokens and cookies, so bots can
+    skip the credential login on warm starts. Entries are keyed by portal
+    and account, and older than `max_age` seconds count as expired.
+
+    The key comes from SESSION_VAULT_KEY, or is generated once into
+    `key_file` (readable by the owner only). The key file lives outside the
+    repository by default (SESSION_VAULT_KEY_FILE, ~/.config/job-scraper-bots/
+    session_vault.key), so it cannot be committed next to the vault.
+    """
+
+    def __init__(self, path, key=None, key_file=None, max_age=None):
+        """
+        :param path: encrypted vault file
+        :param key: Fernet key; defaults to SESSION_VAULT_KEY, then `key_file`
+        :param key_file: where a generated key is kept when none is given;
+                         defaults to SESSION_VAULT_KEY_FILE
+        :param max_age: seconds a saved session is trusted for
+        """
+        self.path = path
+        self.key_file = key_file or os.path.expanduser(os.getenv(
+            "SESSION_VAULT_KEY_FILE", "~/.config/job-scraper-bots/session_vault.key"))
+        self.max_age = max_age if max_age is not None else float(
+            os.getenv("SESSION_VAULT_MAX_AGE", 24 * 3600))
+        self._key = key or os.getenv("SESSION_VAULT_KEY")
+        self._fernet = None
+        self._lock = threading.Lock()
+
+    def _get_fernet(self):
+        if self._fernet is None:
+            key = self._key
+            if not key and os.path.exists(self.key_file):
+                with open(self.key_file, "rb") as file:
+                    key = file.read().strip()
+            if not key:
+                key = Fernet.generate_key()
+                os.makedirs(os.path.dirname(self.key_file) or ".", exist_ok=True)
+                descriptor = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(key)
+            self._fernet = Fernet(key)
+        return self._fernet
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "rb") as file:
+                return json.loads(self._get_fernet().decrypt(file.read()))
+        except (InvalidToken, ValueError) as e:
+            log.warning(f"⚠️ Session vault unreadable, starting empty: {e!r}")
+            return {}
+
+    def _write(self, entries):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        data = self._get_fernet().encrypt(json.dumps(entries).encode("utf-8"))
+        temporary = self.path + ".tmp"
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temporary, self.path)
+
+    @staticmethod
+    def _name(portal, account):
+        return f"{portal}:{account}"
+
+    def load(self, portal, account):
+        """:return: the saved session dict, or None if missing or expired"""
+        with self._lock:
+            entry = self._read().get(self._name(portal, account))
+        if not entry or time.time() - entry.get("saved_at", 0) > self.max_age:
+            return None
+        return entry["session"]
+
+    def save(self, portal, account, session):
+        with self._lock:
+            entries = self._read()
+            entries[self._name(portal, account)] = {"session": session, "saved_at": time.time()}
+            self._write(entries)
+
+    def forget(self, portal, account):
+        with self._lock:
+            entries = self._read()
+            if entries.pop(self._name(portal, account), None) is not None:
+                self._write(entries)
+
+
+session_vault = SessionVault(os.getenv("SESSION_VAULT_FILE", "src/meta/session_vault.bin"))
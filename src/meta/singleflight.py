@@ -0,0 +1,81 @@
+"""Module imports"""
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future
+
+
+def prompt_key(prompt, *extra):
+    """Key under which identical prompts (ignoring whitespace) are coalesced."""
+    normalized = " ".join(str(prompt).split())
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return (digest,) + extra
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one: the first caller
+    (the leader) does the work, every caller arriving while it is in flight
+    waits for and shares the leader's result or exception.
+
+    Works across threads and event loops, so callers may mix the sync `do`
+    and the async `ado`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def _join(self, key):
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            self.leaders += 1
+            return future, True
+
+    def _finish(self, key, future, result=None, error=None):
+        with self._lock:
+            self._calls.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key, fn):
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def ado(self, key, factory):
+        """:param factory: callable returning the coroutine to run if this caller leads"""
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await factory()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        return {"leaders": self.leaders, "coalesced": self.coalesced,
+                "in_flight": self.in_flight()}
@@ -0,0 +1,29 @@
+"""Module imports"""
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase of an entry point takes, so the cost
+    of imports, logins and lazy initialisation can be compared between runs.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.phases = []
+
+    @contextmanager
+    def phase(self, label):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((label, time.perf_counter() - start))
+
+    def total(self):
+        return sum(seconds for _, seconds in self.phases)
+
+    def report(self, logger):
+        phases = ", ".join(f"{label} {seconds:.2f}s" for label, seconds in self.phases)
+        logger.info("⏱️ %s startup: %s (total %.2fs)", self.name, phases, self.total())
@@ -0,0 +1,188 @@
+"""Module imports"""
+import bisect
+import csv
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32, float("inf")]
+
+_context = ContextVar("llm_telemetry_context", default={})
+
+
+class LLMTelemetry:
+    """
+    Collects one event per answered question or LLM call: where the answer
+    came from (llm, cache, rule), prompt/response size and tokens, latency,
+    retries, and the portal/job it was made for (see `context`).
+    """
+
+    FIELDS = ["timestamp", "portal", "job_id", "kind", "source", "label", "prompt_chars",
+              "response_chars", "prompt_tokens", "response_tokens", "latency", "connect",
+              "retries", "coalesced", "ok"]
+
+    def __init__(self, input_price=None, output_price=None):
+        """
+        :param input_price: USD per 1M prompt tokens (LLM_PRICE_PER_1M_INPUT)
+        :param output_price: USD per 1M response tokens (LLM_PRICE_PER_1M_OUTPUT)
+        """
+        self.input_price = input_price if input_price is not None else float(
+            os.getenv("LLM_PRICE_PER_1M_INPUT", 0.075))
+        self.output_price = output_price if output_price is not None else float(
+            os.getenv("LLM_PRICE_PER_1M_OUTPUT", 0.30))
+        self.events = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def context(self, **values):
+        """Tags every event recorded inside the block, e.g. portal="naukri", job_id=..."""
+        token = _context.set({**_context.get(), **values})
+        try:
+            yield
+        finally:
+            _context.reset(token)
+
+    def record(self, kind, source="llm", label="", prompt_chars=0, response_chars=0,
+               prompt_tokens=None, response_tokens=None, latency=0.0, connect=0.0,
+               retries=0, coalesced=False, ok=True):
+        context = _context.get()
+        event = {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "portal": context.get("portal", ""),
+            "job_id": str(context.get("job_id", "")),
+            "kind": kind,
+            "source": source,
+            "label": " ".join(str(label).split())[:120],
+            "prompt_chars": prompt_chars,
+            "response_chars": response_chars,
+            # Without backend token counts, ~4 characters per token
+            "prompt_tokens": prompt_tokens if prompt_tokens is not None else prompt_chars // 4,
+            "response_tokens": response_tokens if response_tokens is not None else response_chars // 4,
+            "latency": round(latency, 4),
+            "connect": round(connect, 4),
+            "retries": retries,
+            "coalesced": coalesced,
+            "ok": ok,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def record_hit(self, source, kind="question", label=""):
+        """A question answered locally (profile rule or answer cache) without an LLM call."""
+        self.record(kind, source=source, label=label)
+
+    def _cost(self, prompt_tokens, response_tokens):
+        return (prompt_tokens * self.input_price + response_tokens * self.output_price) / 1_000_000
+
+    @staticmethod
+    def _histogram(latencies):
+        counts = [0] * len(LATENCY_BUCKETS)
+        for latency in latencies:
+            counts[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        return {f"<={bound}s" if bound != float("inf") else "inf": count
+                for bound, count in zip(LATENCY_BUCKETS, counts)}
+
+    def summary(self):
+        with self._lock:
+            events = list(self.events)
+
+        llm_calls = [event for event in events
+                     if event["source"] == "llm" and not event["coalesced"]]
+        latencies = sorted(event["latency"] for event in llm_calls)
+        prompt_tokens = sum(event["prompt_tokens"] for event in llm_calls)
+        response_tokens = sum(event["response_tokens"] for event in llm_calls)
+
+        applications = defaultdict(lambda: {
+            "llm_calls": 0, "cache_hits": 0, "rule_hits": 0, "coalesced": 0, "retries": 0,
+            "prompt_tokens": 0, "response_tokens": 0, "latency": 0.0, "cost_usd": 0.0})
+        for event in events:
+            application = applications[f"{event['portal']}:{event['job_id']}"]
+            if event["source"] == "cache":
+                application["cache_hits"] += 1
+            elif event["source"] == "rule":
+                application["rule_hits"] += 1
+            elif event["coalesced"]:
+                application["coalesced"] += 1
+            else:
+                application["llm_calls"] += 1
+                application["retries"] += event["retries"]
+                application["prompt_tokens"] += event["prompt_tokens"]
+                application["response_tokens"] += event["response_tokens"]
+                application["latency"] = round(application["latency"] + event["latency"], 4)
+                application["cost_usd"] = self._cost(
+                    application["prompt_tokens"], application["response_tokens"])
+
+        by_kind = defaultdict(lambda: {"calls": 0, "latency": 0.0, "prompt_tokens": 0})
+        for event in llm_calls:
+            by_kind[event["kind"]]["calls"] += 1
+            by_kind[event["kind"]]["latency"] = round(
+                by_kind[event["kind"]]["latency"] + event["latency"], 4)
+            by_kind[event["kind"]]["prompt_tokens"] += event["prompt_tokens"]
+
+        def percentile(share):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * share))] if latencies else 0.0
+
+        return {
+            "events": len(events),
+            "llm_calls": len(llm_calls),
+            "answered_by": {source: sum(1 for event in events if event["source"] == source)
+                            for source in ("llm", "cache", "rule")},
+            "coalesced": sum(1 for event in events if event["coalesced"]),
+            "failed": sum(1 for event in events if not event["ok"]),
+            "retries": sum(event["retries"] for event in llm_calls),
+            "prompt_tokens": prompt_tokens,
+            "response_tokens": response_tokens,
+            "cost_usd": round(self._cost(prompt_tokens, response_tokens), 6),
+            "latency": {
+                "total": round(sum(latencies), 3),
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": latencies[-1] if latencies else 0.0,
+                "histogram": self._histogram(latencies),
+            },
+            "by_kind": dict(by_kind),
+            "slowest": sorted(llm_calls, key=lambda event: event["latency"], reverse=True)[:10],
+            "largest_prompts": sorted(llm_calls, key=lambda event: event["prompt_tokens"],
+                                      reverse=True)[:10],
+            "applications": {key: {**value, "cost_usd": round(value["cost_usd"], 6)}
+                             for key, value in applications.items()},
+        }
+
+    def write(self, directory=None):
+        """
+        Writes the run summary (JSON) and every event (CSV) to `directory`.
+
+        :return: (summary path, events path), or None if nothing was recorded
+        """
+        if not self.events:
+            return None
+        directory = directory or os.getenv("TELEMETRY_DIR", "telemetry")
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+
+        summary_path = os.path.join(directory, f"llm_summary_{stamp}.json")
+        with open(summary_path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2, ensure_ascii=False)
+
+        events_path = os.path.join(directory, f"llm_calls_{stamp}.csv")
+        with self._lock:
+            events = list(self.events)
+        with open(events_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(events)
+
+        return summary_path, events_path
+
+
+telemetry = LLMTelemetry()
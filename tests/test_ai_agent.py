@@ -0,0 +1,48 @@
+import threading
+import time
+
+import pytest
+
+from src.meta.askAI import AI_Agent, _run_sync
+from src.meta.rate_limiter import RateLimiter
+
+
+class SlowBackend:
+    """Records how many prompts are being generated at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, json_mode=False):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return "Yes"
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    for name, value in {"GENDER": "Male", "NOTICE_PERIOD": "30",
+                        "CURRENT_CTC": "12", "EXPECTED_CTC": "18"}.items():
+        monkeypatch.setenv(name, value)
+
+
+def test_max_concurrency_holds_across_threads(profile):
+    backend = SlowBackend()
+    agent = AI_Agent(backend=backend, limiter=RateLimiter(60000), max_concurrency=2,
+                     cache=None, rules=None)
+
+    # Each thread runs its own event loop, like the Naukri answer pool
+    threads = [threading.Thread(target=_run_sync, args=(agent.aaskAI(f"question {index}"),))
+               for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.peak == 2
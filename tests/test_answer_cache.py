@@ -0,0 +1,37 @@
+from src.meta.answer_cache import AnswerCache, question_signature
+
+
+def make_cache(tmp_path):
+    return AnswerCache(str(tmp_path / "answers.csv"))
+
+
+def test_reworded_question_reuses_answer(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("How many years of experience do you have in Python?", "5")
+    assert cache.get("How many yrs of exp in Python?") == "5"
+
+
+def test_different_numbers_are_not_reused(tmp_path):
+    cache = make_cache(tmp_path)
+    options = ["Yes", "No"]
+    cache.put("Do you have 2+ years of experience in Python?", "Yes", options)
+    assert cache.get("Do you have 10+ years of experience in Python?", options) is None
+    assert cache.get("Do you have 2+ yrs of experience in Python?", options) == "Yes"
+
+
+def test_yes_no_question_does_not_reuse_count_answer(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("How many years of experience do you have in Python?", "5")
+    assert cache.get("Do you have experience in Python?") is None
+
+
+def test_signature_survives_reload(tmp_path):
+    make_cache(tmp_path).put("Do you have 2+ years of experience in Python?", "Yes")
+    cache = make_cache(tmp_path)
+    assert cache.get("Do you have 3+ years of experience in Python?") is None
+    assert cache.get("Do you have 2+ years of experience in Python?") == "Yes"
+
+
+def test_question_signature():
+    assert question_signature("Do you have 2.0 years?") == (("2",), "yes_no")
+    assert question_signature("How many years of experience?") == ((), "open")
@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from src.Instahyre.instahyre_stub import InstahyreStubServer
+from src.meta.portal_client import CircuitBreaker, CircuitOpenError, PortalSession
+
+
+def test_opens_after_threshold_failures():
+    breaker = CircuitBreaker(threshold=3, reset_timeout=60)
+    assert [breaker.on_failure() for _ in range(3)] == [False, False, True]
+    assert breaker.state == "open"
+    assert breaker.allow() > 0
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+    breaker.on_failure()
+    breaker.on_success()
+    assert not breaker.on_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.on_failure()
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert breaker.allow() == 0
+    assert breaker.allow() > 0  # only one trial at a time
+
+    assert breaker.on_failure()  # failed trial opens it again
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert breaker.allow() == 0
+    breaker.on_success()
+    assert breaker.state == "closed"
+
+
+def test_released_trial_can_be_retaken():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.01)
+    breaker.on_failure()
+    time.sleep(0.02)
+    assert breaker.allow() == 0
+    breaker.release()
+    assert breaker.allow() == 0
+
+
+def test_session_fails_fast_once_the_portal_keeps_failing():
+    with InstahyreStubServer(error_rate=1.0, seed=1) as stub:
+        session = PortalSession("instahyre", timeout=5, max_retries=1, backoff_base=0.01,
+                                backoff_cap=0.01, breaker_threshold=2, breaker_reset=60)
+        url = f"{stub.url}/api/v1/candidate_opportunity"
+        assert session.get(url).status_code >= 500
+        with pytest.raises(CircuitOpenError):
+            session.get(url)
+
+    stats = next(iter(session.stats().values()))
+    assert stats["requests"] == 2
+    assert stats["short_circuited"] == 1
+    assert stats["breaker"] == "open"
@@ -0,0 +1,38 @@
+from src.meta.ledger import APPLIED, FAILED, SKIPPED, JobLedger
+
+
+def make_ledger(tmp_path, **options):
+    return JobLedger(str(tmp_path / "ledger.sqlite3"), **options)
+
+
+def test_outcomes_survive_reload(tmp_path):
+    ledger = make_ledger(tmp_path)
+    ledger.record("naukri", 101, APPLIED)
+    ledger.record("naukri", "102", SKIPPED, "low relevance")
+    ledger.close()
+
+    ledger = make_ledger(tmp_path)
+    assert ledger.outcome("naukri", "101") == APPLIED
+    assert ledger.outcome("naukri", 102) == SKIPPED
+    assert ledger.outcome("instahyre", "101") is None
+    assert ledger.stats("naukri") == {APPLIED: 1, SKIPPED: 1}
+
+
+def test_unseen_keeps_order_and_drops_known_jobs(tmp_path):
+    ledger = make_ledger(tmp_path)
+    ledger.record("naukri", "2", APPLIED)
+    jobs = [{"jobId": str(n)} for n in range(1, 5)]
+    assert ledger.unseen("naukri", jobs, key=lambda job: job["jobId"]) == [
+        {"jobId": "1"}, {"jobId": "3"}, {"jobId": "4"}]
+
+
+def test_failed_jobs_are_retried_only_when_asked(tmp_path):
+    ledger = make_ledger(tmp_path)
+    ledger.record("naukri", "1", FAILED, "HTTP 400")
+    ledger.record("naukri", "2", APPLIED)
+    ledger.close()
+
+    assert make_ledger(tmp_path).seen("naukri", "1")
+    retrying = make_ledger(tmp_path, retry_failed=True)
+    assert not retrying.seen("naukri", "1")
+    assert retrying.seen("naukri", "2")
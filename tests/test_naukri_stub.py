@@ -0,0 +1,74 @@
+import pytest
+from cryptography.fernet import Fernet
+
+from src.meta.askAI import AI_Agent
+from src.meta.ledger import JobLedger
+from src.meta.llm_backends import StandInBackend
+from src.meta.llm_standin import StandInLLMServer
+from src.meta.rate_limiter import RateLimiter
+from src.meta.session_vault import SessionVault
+from src.Naukri import naukri
+from src.Naukri.naukri_stub import NaukriStubServer
+
+
+@pytest.fixture
+def llm():
+    with StandInLLMServer() as server:
+        yield server
+
+
+@pytest.fixture
+def portal(tmp_path, monkeypatch, llm):
+    """Points the Naukri bot at a stub with 60 jobs, a third of them with questionnaires."""
+    monkeypatch.setenv("NAUKRI_DESIGNATION_COMPANY", "Python Developer")
+    monkeypatch.delenv("NAUKRI_LOCATION", raising=False)
+    monkeypatch.setattr(naukri, "ledger", JobLedger(str(tmp_path / "ledger.sqlite3")))
+    monkeypatch.setattr(naukri, "session_vault", SessionVault(
+        str(tmp_path / "vault.bin"), key=Fernet.generate_key()))
+    # No resume: jobs keep the portal's order
+    monkeypatch.setattr(naukri, "get_resume", lambda: {"text": "", "facts": {}})
+    agent = AI_Agent(backend=StandInBackend(api_url=llm.url), limiter=RateLimiter(60000),
+                     cache=None, rules=None, resume={"text": "Python developer", "facts": {}})
+    monkeypatch.setattr(naukri, "get_ai_agent", lambda: agent)
+    monkeypatch.setattr(naukri, "existing_ai_agent", lambda: agent)
+
+    with NaukriStubServer(jobs=60, questionnaire_rate=0.3, seed=5) as server:
+        yield server
+
+
+def make_bot(server, **attributes):
+    attributes = {"BASE_URL": server.url, "APPLY_BATCH_SIZE": 5, "ANSWER_WORKERS": 2, **attributes}
+    bot_class = type("StubBot", (naukri.NaukriApplicationBot,), attributes)
+    return bot_class("bench@example.com", "password")
+
+
+def test_applies_in_batches_up_to_the_cap(portal):
+    bot = make_bot(portal)
+    assert bot.run() == "Done"
+
+    assert bot.count == 20
+    assert len(portal.applied) == 20
+    assert all(1 <= len(batch) <= 5 for batch in portal.batches)
+    assert len(portal.batches[0]) == 5
+    # Jobs answering with a questionnaire are applied to once it is answered
+    assert portal.answered
+    assert portal.answered <= portal.needs_questionnaire
+
+
+def test_serial_questionnaires_keep_the_cap(portal):
+    bot = make_bot(portal, ANSWER_WORKERS=0, APPLY_BATCH_SIZE=1)
+    bot.run()
+    assert bot.count == 20
+    assert all(len(batch) == 1 for batch in portal.batches)
+
+
+def test_ledger_skips_jobs_on_the_second_run(portal):
+    make_bot(portal).run()
+    first = {job_id for batch in portal.batches for job_id in batch}
+    portal.batches.clear()
+
+    make_bot(portal).run()
+    second = {job_id for batch in portal.batches for job_id in batch}
+
+    assert len(portal.applied) == 40
+    assert not first & second
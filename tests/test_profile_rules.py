@@ -0,0 +1,34 @@
+import pytest
+
+from src.meta.profile_rules import ProfileRuleEngine
+
+
+@pytest.fixture
+def engine():
+    return ProfileRuleEngine({"current_ctc": "12 LPA", "expected_ctc": "18 LPA"}, facts={})
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("What CTC are you expecting?", "18 LPA"),
+    ("Expected annual CTC (in lakhs)", "18"),
+    ("What are your salary expectations?", "18 LPA"),
+    ("What is your current CTC?", "12 LPA"),
+    ("Current salary (in lakhs)", "12"),
+    ("Your present package", "12 LPA"),
+])
+def test_ctc_questions_get_the_matching_ctc(engine, question, answer):
+    assert engine.answer(question) == answer
+
+
+@pytest.mark.parametrize("question", [
+    "What was your CTC hike in the last appraisal?",
+    "Expected hike on current CTC?",
+    "What is your CTC?",
+])
+def test_unclear_ctc_questions_go_to_the_llm(engine, question):
+    assert engine.answer(question) is None
+
+
+def test_expected_ctc_never_falls_back_to_current():
+    engine = ProfileRuleEngine({"current_ctc": "12 LPA"}, facts={})
+    assert engine.answer("What CTC are you expecting?") is None
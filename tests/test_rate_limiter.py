@@ -0,0 +1,46 @@
+import time
+
+from src.meta.rate_limiter import RateLimiter, parse_retry_after
+
+
+def test_burst_then_waits_for_tokens():
+    limiter = RateLimiter(600, burst=2)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert 0.05 < limiter.reserve() <= 0.1
+
+
+def test_simultaneous_throttles_cut_the_rate_once():
+    limiter = RateLimiter(60)
+    for _ in range(5):
+        limiter.on_throttle()
+    assert limiter.rate == 0.5
+    assert limiter.throttled == 5
+
+
+def test_throttle_after_the_window_cuts_again():
+    limiter = RateLimiter(6000)
+    limiter.on_throttle(retry_after=0.05)
+    time.sleep(0.06)
+    limiter.on_throttle()
+    assert limiter.rate == 100 / 4
+
+
+def test_retry_after_pauses_callers():
+    limiter = RateLimiter(6000)
+    limiter.on_throttle(retry_after=0.2)
+    assert limiter.reserve() >= 0.15
+
+
+def test_success_recovers_rate_up_to_the_quota():
+    limiter = RateLimiter(60)
+    limiter.on_throttle()
+    for _ in range(30):
+        limiter.on_success()
+    assert limiter.rate == limiter.max_rate
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
@@ -0,0 +1,53 @@
+from datetime import date
+
+from src.meta.resume_facts import build_fact_sheet
+
+RESUME = """Jane Doe
+Experience
+Acme Technologies | Jan 2015 - Dec 2022
+- Built billing APIs
+- Maintained Django services
+Beta Labs | Jan 2023 - Present
+- Wrote Go services
+Education
+B.Tech, Computer Science
+"""
+
+
+def test_last_bullet_stays_with_its_job():
+    facts = build_fact_sheet(RESUME, today=date(2026, 10, 1))
+    assert facts["skill_years"]["django"] == 8.0
+    assert facts["total_years"] == 11.8
+    assert facts["employers"] == ["Acme Technologies", "Beta Labs"]
+
+
+def test_company_above_date_line_starts_the_entry():
+    text = RESUME.replace("Acme Technologies | Jan 2015", "Acme Technologies\nJan 2015")
+    text = text.replace("Beta Labs | Jan 2023", "Beta Labs\nJan 2023")
+    facts = build_fact_sheet(text, today=date(2026, 10, 1))
+    assert facts["skill_years"]["django"] == 8.0
+    assert facts["employers"] == ["Acme Technologies", "Beta Labs"]
+
+
+def test_cached_fact_sheet_is_rebuilt_in_a_new_month(tmp_path, monkeypatch):
+    from src.meta import get_resume_text
+
+    extracted = []
+
+    def extract(path):
+        extracted.append(path)
+        return RESUME
+
+    monkeypatch.setattr(get_resume_text, "extract_text_from_pdf", extract)
+    pdf, cache = tmp_path / "resume.pdf", str(tmp_path / "resume_cache.json")
+    pdf.write_bytes(b"%PDF-1.4 resume")
+
+    first = get_resume_text.load_resume(str(pdf), cache, today=date(2026, 4, 15))
+    same_month = get_resume_text.load_resume(str(pdf), cache, today=date(2026, 4, 30))
+    later = get_resume_text.load_resume(str(pdf), cache, today=date(2026, 10, 1))
+
+    assert same_month == first
+    assert first["facts"]["total_years"] == 11.3
+    assert later["facts"]["as_of"] == "2026-10"
+    assert later["facts"]["total_years"] == 11.8
+    assert len(extracted) == 1
@@ -0,0 +1,46 @@
+import os
+import stat
+
+from cryptography.fernet import Fernet
+
+from src.meta.session_vault import SessionVault
+
+
+def make_vault(tmp_path, **options):
+    options.setdefault("key_file", str(tmp_path / "vault.key"))
+    return SessionVault(str(tmp_path / "vault.bin"), **options)
+
+
+def test_session_roundtrip_is_encrypted(tmp_path):
+    make_vault(tmp_path).save("naukri", "me@example.com", {"token": "secret-token"})
+
+    assert make_vault(tmp_path).load("naukri", "me@example.com") == {"token": "secret-token"}
+    assert make_vault(tmp_path).load("naukri", "other@example.com") is None
+    with open(tmp_path / "vault.bin", "rb") as file:
+        assert b"secret-token" not in file.read()
+
+
+def test_generated_key_is_owner_only(tmp_path, monkeypatch):
+    monkeypatch.delenv("SESSION_VAULT_KEY", raising=False)
+    make_vault(tmp_path).save("naukri", "me", {})
+    mode = stat.S_IMODE(os.stat(tmp_path / "vault.key").st_mode)
+    assert mode == 0o600
+
+
+def test_expired_session_is_ignored(tmp_path):
+    make_vault(tmp_path).save("naukri", "me", {"token": "t"})
+    assert make_vault(tmp_path, max_age=0).load("naukri", "me") is None
+
+
+def test_forget_drops_only_that_account(tmp_path):
+    vault = make_vault(tmp_path)
+    vault.save("naukri", "me", {"token": "a"})
+    vault.save("instahyre", "me", {"token": "b"})
+    vault.forget("naukri", "me")
+    assert vault.load("naukri", "me") is None
+    assert vault.load("instahyre", "me") == {"token": "b"}
+
+
+def test_wrong_key_starts_empty(tmp_path):
+    make_vault(tmp_path, key=Fernet.generate_key()).save("naukri", "me", {"token": "t"})
+    assert make_vault(tmp_path, key=Fernet.generate_key()).load("naukri", "me") is None
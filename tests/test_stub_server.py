@@ -0,0 +1,24 @@
+import requests
+
+from src.Instahyre.instahyre_stub import InstahyreStubServer
+from src.meta.llm_standin import StandInLLMServer
+from src.Naukri.naukri_stub import NaukriStubServer
+
+
+def test_stub_servers_share_the_lifecycle():
+    with NaukriStubServer(jobs=3) as naukri, StandInLLMServer() as llm:
+        login = requests.post(naukri.url + "/central-login-services/v1/login",
+                              json={"username": "a", "password": "b"}, timeout=5)
+        answer = requests.post(llm.url, json={"contents": [{"parts": [{"text": "hi"}]}]},
+                               timeout=5)
+    assert login.status_code == 200 and naukri.requests["login"] == 1
+    assert answer.json()["candidates"][0]["content"]["parts"][0]["text"] == "Yes"
+    assert llm.requests == 1
+
+
+def test_instahyre_stub_sets_the_session_cookie():
+    with InstahyreStubServer(jobs=3) as instahyre:
+        session = requests.Session()
+        session.post(instahyre.url + "/user_login", json={"email": "a", "password": "b"}, timeout=5)
+        page = session.get(instahyre.url + "/candidate_opportunity", timeout=5)
+    assert page.json()["meta"]["total_count"] == 3